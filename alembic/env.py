@@ -8,6 +8,7 @@ from alembic import context
 
 from db_models.base import Base
 from db_models import Answer, Category, Topic, Question, User
+from db_models.changes import bank_version_sequence  # noqa
 from app.core.config import settings
 
 
@@ -27,6 +28,20 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+#: PostgreSQL-only indexes created by hand-written migrations
+#: (5b1d7e2a9c41_question_search). They use expressions and operator
+#: classes the models do not declare, so autogenerate must not drop them.
+MIGRATION_ONLY_INDEXES = frozenset({
+    'ix_questions_text_search',
+    'ix_answers_text_search',
+    'ix_questions_text_trgm',
+})
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave the indexes managed only by migrations out of autogenerate."""
+    return not (type_ == 'index' and name in MIGRATION_ONLY_INDEXES)
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -51,6 +66,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -58,7 +74,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,31 @@
+"""bank version sequence
+
+Revision ID: 3a7c9e1f5b20
+Revises: 8e4f2c6b7d13
+Create Date: 2026-10-17 14:05:12.204817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7c9e1f5b20'
+down_revision: Union[str, None] = '8e4f2c6b7d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The change bus only uses the sequence (and NOTIFY) on PostgreSQL.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(sa.schema.CreateSequence(sa.Sequence('bank_version')))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(sa.schema.DropSequence(sa.Sequence('bank_version')))
@@ -0,0 +1,65 @@
+"""question search
+
+Revision ID: 5b1d7e2a9c41
+Revises: cc0c38945180
+Create Date: 2026-10-17 10:12:41.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1d7e2a9c41'
+down_revision: Union[str, None] = 'cc0c38945180'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Full-text search is PostgreSQL-only; other backends fall back to LIKE.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # unaccent() is only STABLE, so it cannot be used in an index
+    # expression directly; pin the dictionary and mark the wrapper IMMUTABLE.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION immutable_unaccent(text)
+        RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """
+    )
+    op.create_index(
+        'ix_questions_text_search',
+        'questions',
+        [sa.text("to_tsvector('simple'::regconfig, immutable_unaccent(text))")],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_answers_text_search',
+        'answers',
+        [sa.text("to_tsvector('simple'::regconfig, immutable_unaccent(text))")],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_questions_text_trgm',
+        'questions',
+        [sa.text('immutable_unaccent(lower(text)) gin_trgm_ops')],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_questions_text_trgm', table_name='questions')
+    op.drop_index('ix_answers_text_search', table_name='answers')
+    op.drop_index('ix_questions_text_search', table_name='questions')
+    op.execute('DROP FUNCTION IF EXISTS immutable_unaccent(text)')
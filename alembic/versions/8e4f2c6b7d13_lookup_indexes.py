@@ -0,0 +1,42 @@
+"""lookup indexes
+
+Revision ID: 8e4f2c6b7d13
+Revises: 5b1d7e2a9c41
+Create Date: 2026-10-17 11:40:03.772915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4f2c6b7d13'
+down_revision: Union[str, None] = '5b1d7e2a9c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The composite indexes also serve lookups by their leading column
+    # (questions.topic_id, answers.question_id).
+    op.create_index(
+        'ix_questions_topic_id_text', 'questions', ['topic_id', 'text'])
+    op.create_index('ix_questions_text', 'questions', ['text'])
+    op.create_index(
+        'ix_answers_question_id_text', 'answers', ['question_id', 'text'])
+    op.create_index(
+        'ix_answers_correct_question_id',
+        'answers',
+        ['question_id'],
+        postgresql_where=sa.text('is_correct'),
+        sqlite_where=sa.text('is_correct'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_answers_correct_question_id', table_name='answers')
+    op.drop_index('ix_answers_question_id_text', table_name='answers')
+    op.drop_index('ix_questions_text', table_name='questions')
+    op.drop_index('ix_questions_topic_id_text', table_name='questions')
@@ -3,4 +3,4 @@ This package configures and sets up an administrative interface
 for the application using the sqladmin library.
 """
 
-from .admin import create_admin  # noqa
+from .lazy import mount_admin  # noqa
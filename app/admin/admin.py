@@ -2,9 +2,13 @@
 This module initializes and configures the admin interface,
 adding model views for various resources (Category, Topic,
 Question, and Answer).
+
+It imports sqladmin and all model views, so the application only imports
+it when the admin interface is built (see ``app.admin.lazy``).
 """
 
 from sqladmin import Admin
+from starlette.applications import Starlette
 
 from app.core.config import settings
 from app.core.db_config import engine
@@ -13,25 +17,41 @@ from app.admin.answer import AnswerAdmin
 from app.admin.category import CategoryAdmin
 from app.admin.topic import TopicAdmin
 from app.admin.question import QuestionAdmin
+from app.admin.lazy import ADMIN_BASE_URL
 
 
 auth_backend = BasicAuthBackend(secret_key=settings.secret)
 
 
-def create_admin(app):
+def create_admin(app) -> Admin:
     """
     Attach the Admin interface to a FastAPI application.
 
     Args:
         app: The FastAPI application instance.
+
+    Returns:
+        Admin: The configured admin interface.
     """
     admin = Admin(
         app=app,
         engine=engine,
         authentication_backend=auth_backend,
-        base_url='/admin',
+        base_url=ADMIN_BASE_URL,
     )
     admin.add_view(CategoryAdmin)
     admin.add_view(TopicAdmin)
     admin.add_view(QuestionAdmin)
     admin.add_view(AnswerAdmin)
+    return admin
+
+
+def build_admin_app() -> Starlette:
+    """
+    Build the admin interface as a standalone ASGI application, to be
+    mounted at ADMIN_BASE_URL by the caller.
+
+    Returns:
+        Starlette: The admin application.
+    """
+    return create_admin(Starlette()).admin
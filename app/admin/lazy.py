@@ -0,0 +1,52 @@
+"""
+This module mounts the admin interface on the application, either eagerly
+or lazily. In lazy mode sqladmin and the model views are only imported and
+built on the first request to ``/admin``, which keeps them out of the
+application's startup time and memory until the panel is actually used.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+ADMIN_BASE_URL = '/admin'
+
+
+class LazyAdmin:
+    """
+    ASGI application that builds the admin interface on its first request
+    and forwards all requests to it.
+    """
+
+    def __init__(self):
+        self._app: ASGIApp | None = None
+
+    @property
+    def routes(self) -> list:
+        """
+        The routes of the admin interface (empty until it is built), used
+        by ``url_for`` to resolve ``admin:*`` route names.
+        """
+        return self._app.routes if self._app is not None else []
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if self._app is None:
+            from app.admin.admin import build_admin_app
+            self._app = build_admin_app()
+        await self._app(scope, receive, send)
+
+
+def mount_admin(app, lazy: bool = False) -> None:
+    """
+    Mount the admin interface on a FastAPI application.
+
+    Args:
+        app: The FastAPI application instance.
+        lazy (bool): Build the admin interface on its first request
+            instead of now.
+    """
+    if lazy:
+        app.mount(ADMIN_BASE_URL, LazyAdmin(), name='admin')
+        return
+
+    from app.admin.admin import create_admin
+    create_admin(app)
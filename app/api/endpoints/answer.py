@@ -2,15 +2,19 @@
 This module defines the CRUD API endpoints for managing Answer resources.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db_config import get_async_session
 from app.core.user import current_superuser
+from app.crud.base import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.crud.answer import answer_crud
-from app.crud.question import question_crud
-from app.api.endpoints.validators import get_object_or_404
-from app.schemas.answer import AnswerCreate, AnswerResponse, AnswerUpdate
+from app.api.endpoints.ndjson import stream_ndjson, wants_ndjson
+from app.api.endpoints.validators import (
+    foreign_key_or_404, get_object_or_404, update_or_404)
+from app.schemas.answer import (
+    AnswerBulkUpdate, AnswerCreate, AnswerResponse, AnswerUpdate)
+from app.schemas.bulk import BulkIds, BulkResult
 from app.api.endpoints.constants import ERROR_ANSWER_NOT_FOUND, ERROR_QUESTION_NOT_FOUND
 
 
@@ -29,7 +33,7 @@ async def create_question(
     """
     Create a new Answer.
 
-    Checks if the specified Question exists before creation.
+    The Question's existence is checked by its foreign key on insert.
 
     Args:
         answer (AnswerCreate): The answer data to create.
@@ -37,15 +41,70 @@ async def create_question(
 
     Returns:
         AnswerResponse: The newly created answer.
+
+    Raises:
+        HTTPException(404): If the question does not exist.
     """
-    await get_object_or_404(
-        answer.question_id,
-        question_crud,
-        session,
-        ERROR_QUESTION_NOT_FOUND
+    async with foreign_key_or_404(session, ERROR_QUESTION_NOT_FOUND):
+        return await answer_crud.create(answer, session)
+
+
+@router.patch(
+    '/bulk',
+    response_model=BulkResult,
+    dependencies=[Depends(current_superuser)]
+)
+async def bulk_update_answers(
+        obj_in: AnswerBulkUpdate,
+        session: AsyncSession = Depends(get_async_session)
+) -> BulkResult:
+    """
+    Apply the same change (e.g. flagging as correct) to many Answers
+    with a single UPDATE statement.
+
+    Args:
+        obj_in (AnswerBulkUpdate): The answer IDs and the fields to set.
+        session (AsyncSession): The async DB session.
+
+    Returns:
+        BulkResult: The updated IDs and the requested IDs that do not exist.
+
+    Raises:
+        HTTPException(404): If the new question does not exist.
+    """
+    async with foreign_key_or_404(session, ERROR_QUESTION_NOT_FOUND):
+        updated_ids = await answer_crud.bulk_update(
+            obj_in.ids, obj_in, session)
+    return BulkResult(
+        ids=updated_ids,
+        missing_ids=sorted(set(obj_in.ids).difference(updated_ids))
     )
 
-    return await answer_crud.create(answer, session)
+
+@router.delete(
+    '/bulk',
+    response_model=BulkResult,
+    dependencies=[Depends(current_superuser)]
+)
+async def bulk_delete_answers(
+        obj_in: BulkIds,
+        session: AsyncSession = Depends(get_async_session)
+) -> BulkResult:
+    """
+    Delete many Answers with a single DELETE statement.
+
+    Args:
+        obj_in (BulkIds): The IDs of the answers to delete.
+        session (AsyncSession): The async DB session.
+
+    Returns:
+        BulkResult: The deleted IDs and the requested IDs that do not exist.
+    """
+    deleted_ids = await answer_crud.bulk_remove(obj_in.ids, session)
+    return BulkResult(
+        ids=deleted_ids,
+        missing_ids=sorted(set(obj_in.ids).difference(deleted_ids))
+    )
 
 
 @router.get(
@@ -53,18 +112,30 @@ async def create_question(
     response_model=list[AnswerResponse]
 )
 async def get_all_answers(
+        request: Request,
+        after_id: int | None = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
         session: AsyncSession = Depends(get_async_session)
 ) -> list[AnswerResponse]:
     """
-    Retrieve all answers from the database.
+    Retrieve one page of answers ordered by ID.
+
+    Pass the ID of the last item of a page as ``after_id``
+    to get the next page. With ``Accept: application/x-ndjson`` all
+    answers (after ``after_id``) are streamed as NDJSON instead.
 
     Args:
+        request (Request): The incoming request.
+        after_id (int | None): Return only answers with a greater ID.
+        limit (int): The page size.
         session (AsyncSession): The async DB session.
 
     Returns:
-        list[AnswerResponse]: A list of all answers.
+        list[AnswerResponse]: A page of answers.
     """
-    return await answer_crud.get_multi(session)
+    if wants_ndjson(request):
+        return stream_ndjson(answer_crud, AnswerResponse, after_id)
+    return await answer_crud.get_multi(session, after_id, limit)
 
 
 @router.get(
@@ -109,7 +180,7 @@ async def partially_update_answer(
     """
     Partially update an existing Answer.
 
-    Validates question existence if question_id is changed.
+    A changed question_id is checked by its foreign key on update.
 
     Args:
         answer_id (int): The ID of the answer to update.
@@ -118,6 +189,9 @@ async def partially_update_answer(
 
     Returns:
         AnswerResponse: The updated answer.
+
+    Raises:
+        HTTPException(404): If the answer or the new question does not exist.
     """
     answer = await get_object_or_404(
         answer_id,
@@ -125,14 +199,9 @@ async def partially_update_answer(
         session,
         ERROR_ANSWER_NOT_FOUND
     )
-    if obj_in.question_id and obj_in.question_id != answer.question_id:
-        await get_object_or_404(
-            obj_in.question_id,
-            question_crud,
-            session,
-            ERROR_QUESTION_NOT_FOUND
-        )
-    return await answer_crud.update(answer, obj_in, session)
+    async with foreign_key_or_404(session, ERROR_QUESTION_NOT_FOUND):
+        return await update_or_404(
+            answer, obj_in, answer_crud, session, ERROR_ANSWER_NOT_FOUND)
 
 
 @router.delete(
@@ -2,14 +2,18 @@
 This module defines the CRUD API endpoints for managing Category resources.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db_config import get_async_session
+from app.core.db_config import get_async_read_session, get_async_session
+from app.core.response_cache import response_cache
 from app.core.user import current_superuser
+from app.crud.base import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.crud.category import category_crud
+from app.api.endpoints.ndjson import stream_ndjson, wants_ndjson
 from app.api.endpoints.validators import (
-    validate_name_duplicate, get_object_or_404)
+    foreign_key_or_409, validate_name_duplicate, get_object_or_404,
+    update_or_404)
 from app.schemas.category import (
     CategoryCreate, CategoryUpdate, CategoryResponse)
 from app.api.endpoints.constants import ERROR_CATEGORY_NOT_FOUND
@@ -49,18 +53,33 @@ async def create_category(
     response_model=list[CategoryResponse]
 )
 async def get_all_category(
-        session: AsyncSession = Depends(get_async_session)
+        request: Request,
+        after_id: int | None = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        session: AsyncSession = Depends(get_async_read_session)
 ) -> list[CategoryResponse]:
     """
-    Retrieve all categories from the database.
+    Retrieve one page of categories ordered by ID.
+
+    Pass the ID of the last item of a page as ``after_id``
+    to get the next page. With ``Accept: application/x-ndjson`` all
+    categories (after ``after_id``) are streamed as NDJSON instead. Pages
+    are served from the response cache.
 
     Args:
+        request (Request): The incoming request.
+        after_id (int | None): Return only categories with a greater ID.
+        limit (int): The page size.
         session (AsyncSession): The async DB session.
 
     Returns:
-        list[CategoryResponse]: A list of all categories.
+        list[CategoryResponse]: A page of categories.
     """
-    return await category_crud.get_multi(session)
+    if wants_ndjson(request):
+        return stream_ndjson(category_crud, CategoryResponse, after_id)
+    return await response_cache.get_or_set(
+        'categories', (after_id, limit), list[CategoryResponse],
+        lambda: category_crud.get_multi(session, after_id, limit))
 
 
 @router.patch(
@@ -92,7 +111,8 @@ async def partially_update_category(
     )
     await validate_name_duplicate(
         obj_in.name, session, category_crud.get_category_id_by_name)
-    return await category_crud.update(category, obj_in, session)
+    return await update_or_404(
+        category, obj_in, category_crud, session, ERROR_CATEGORY_NOT_FOUND)
 
 
 @router.delete(
@@ -116,6 +136,7 @@ async def delete_category(
 
     Raises:
         HTTPException(404): If the category with the given ID does not exist.
+        HTTPException(409): If the category is still referenced.
     """
     category = await get_object_or_404(
         category_id,
@@ -123,5 +144,6 @@ async def delete_category(
         session,
         ERROR_CATEGORY_NOT_FOUND
     )
-    await category_crud.remove(category, session)
+    async with foreign_key_or_409(session):
+        await category_crud.remove(category, session)
     return category
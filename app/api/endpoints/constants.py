@@ -1,5 +1,6 @@
 """
-This module defines constant error messages for the API.
+This module defines constants for the API: error messages, limits
+and header names.
 """
 
 ERROR_ANSWER_NOT_FOUND = 'There is no answer with the specified ID.'
@@ -8,3 +9,17 @@ ERROR_QUESTION_NOT_FOUND = 'There is no question with the specified ID.'
 ERROR_CATEGORY_NOT_FOUND = 'There is no category with the specified ID.'
 ERROR_OBJECT_NOT_FOUND = "Object doesn't exist."
 ERROR_NAME_ALREADY_EXIST = 'This name already exist.'
+ERROR_OBJECT_STILL_REFERENCED = (
+    'The object is still referenced by other objects.')
+ERROR_TOO_MANY_IDS = 'Too many IDs requested at once.'
+
+RANDOM_QUESTIONS_MAX_COUNT = 100
+BULK_MAX_COUNT = 500
+BATCH_MAX_COUNT = 200
+# IDs of at most 9 digits fit the INTEGER primary keys.
+BATCH_IDS_PATTERN = r'^\d{1,9}(,\d{1,9})*$'
+BATCH_IDS_MAX_LENGTH = BATCH_MAX_COUNT * 10 - 1
+SEARCH_MAX_COUNT = 50
+SEARCH_MIN_QUERY_LENGTH = 2
+SEARCH_MAX_QUERY_LENGTH = 200
+QUESTION_BANK_VERSION_HEADER = 'X-Question-Bank-Version'
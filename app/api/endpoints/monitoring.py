@@ -0,0 +1,38 @@
+"""
+This module defines API endpoints for monitoring the application's
+runtime state.
+"""
+
+from fastapi import APIRouter, Depends
+
+from app.core.db_config import engine, read_engine
+from app.core.db_pool import get_pool_status
+from app.core.user import current_superuser
+from app.schemas.monitoring import DatabasePoolsStatus, PoolStatus
+
+
+router = APIRouter()
+
+
+@router.get(
+    '/db-pool',
+    response_model=DatabasePoolsStatus,
+    dependencies=[Depends(current_superuser)]
+)
+async def get_db_pool_status() -> DatabasePoolsStatus:
+    """
+    Report checked-out, idle and overflow connections of the database pools
+    (primary and, if configured, read replica), along with connection wait
+    statistics of each.
+
+    Returns:
+        DatabasePoolsStatus: The current state of the pools.
+    """
+    return DatabasePoolsStatus(
+        primary=PoolStatus(**get_pool_status(engine.pool)),
+        replica=(
+            PoolStatus(**get_pool_status(read_engine.pool))
+            if read_engine is not engine
+            else None
+        ),
+    )
@@ -0,0 +1,72 @@
+"""
+This module contains helpers for streaming resources as newline-delimited
+JSON (NDJSON), used by the export endpoint and by list endpoints when the
+client sends ``Accept: application/x-ndjson``.
+"""
+
+from typing import AsyncIterator
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.core.db_config import ReadSessionLocal
+from app.crud.base import CRUDBase
+
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+
+def wants_ndjson(request: Request) -> bool:
+    """
+    Check whether the client asked for an NDJSON response.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        bool: True if the Accept header contains the NDJSON media type.
+    """
+    return NDJSON_MEDIA_TYPE in request.headers.get('accept', '')
+
+
+async def _encode_lines(
+        crud: CRUDBase,
+        schema: type[BaseModel],
+        after_id: int | None,
+        options: tuple,
+) -> AsyncIterator[bytes]:
+    """
+    Stream objects from the database and encode each one as a JSON line.
+
+    The generator owns its (read-only) session, because the request-scoped
+    session is closed before the response body is sent.
+    """
+    async with ReadSessionLocal() as session:
+        async for db_obj in crud.stream(session, after_id, options):
+            line = schema.model_validate(db_obj).model_dump_json()
+            yield line.encode() + b'\n'
+
+
+def stream_ndjson(
+        crud: CRUDBase,
+        schema: type[BaseModel],
+        after_id: int | None = None,
+        options: tuple = (),
+) -> StreamingResponse:
+    """
+    Build a response that streams every object of a CRUD model as NDJSON.
+
+    Args:
+        crud (CRUDBase): The CRUD instance of the streamed model.
+        schema (type[BaseModel]): The response schema of a single line.
+        after_id (int | None): Start after the object with this ID.
+        options (tuple): Loader options applied to the query.
+
+    Returns:
+        StreamingResponse: An incrementally written NDJSON response.
+    """
+    return StreamingResponse(
+        _encode_lines(crud, schema, after_id, options),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
@@ -2,19 +2,38 @@
 This module defines the CRUD API endpoints for managing Question resources.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import (
+    APIRouter, Body, Depends, HTTPException, Query, Request, Response, status)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db_config import get_async_session
+from app.core.db_config import get_async_read_session, get_async_session
+from app.core.question_bank import question_bank
+from app.core.response_cache import response_cache
 from app.core.user import current_superuser
-from app.crud.question import question_crud
+from app.crud.base import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.crud.question import (
+    QUESTION_DETAIL_OPTIONS, QUESTION_JOINED_OPTIONS, question_crud)
 from app.crud.topic import topic_crud
-from app.api.endpoints.validators import get_object_or_404
+from app.services.duplicates import (
+    DEFAULT_THRESHOLD, find_duplicate_questions)
+from app.api.endpoints.ndjson import (
+    NDJSON_MEDIA_TYPE, stream_ndjson, wants_ndjson)
+from app.api.endpoints.validators import (
+    foreign_key_or_404, foreign_key_or_409, get_object_or_404,
+    update_or_404, validate_ids_exist)
+from app.schemas.bulk import BulkIds, BulkResult
 from app.schemas.question import (
-    QuestionCreate, QuestionResponse, QuestionUpdate,
+    QuestionBankStatus, QuestionBatch, QuestionBulkUpdate, QuestionCreate,
+    QuestionCreateWithAnswers, QuestionDuplicatePair,
+    QuestionResponse, QuestionResponseWithAnswers, QuestionUpdate,
     QuestionResponseWithTopicAndAnswers)
+from db_models.changes import QUESTION_BANK_TABLES, change_bus
 from app.api.endpoints.constants import (
-    ERROR_QUESTION_NOT_FOUND, ERROR_TOPIC_NOT_FOUND)
+    BATCH_IDS_MAX_LENGTH, BATCH_IDS_PATTERN, BATCH_MAX_COUNT, BULK_MAX_COUNT,
+    ERROR_QUESTION_NOT_FOUND, ERROR_TOO_MANY_IDS, ERROR_TOPIC_NOT_FOUND,
+    QUESTION_BANK_VERSION_HEADER, RANDOM_QUESTIONS_MAX_COUNT,
+    SEARCH_MAX_COUNT, SEARCH_MAX_QUERY_LENGTH, SEARCH_MIN_QUERY_LENGTH)
 
 
 router = APIRouter()
@@ -32,7 +51,7 @@ async def create_question(
     """
     Create a new Question.
 
-    Validates the existence of a Topic before creation.
+    The Topic's existence is checked by its foreign key on insert.
 
     Args:
         question (QuestionCreate): The question data to create.
@@ -40,15 +59,108 @@ async def create_question(
 
     Returns:
         QuestionResponse: The newly created question.
+
+    Raises:
+        HTTPException(404): If the topic does not exist.
     """
-    await get_object_or_404(
-        question.topic_id,
+    async with foreign_key_or_404(session, ERROR_TOPIC_NOT_FOUND):
+        return await question_crud.create(question, session)
+
+
+@router.post(
+    '/bulk',
+    response_model=list[QuestionResponseWithAnswers],
+    dependencies=[Depends(current_superuser)]
+)
+async def bulk_create_questions(
+        questions: list[QuestionCreateWithAnswers] = Body(
+            ..., min_length=1, max_length=BULK_MAX_COUNT),
+        session: AsyncSession = Depends(get_async_session)
+) -> list[QuestionResponseWithAnswers]:
+    """
+    Create many Questions, each with its nested Answers, in one transaction.
+
+    All referenced Topics are validated with a single query before
+    anything is written.
+
+    Args:
+        questions (list[QuestionCreateWithAnswers]): The questions to create.
+        session (AsyncSession): The async DB session.
+
+    Returns:
+        list[QuestionResponseWithAnswers]: The created questions
+        with their answers, in input order.
+    """
+    await validate_ids_exist(
+        (question.topic_id for question in questions),
         topic_crud,
         session,
         ERROR_TOPIC_NOT_FOUND
     )
+    return await question_crud.bulk_create_with_answers(questions, session)
+
+
+@router.patch(
+    '/bulk',
+    response_model=BulkResult,
+    dependencies=[Depends(current_superuser)]
+)
+async def bulk_update_questions(
+        obj_in: QuestionBulkUpdate,
+        session: AsyncSession = Depends(get_async_session)
+) -> BulkResult:
+    """
+    Apply the same change (e.g. moving to another topic) to many Questions
+    with a single UPDATE statement.
+
+    Args:
+        obj_in (QuestionBulkUpdate): The question IDs and the fields to set.
+        session (AsyncSession): The async DB session.
+
+    Returns:
+        BulkResult: The updated IDs and the requested IDs that do not exist.
+
+    Raises:
+        HTTPException(404): If the new topic does not exist.
+    """
+    async with foreign_key_or_404(session, ERROR_TOPIC_NOT_FOUND):
+        updated_ids = await question_crud.bulk_update(
+            obj_in.ids, obj_in, session)
+    return BulkResult(
+        ids=updated_ids,
+        missing_ids=sorted(set(obj_in.ids).difference(updated_ids))
+    )
+
+
+@router.delete(
+    '/bulk',
+    response_model=BulkResult,
+    dependencies=[Depends(current_superuser)]
+)
+async def bulk_delete_questions(
+        obj_in: BulkIds,
+        session: AsyncSession = Depends(get_async_session)
+) -> BulkResult:
+    """
+    Delete many Questions, with their Answers, using set-based DELETE
+    statements.
+
+    Args:
+        obj_in (BulkIds): The IDs of the questions to delete.
+        session (AsyncSession): The async DB session.
+
+    Returns:
+        BulkResult: The deleted IDs and the requested IDs that do not exist.
 
-    return await question_crud.create(question, session)
+    Raises:
+        HTTPException(409): If a question is still referenced.
+    """
+    async with foreign_key_or_409(session):
+        deleted_ids = await question_crud.bulk_remove(obj_in.ids, session)
+    return BulkResult(
+        ids=deleted_ids,
+        missing_ids=sorted(set(obj_in.ids).difference(deleted_ids))
+    )
 
 
 @router.get(
@@ -56,18 +168,60 @@ async def create_question(
     response_model=list[QuestionResponse]
 )
 async def get_all_questions(
+        request: Request,
+        after_id: int | None = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
         session: AsyncSession = Depends(get_async_session)
 ) -> list[QuestionResponse]:
     """
-    Retrieve all questions from the database.
+    Retrieve one page of questions ordered by ID.
+
+    Pass the ID of the last item of a page as ``after_id``
+    to get the next page. With ``Accept: application/x-ndjson`` all
+    questions (after ``after_id``) are streamed as NDJSON instead.
 
     Args:
+        request (Request): The incoming request.
+        after_id (int | None): Return only questions with a greater ID.
+        limit (int): The page size.
         session (AsyncSession): The async DB session.
 
     Returns:
-        list[QuestionResponse]: A list of questions.
+        list[QuestionResponse]: A page of questions.
     """
-    return await question_crud.get_multi(session)
+    if wants_ndjson(request):
+        return stream_ndjson(question_crud, QuestionResponse, after_id)
+    return await question_crud.get_multi(session, after_id, limit)
+
+
+@router.get(
+    '/export',
+    response_class=StreamingResponse,
+    responses={200: {'content': {NDJSON_MEDIA_TYPE: {}}}}
+)
+async def export_questions(
+        after_id: int | None = None
+) -> StreamingResponse:
+    """
+    Stream the whole question bank as NDJSON.
+
+    Every line is a question with its topic and answers. Rows are read from
+    a server-side cursor and encoded one by one, so memory usage does not
+    depend on the size of the bank.
+
+    Args:
+        after_id (int | None): Start after the question with this ID
+            (to resume an interrupted export).
+
+    Returns:
+        StreamingResponse: The NDJSON stream.
+    """
+    return stream_ndjson(
+        question_crud,
+        QuestionResponseWithTopicAndAnswers,
+        after_id,
+        QUESTION_DETAIL_OPTIONS,
+    )
 
 
 @router.get(
@@ -75,11 +229,14 @@ async def get_all_questions(
     response_model=QuestionResponseWithTopicAndAnswers
 )
 async def get_random_question(
-        session: AsyncSession = Depends(get_async_session)
+        session: AsyncSession = Depends(get_async_read_session)
 ) -> QuestionResponseWithTopicAndAnswers | None:
     """
     Retrieve a single random question from all available questions.
 
+    The question is picked from the in-memory question bank; the database
+    is only queried if the bank has not been loaded yet.
+
     Args:
         session (AsyncSession): The async DB session.
 
@@ -87,19 +244,160 @@ async def get_random_question(
         QuestionResponseWithTopicAndAnswers | None: The random question
         if any exist, otherwise None.
     """
+    if question_bank.is_loaded:
+        return question_bank.get_random_question()
     return await question_crud.get_random_question(session)
 
 
+@router.get(
+    '/random-many',
+    response_model=list[QuestionResponseWithTopicAndAnswers]
+)
+async def get_random_questions(
+        count: int = Query(..., ge=1, le=RANDOM_QUESTIONS_MAX_COUNT),
+        topic_id: int | None = None,
+        exclude: list[int] = Query([]),
+        session: AsyncSession = Depends(get_async_read_session)
+) -> list[QuestionResponseWithTopicAndAnswers]:
+    """
+    Retrieve several distinct random questions in one response.
+
+    Questions are sampled without replacement from the in-memory question
+    bank; excluded IDs are never returned. An unknown topic simply yields
+    an empty list.
+
+    Args:
+        count (int): The maximum number of questions to return.
+        topic_id (int | None): Restrict the sample to this topic.
+        exclude (list[int]): Question IDs to skip
+            (e.g. ``?exclude=1&exclude=2``).
+        session (AsyncSession): The async DB session.
+
+    Returns:
+        list[QuestionResponseWithTopicAndAnswers]: Up to ``count``
+        random questions.
+    """
+    if question_bank.is_loaded:
+        return question_bank.sample_questions(count, topic_id, exclude)
+    return await question_crud.get_random_questions(
+        count, session, topic_id, exclude)
+
+
+@router.post(
+    '/bank/refresh',
+    response_model=QuestionBankStatus,
+    dependencies=[Depends(current_superuser)]
+)
+async def refresh_question_bank(
+        session: AsyncSession = Depends(get_async_session)
+) -> QuestionBankStatus:
+    """
+    Reload the in-memory question bank from the database.
+
+    Changes made outside the application (e.g. with raw SQL) are not
+    announced on the change bus, so the whole bank is first announced as
+    changed: this takes a new bank version and makes every worker drop its
+    cached data. The bank is then loaded at that version here, so the
+    reload the announcement schedules in this worker finds it up to date.
+
+    Args:
+        session (AsyncSession): The async DB session.
+
+    Returns:
+        QuestionBankStatus: The version and size of the new snapshot.
+    """
+    version = await change_bus.publish(dict.fromkeys(QUESTION_BANK_TABLES))
+    # Without shared versions, a snapshot file written by another process
+    # may carry a higher version without including the refreshed data.
+    snapshot = await question_bank.load(
+        session,
+        if_older_than=(
+            version if change_bus.shares_versions(session) else None)
+    )
+    return QuestionBankStatus(
+        version=snapshot.version,
+        questions=len(snapshot.question_ids),
+        topics=len(snapshot.topic_question_ids),
+    )
+
+
+@router.get(
+    '/search',
+    response_model=list[QuestionResponseWithTopicAndAnswers]
+)
+async def search_questions(
+        q: str = Query(
+            ...,
+            min_length=SEARCH_MIN_QUERY_LENGTH,
+            max_length=SEARCH_MAX_QUERY_LENGTH
+        ),
+        limit: int = Query(20, ge=1, le=SEARCH_MAX_COUNT),
+        session: AsyncSession = Depends(get_async_read_session)
+) -> list[QuestionResponseWithTopicAndAnswers]:
+    """
+    Search questions by the text of the question or of its answers.
+
+    Diacritics are ignored and typos are tolerated on PostgreSQL.
+
+    Args:
+        q (str): The search query.
+        limit (int): The maximum number of questions to return.
+        session (AsyncSession): The async DB session.
+
+    Returns:
+        list[QuestionResponseWithTopicAndAnswers]: Matching questions,
+        best matches first.
+    """
+    return await question_crud.search(q, session, limit)
+
+
+@router.get(
+    '/duplicates',
+    response_model=list[QuestionDuplicatePair],
+    dependencies=[Depends(current_superuser)]
+)
+async def get_duplicate_questions(
+        threshold: float = Query(DEFAULT_THRESHOLD, gt=0, le=1),
+        session: AsyncSession = Depends(get_async_session)
+) -> list[QuestionDuplicatePair]:
+    """
+    Report near-duplicate questions across all topics.
+
+    Args:
+        threshold (float): The minimum similarity of a reported pair.
+        session (AsyncSession): The async DB session.
+
+    Returns:
+        list[QuestionDuplicatePair]: Near-duplicate pairs,
+        most similar first.
+    """
+    pairs = await find_duplicate_questions(session, threshold)
+    questions = await question_crud.get_by_ids(
+        {pair.first_id for pair in pairs}
+        | {pair.second_id for pair in pairs},
+        session
+    )
+    return [
+        QuestionDuplicatePair(
+            first=questions[pair.first_id],
+            second=questions[pair.second_id],
+            similarity=pair.similarity,
+        )
+        for pair in pairs
+    ]
+
+
 @router.get(
     '/by-topic/{topic_id}',
     response_model=list[QuestionResponseWithTopicAndAnswers]
 )
 async def get_questions_by_topic(
         topic_id: int,
-        session: AsyncSession = Depends(get_async_session)
+        session: AsyncSession = Depends(get_async_read_session)
 ) -> list[QuestionResponseWithTopicAndAnswers]:
     """
-    Retrieve all questions belonging to a specific topic.
+    Retrieve all questions belonging to a specific topic, served from
+    the response cache.
 
     Args:
         topic_id (int): The ID of the topic.
@@ -109,33 +407,106 @@ async def get_questions_by_topic(
         list[QuestionResponseWithTopicAndAnswers]: A list of questions
         for the given topic.
     """
-    await get_object_or_404(
-        topic_id,
-        topic_crud,
-        session,
-        ERROR_TOPIC_NOT_FOUND
-    )
-    return await question_crud.get_all_questions_by_topic(topic_id, session)
+    async def load():
+        await get_object_or_404(
+            topic_id,
+            topic_crud,
+            session,
+            ERROR_TOPIC_NOT_FOUND
+        )
+        return await question_crud.get_all_questions_by_topic(
+            topic_id, session)
+
+    return await response_cache.get_or_set(
+        'questions-by-topic', (topic_id,),
+        list[QuestionResponseWithTopicAndAnswers], load)
 
 
 @router.get(
     '/random-ticket',
     response_model=list[QuestionResponseWithTopicAndAnswers]
 )
-async def get_random_question(
-        session: AsyncSession = Depends(get_async_session)
+async def get_random_ticket(
+        response: Response,
+        seed: int | None = None,
+        session: AsyncSession = Depends(get_async_read_session)
 ) -> list[QuestionResponseWithTopicAndAnswers]:
     """
     Retrieve a 'ticket' containing one random question for each topic.
 
+    With a seed, the same ticket (including the answer order) is returned
+    for the same seed and question bank version, which is reported in the
+    X-Question-Bank-Version header.
+
     Args:
+        response (Response): The outgoing response.
+        seed (int | None): An optional seed for a reproducible ticket.
         session (AsyncSession): The async DB session.
 
     Returns:
         list[QuestionResponseWithTopicAndAnswers]: A list of random questions
         (one per topic).
     """
-    return await question_crud.get_random_ticket(session)
+    if seed is None:
+        return await question_crud.get_random_ticket(session)
+
+    if not question_bank.is_loaded:
+        await question_bank.attach(session)
+    response.headers[QUESTION_BANK_VERSION_HEADER] = str(question_bank.version)
+    return question_bank.get_seeded_ticket(seed)
+
+
+@router.get(
+    '/batch',
+    response_model=QuestionBatch
+)
+async def get_questions_batch(
+        ids: str = Query(
+            ...,
+            pattern=BATCH_IDS_PATTERN,
+            max_length=BATCH_IDS_MAX_LENGTH,
+            description='Comma-separated question IDs, e.g. "1,2,3".'
+        ),
+        session: AsyncSession = Depends(get_async_read_session)
+) -> QuestionBatch:
+    """
+    Retrieve many questions, including their topic and answers,
+    with a single query.
+
+    Args:
+        ids (str): Comma-separated question IDs (at most BATCH_MAX_COUNT,
+            each of at most 9 digits).
+        session (AsyncSession): The async DB session.
+
+    Returns:
+        QuestionBatch: The found questions in the requested order
+        (repeated IDs are returned once) and the IDs that do not exist.
+
+    Raises:
+        HTTPException(422): If too many IDs are requested or an ID is
+            out of range.
+    """
+    question_ids = list(dict.fromkeys(map(int, ids.split(','))))
+    if len(question_ids) > BATCH_MAX_COUNT:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=ERROR_TOO_MANY_IDS
+        )
+
+    questions = await question_crud.get_by_ids(
+        question_ids, session, QUESTION_JOINED_OPTIONS)
+    return QuestionBatch(
+        questions=[
+            questions[question_id]
+            for question_id in question_ids
+            if question_id in questions
+        ],
+        missing_ids=[
+            question_id
+            for question_id in question_ids
+            if question_id not in questions
+        ]
+    )
 
 
 @router.get(
@@ -160,15 +531,14 @@ async def get_question_by_id(
     Raises:
         HTTPException(404): If the question does not exist.
     """
-    await get_object_or_404(
+    return await get_object_or_404(
         question_id,
         question_crud,
         session,
-        ERROR_QUESTION_NOT_FOUND
+        ERROR_QUESTION_NOT_FOUND,
+        QUESTION_JOINED_OPTIONS
     )
 
-    return await question_crud.get_question_with_answers(question_id, session)
-
 
 @router.patch(
     '/{question_id}',
@@ -183,7 +553,7 @@ async def partially_update_question(
     """
     Partially update an existing Question.
 
-    Validates Topic existence if the topic_id is changed.
+    A changed topic_id is checked by its foreign key on update.
 
     Args:
         question_id (int): The ID of the question.
@@ -192,6 +562,9 @@ async def partially_update_question(
 
     Returns:
         QuestionResponse: The updated question.
+
+    Raises:
+        HTTPException(404): If the question or the new topic does not exist.
     """
     question = await get_object_or_404(
         question_id,
@@ -199,15 +572,10 @@ async def partially_update_question(
         session,
         ERROR_QUESTION_NOT_FOUND
     )
-    if obj_in.topic_id and obj_in.topic_id != question.topic_id:
-        await get_object_or_404(
-            question.topic_id,
-            topic_crud,
-            session,
-            ERROR_TOPIC_NOT_FOUND
-        )
-
-    return await question_crud.update(question, obj_in, session)
+    async with foreign_key_or_404(session, ERROR_TOPIC_NOT_FOUND):
+        return await update_or_404(
+            question, obj_in, question_crud, session,
+            ERROR_QUESTION_NOT_FOUND)
 
 
 @router.delete(
@@ -231,6 +599,7 @@ async def delete_question(
 
     Raises:
         HTTPException(404): If the question does not exist.
+        HTTPException(409): If the question is still referenced.
     """
     question = await get_object_or_404(
         question_id,
@@ -238,5 +607,6 @@ async def delete_question(
         session,
         ERROR_QUESTION_NOT_FOUND
     )
-    await question_crud.remove(question, session)
+    async with foreign_key_or_409(session):
+        await question_crud.remove(question, session)
     return question
@@ -2,15 +2,20 @@
 This module defines the CRUD API endpoints for managing Topic resources.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db_config import get_async_session
+from app.core.db_config import get_async_read_session, get_async_session
+from app.core.response_cache import response_cache
 from app.core.user import current_superuser
+from app.crud.base import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.crud.topic import topic_crud
 from app.crud.category import category_crud
+from app.api.endpoints.ndjson import stream_ndjson, wants_ndjson
 from app.api.endpoints.validators import (
-    validate_name_duplicate, get_object_or_404)
+    foreign_key_or_404, foreign_key_or_409, validate_name_duplicate,
+    get_object_or_404, update_or_404)
+from app.schemas.category import CategoryResponse
 from app.schemas.topic import (
     TopicCreate, TopicUpdate, TopicResponse, TopicResponseWithCategoryName)
 from app.api.endpoints.constants import (
@@ -33,6 +38,8 @@ async def create_topic(
     Create a new Topic.
 
     Validates category existence and name duplication before creation.
+    The response reuses the validated category instead of reloading
+    the topic with it.
 
     Args:
         topic (TopicCreate): The topic data to create.
@@ -42,7 +49,7 @@ async def create_topic(
         TopicResponseWithCategoryName: The newly created topic with
         category details.
     """
-    await get_object_or_404(
+    category = await get_object_or_404(
         topic.category_id,
         category_crud,
         session,
@@ -52,10 +59,11 @@ async def create_topic(
         topic.name, session, topic_crud.get_topic_id_by_name)
 
     topic_db = await topic_crud.create(topic, session)
-    topic_with_category = await topic_crud.get_with_category(
-        topic_db.id, session)
-
-    return topic_with_category
+    return TopicResponseWithCategoryName(
+        id=topic_db.id,
+        name=topic_db.name,
+        category=CategoryResponse.model_validate(category)
+    )
 
 
 @router.get(
@@ -63,18 +71,33 @@ async def create_topic(
     response_model=list[TopicResponse]
 )
 async def get_all_topics(
-        session: AsyncSession = Depends(get_async_session)
+        request: Request,
+        after_id: int | None = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        session: AsyncSession = Depends(get_async_read_session)
 ) -> list[TopicResponse]:
     """
-    Retrieve all topics from the database.
+    Retrieve one page of topics ordered by ID.
+
+    Pass the ID of the last item of a page as ``after_id``
+    to get the next page. With ``Accept: application/x-ndjson`` all
+    topics (after ``after_id``) are streamed as NDJSON instead. Pages
+    are served from the response cache.
 
     Args:
+        request (Request): The incoming request.
+        after_id (int | None): Return only topics with a greater ID.
+        limit (int): The page size.
         session (AsyncSession): The async DB session.
 
     Returns:
-        list[TopicResponse]: A list of all topics.
+        list[TopicResponse]: A page of topics.
     """
-    return await topic_crud.get_multi(session)
+    if wants_ndjson(request):
+        return stream_ndjson(topic_crud, TopicResponse, after_id)
+    return await response_cache.get_or_set(
+        'topics', (after_id, limit), list[TopicResponse],
+        lambda: topic_crud.get_multi(session, after_id, limit))
 
 
 @router.patch(
@@ -90,7 +113,8 @@ async def partially_update_topic(
     """
     Partially update an existing Topic.
 
-    Validates name duplication and category existence if changed.
+    Validates name duplication if changed; a changed category_id is
+    checked by its foreign key on update.
 
     Args:
         topic_id (int): The ID of the topic.
@@ -106,15 +130,9 @@ async def partially_update_topic(
         await validate_name_duplicate(
             obj_in.name, session, topic_crud.get_topic_id_by_name)
 
-    if obj_in.category_id and obj_in.category_id != topic.category_id:
-        await get_object_or_404(
-            obj_in.category_id,
-            category_crud,
-            session,
-            ERROR_CATEGORY_NOT_FOUND
-        )
-
-    return await topic_crud.update(topic, obj_in, session)
+    async with foreign_key_or_404(session, ERROR_CATEGORY_NOT_FOUND):
+        return await update_or_404(
+            topic, obj_in, topic_crud, session, ERROR_TOPIC_NOT_FOUND)
 
 
 @router.delete(
@@ -138,6 +156,7 @@ async def delete_topic(
 
     Raises:
         HTTPException(404): If the topic does not exist.
+        HTTPException(409): If the topic is still referenced.
     """
     topic = await get_object_or_404(
         topic_id,
@@ -145,5 +164,6 @@ async def delete_topic(
         session,
         ERROR_TOPIC_NOT_FOUND
     )
-    await topic_crud.remove(topic, session)
+    async with foreign_key_or_409(session):
+        await topic_crud.remove(topic, session)
     return topic
@@ -4,34 +4,55 @@ endpoints, including:
     - get_object_or_404: Fetch an object and raise 404 if not found
     - validate_name_duplicate: Check if a name already exists before
         creating/updating
+    - validate_ids_exist: Check that all referenced IDs exist with
+        a single query
+    - foreign_key_or_404: Turn a foreign key violation raised by a write
+        into a 404 for the referenced object
+    - foreign_key_or_409: Turn a foreign key violation raised by a delete
+        into a 409 for the still referenced object
 """
 
-from typing import Awaitable, Callable, TypeVar, Generic
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, TypeVar, Generic
 
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.endpoints.constants import ERROR_OBJECT_NOT_FOUND, ERROR_NAME_ALREADY_EXIST
+from app.api.endpoints.constants import (
+    ERROR_OBJECT_NOT_FOUND, ERROR_NAME_ALREADY_EXIST,
+    ERROR_OBJECT_STILL_REFERENCED)
 
 
 T = TypeVar('T')
 
+#: The SQLSTATE of a foreign key violation in PostgreSQL.
+FOREIGN_KEY_VIOLATION_SQLSTATE = '23503'
+
 
 async def get_object_or_404(
         object_id: int,
         crud: Generic[T],
         session: AsyncSession,
-        not_found_message: str = ERROR_OBJECT_NOT_FOUND
+        not_found_message: str = ERROR_OBJECT_NOT_FOUND,
+        options: tuple = ()
 ):
     """
     Retrieve an object by ID using a CRUD instance, or raise 404 if not found.
 
+    The existence check and the fetch are a single query: pass loader
+    options to get the object together with the relationships the route
+    needs. Objects already loaded during the request are reused without
+    a query.
+
     Args:
         object_id (int): The ID of the object to retrieve.
         crud (Generic[T]): An instance of the CRUD class to perform
             the get operation.
         session (AsyncSession): The async DB session.
         not_found_message (str): The error message if the object does not exist.
+        options (tuple): Loader options applied to the query.
 
     Returns:
         T: The retrieved object.
@@ -39,7 +60,42 @@ async def get_object_or_404(
     Raises:
         HTTPException(404): If the object does not exist.
     """
-    obj = await crud.get(object_id, session)
+    obj = await crud.get(object_id, session, options)
+    if obj is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=not_found_message
+        )
+    return obj
+
+
+async def update_or_404(
+        db_obj,
+        obj_in,
+        crud: Generic[T],
+        session: AsyncSession,
+        not_found_message: str = ERROR_OBJECT_NOT_FOUND,
+):
+    """
+    Update an object using a CRUD instance, or raise 404 if its row was
+    deleted after it was loaded.
+
+    Args:
+        db_obj: The object loaded by the route.
+        obj_in: The fields to update.
+        crud (Generic[T]): An instance of the CRUD class to perform
+            the update operation.
+        session (AsyncSession): The async DB session.
+        not_found_message (str): The error message if the object no longer
+            exists.
+
+    Returns:
+        T: The updated object.
+
+    Raises:
+        HTTPException(404): If the object no longer exists.
+    """
+    obj = await crud.update(db_obj, obj_in, session)
     if obj is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -71,3 +127,111 @@ async def validate_name_duplicate(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=ERROR_NAME_ALREADY_EXIST
         )
+
+
+async def validate_ids_exist(
+        object_ids,
+        crud: Generic[T],
+        session: AsyncSession,
+        not_found_message: str = ERROR_OBJECT_NOT_FOUND
+) -> None:
+    """
+    Validate that every given ID exists, using a single query.
+
+    Args:
+        object_ids: The IDs to check.
+        crud (Generic[T]): An instance of the CRUD class of the referenced
+            model.
+        session (AsyncSession): The async DB session.
+        not_found_message (str): The error message if any ID is missing.
+
+    Raises:
+        HTTPException(404): If at least one ID does not exist.
+    """
+    object_ids = set(object_ids)
+    missing_ids = object_ids - await crud.get_existing_ids(object_ids, session)
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'{not_found_message} IDs: {sorted(missing_ids)}'
+        )
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """
+    Check whether an integrity error was caused by a foreign key
+    constraint (on PostgreSQL or SQLite).
+
+    Args:
+        error (IntegrityError): The error raised by the database.
+
+    Returns:
+        bool: True for foreign key violations.
+    """
+    orig = error.orig
+    return (
+        getattr(orig, 'sqlstate', None) == FOREIGN_KEY_VIOLATION_SQLSTATE
+        or getattr(orig, 'sqlite_errorcode', None)
+        == sqlite3.SQLITE_CONSTRAINT_FOREIGNKEY
+    )
+
+
+@asynccontextmanager
+async def foreign_key_or_404(
+        session: AsyncSession,
+        not_found_message: str = ERROR_OBJECT_NOT_FOUND
+) -> AsyncIterator[None]:
+    """
+    Let the database check a referenced ID instead of loading it first:
+    a foreign key violation raised inside the block rolls the session
+    back and becomes a 404.
+
+    Args:
+        session (AsyncSession): The async DB session.
+        not_found_message (str): The error message for a missing
+            referenced object.
+
+    Raises:
+        HTTPException(404): If the write referenced a missing object.
+    """
+    try:
+        yield
+    except IntegrityError as error:
+        if not is_foreign_key_violation(error):
+            raise
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=not_found_message
+        )
+
+
+@asynccontextmanager
+async def foreign_key_or_409(
+        session: AsyncSession,
+        conflict_message: str = ERROR_OBJECT_STILL_REFERENCED
+) -> AsyncIterator[None]:
+    """
+    Turn a foreign key violation raised by a delete inside the block
+    (the object is still referenced by rows the ORM cascades did not
+    cover, e.g. ones inserted concurrently) into a 409 after rolling the
+    session back.
+
+    Args:
+        session (AsyncSession): The async DB session.
+        conflict_message (str): The error message for a still referenced
+            object.
+
+    Raises:
+        HTTPException(409): If the deleted object is still referenced.
+    """
+    try:
+        yield
+    except IntegrityError as error:
+        if not is_foreign_key_violation(error):
+            raise
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=conflict_message
+        )
@@ -1,12 +1,12 @@
 """
 This module composes the main API router by including other resource routers
-(answer, category, question, topic, user).
+(answer, category, question, topic, user, monitoring).
 """
 
 from fastapi import APIRouter
 
 from app.api.endpoints import (
-    answer_router, category_router, question_router,
+    answer_router, category_router, monitoring_router, question_router,
     topic_router,  user_router)
 
 
@@ -28,5 +28,9 @@ main_router.include_router(
     topic_router, prefix='/topic', tags=['Topic']
 )
 
+main_router.include_router(
+    monitoring_router, prefix='/monitoring', tags=['Monitoring']
+)
+
 
 main_router.include_router(user_router)
@@ -0,0 +1,549 @@
+"""
+This module stores the question bank in a compact binary snapshot file that
+every worker process maps into memory read-only.
+
+One writer builds the file from the database; workers ``mmap`` it, so the
+bank is held once in the OS page cache however many workers run, and reads
+go straight to the mapped pages without loading or copying the whole bank.
+
+File layout (native byte order, every section aligned to 8 bytes):
+
+* a header: magic, byte order mark, bank version, fingerprint of the
+  bank tables (see ``bank_fingerprint``);
+* a directory with the (offset, size) of every column in ``COLUMNS``;
+* fixed-width columns of IDs, dates, row offsets and string references,
+  sorted by ID (answers by question, then ID);
+* one blob of UTF-8 strings. A string reference packs the offset of the
+  string in the blob and its length into one integer.
+
+It can also be run as a job that (re)builds the snapshot:
+    python -m app.core.bank_snapshot /var/lib/czech_realities/bank.snapshot
+"""
+
+import argparse
+import array
+import asyncio
+import hashlib
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from abc import abstractmethod
+from collections.abc import Mapping
+from datetime import date
+from typing import Iterable, Iterator
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.answer import AnswerResponse
+from app.schemas.category import CategoryResponse
+from app.schemas.question import QuestionResponseWithTopicAndAnswers
+from app.schemas.topic import TopicResponse
+from db_models import Answer, Category, Question, Topic
+from db_models.changes import change_bus
+
+
+MAGIC = b'CZQBANK2'
+BYTE_ORDER_MARK = 0x01020304
+HEADER = struct.Struct('=8sIxxxxQQ')
+DIRECTORY_ENTRY = struct.Struct('=QQ')
+ALIGNMENT = 8
+
+#: A string reference whose length is NULL_LENGTH stands for None.
+NULL_LENGTH = 0xFFFFFFFF
+
+#: Columns of a snapshot in file order: (name, array type code).
+COLUMNS = (
+    ('category_id', 'i'),
+    ('category_name', 'Q'),
+    ('topic_id', 'i'),
+    ('topic_category_id', 'i'),
+    ('topic_name', 'Q'),
+    ('question_id', 'i'),
+    ('question_topic_id', 'i'),
+    ('question_update_date', 'i'),
+    ('question_text', 'Q'),
+    ('question_image_url', 'Q'),
+    # Row of the first answer of each question, plus one end row.
+    ('question_answer_start', 'I'),
+    ('answer_id', 'i'),
+    ('answer_is_correct', 'B'),
+    ('answer_text', 'Q'),
+    ('answer_image_url', 'Q'),
+    # Question IDs grouped by topic, for topics with at least one question.
+    ('group_topic_id', 'i'),
+    ('group_start', 'I'),
+    ('group_question_id', 'i'),
+    ('strings', 'B'),
+)
+
+
+class SnapshotFormatError(ValueError):
+    """
+    Raised when a file is not a question bank snapshot readable here.
+    """
+
+
+class _StringBlob:
+    """
+    Collects strings into one blob and hands out packed references.
+    """
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def add(self, value: str | None) -> int:
+        if value is None:
+            return NULL_LENGTH
+        encoded = value.encode()
+        reference = len(self.data) << 32 | len(encoded)
+        self.data += encoded
+        return reference
+
+
+def write_snapshot(
+        path: str,
+        version: int,
+        fingerprint: int,
+        categories: Iterable[tuple[int, str]],
+        topics: Iterable[tuple[int, int, str]],
+        questions: Iterable[tuple[int, int, date, str, str | None]],
+        answers: Iterable[tuple[int, int, str, str | None, bool]],
+) -> None:
+    """
+    Write a snapshot file. The file is written next to ``path`` and moved
+    into place atomically, so readers never map a partial snapshot.
+
+    Args:
+        path (str): The snapshot file.
+        version (int): The bank version stored in the snapshot.
+        fingerprint (int): The fingerprint of the bank tables the rows
+            were read at.
+        categories: (id, name) rows sorted by ID.
+        topics: (id, category_id, name) rows sorted by ID.
+        questions: (id, topic_id, update_date, text, image_url) rows
+            sorted by ID.
+        answers: (id, question_id, text, image_url, is_correct) rows
+            sorted by question ID, then ID.
+    """
+    blob = _StringBlob()
+    columns = {name: array.array(code) for name, code in COLUMNS}
+
+    for category_id, name in categories:
+        columns['category_id'].append(category_id)
+        columns['category_name'].append(blob.add(name))
+
+    for topic_id, category_id, name in topics:
+        columns['topic_id'].append(topic_id)
+        columns['topic_category_id'].append(category_id)
+        columns['topic_name'].append(blob.add(name))
+
+    answers_by_question = {}
+    for answer in answers:
+        answers_by_question.setdefault(answer[1], []).append(answer)
+
+    topic_question_ids = {}
+    for question_id, topic_id, update_date, text, image_url in questions:
+        columns['question_id'].append(question_id)
+        columns['question_topic_id'].append(topic_id)
+        columns['question_update_date'].append(update_date.toordinal())
+        columns['question_text'].append(blob.add(text))
+        columns['question_image_url'].append(blob.add(image_url))
+        columns['question_answer_start'].append(len(columns['answer_id']))
+        for answer_id, _, text, image_url, is_correct in (
+                answers_by_question.get(question_id, ())):
+            columns['answer_id'].append(answer_id)
+            columns['answer_is_correct'].append(is_correct)
+            columns['answer_text'].append(blob.add(text))
+            columns['answer_image_url'].append(blob.add(image_url))
+        topic_question_ids.setdefault(topic_id, []).append(question_id)
+    columns['question_answer_start'].append(len(columns['answer_id']))
+
+    for topic_id in sorted(topic_question_ids):
+        columns['group_topic_id'].append(topic_id)
+        columns['group_start'].append(len(columns['group_question_id']))
+        columns['group_question_id'].extend(topic_question_ids[topic_id])
+    columns['group_start'].append(len(columns['group_question_id']))
+    columns['strings'].frombytes(blob.data)
+
+    directory = []
+    sections = []
+    offset = HEADER.size + DIRECTORY_ENTRY.size * len(COLUMNS)
+    for name, _ in COLUMNS:
+        offset += -offset % ALIGNMENT
+        data = columns[name].tobytes()
+        directory.append(DIRECTORY_ENTRY.pack(offset, len(data)))
+        sections.append((offset, data))
+        offset += len(data)
+
+    temporary_path = f'{path}.{os.getpid()}.tmp'
+    with open(temporary_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, BYTE_ORDER_MARK, version, fingerprint))
+        file.write(b''.join(directory))
+        for section_offset, data in sections:
+            file.write(b'\0' * (section_offset - file.tell()))
+            file.write(data)
+    os.replace(temporary_path, path)
+
+
+def read_snapshot_header(path: str) -> tuple[int, int]:
+    """
+    Read the bank version and fingerprint stored in a snapshot file.
+
+    Args:
+        path (str): The snapshot file.
+
+    Returns:
+        tuple[int, int]: The version and the fingerprint.
+    """
+    with open(path, 'rb') as file:
+        return _unpack_header(file.read(HEADER.size))
+
+
+def _unpack_header(buffer) -> tuple[int, int]:
+    if len(buffer) < HEADER.size:
+        raise SnapshotFormatError('The snapshot file is truncated.')
+    magic, byte_order_mark, version, fingerprint = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise SnapshotFormatError('Not a question bank snapshot.')
+    if byte_order_mark != BYTE_ORDER_MARK:
+        raise SnapshotFormatError(
+            'The snapshot was written with another byte order.')
+    return version, fingerprint
+
+
+def _is_current(path: str, version: int, fingerprint: int) -> bool:
+    try:
+        stored_version, stored_fingerprint = read_snapshot_header(path)
+    except (FileNotFoundError, SnapshotFormatError):
+        return False
+    return stored_version >= version and stored_fingerprint == fingerprint
+
+
+async def bank_fingerprint(session: AsyncSession) -> int:
+    """
+    Compute a cheap fingerprint of the bank tables from the row count and
+    the highest ID of every table and the latest question update date.
+
+    It lets a snapshot be checked against the database even for changes
+    the bank version does not cover (another run, rows inserted or
+    deleted behind the change bus). Edits that keep all of these values
+    still need an explicit refresh.
+
+    Args:
+        session (AsyncSession): The current database session.
+
+    Returns:
+        int: A 64-bit fingerprint.
+    """
+    aggregates = []
+    for model in (Category, Topic, Question, Answer):
+        aggregates.append(
+            select(func.count()).select_from(model).scalar_subquery())
+        aggregates.append(select(func.max(model.id)).scalar_subquery())
+    aggregates.append(
+        select(func.max(Question.update_date)).scalar_subquery())
+    values = (await session.execute(select(*aggregates))).one()
+    digest = hashlib.blake2b(repr(tuple(values)).encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), 'little')
+
+
+async def build_snapshot(
+        session: AsyncSession,
+        path: str,
+        if_older_than: int | None = None
+) -> None:
+    """
+    Build the snapshot file from the database, stamped with the current
+    bank version and fingerprint. Concurrent builders are serialized with
+    a lock file (``flock``, so building needs a Unix platform).
+
+    Args:
+        session (AsyncSession): The current database session.
+        path (str): The snapshot file.
+        if_older_than (int | None): Keep an existing snapshot (e.g. just
+            built by another worker) whose version is at least this one
+            and whose fingerprint matches the database; None always
+            rebuilds.
+    """
+    import fcntl
+
+    with open(f'{path}.lock', 'wb') as lock_file:
+        await asyncio.to_thread(fcntl.flock, lock_file, fcntl.LOCK_EX)
+        # The version and fingerprint are read before the data: every
+        # change they cover was committed before, so the data includes it.
+        fingerprint = await bank_fingerprint(session)
+        if (if_older_than is not None
+                and _is_current(path, if_older_than, fingerprint)):
+            return
+
+        version = await change_bus.current_version(session)
+        categories = await session.execute(
+            select(Category.id, Category.name).order_by(Category.id))
+        topics = await session.execute(
+            select(Topic.id, Topic.category_id, Topic.name)
+            .order_by(Topic.id)
+        )
+        questions = await session.execute(
+            select(
+                Question.id, Question.topic_id, Question.update_date,
+                Question.text, Question.image_url
+            )
+            .where(Question.topic_id.is_not(None))
+            .order_by(Question.id)
+        )
+        answers = await session.execute(
+            select(
+                Answer.id, Answer.question_id, Answer.text,
+                Answer.image_url, Answer.is_correct
+            )
+            .where(Answer.question_id.is_not(None))
+            .order_by(Answer.question_id, Answer.id)
+        )
+        await asyncio.to_thread(
+            write_snapshot,
+            path,
+            version,
+            fingerprint,
+            categories.all(),
+            topics.all(),
+            questions.all(),
+            answers.all(),
+        )
+
+
+class MappedSnapshot:
+    """
+    A question bank snapshot mapped read-only from a file.
+
+    It offers the same attributes as an in-memory ``BankSnapshot``; the
+    question and ID views read the mapped pages and build response models
+    only for the questions that are looked up.
+
+    Attributes:
+        version (int): The bank version of the snapshot.
+        fingerprint (int): The fingerprint of the bank tables the
+            snapshot was built at.
+        question_ids (Sequence[int]): IDs of all questions, ascending.
+        topic_question_ids (Mapping[int, Sequence[int]]): Question IDs
+            grouped by topic ID.
+        questions (Mapping[int, QuestionResponseWithTopicAndAnswers]):
+            Questions with their topic and answers by ID.
+        topics (Mapping[int, TopicResponse]): Topics by ID.
+        categories (Mapping[int, CategoryResponse]): Categories by ID.
+        file_id (tuple[int, int]): Inode and modification time of the
+            mapped file, to detect a replaced snapshot.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): The snapshot file.
+
+        Raises:
+            SnapshotFormatError: If the file is not a valid snapshot.
+        """
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            self._mmap = mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.file_id = (stat.st_ino, stat.st_mtime_ns)
+
+        buffer = memoryview(self._mmap)
+        self.version, self.fingerprint = _unpack_header(buffer)
+        columns = {}
+        for index, (name, code) in enumerate(COLUMNS):
+            offset, size = DIRECTORY_ENTRY.unpack_from(
+                buffer, HEADER.size + index * DIRECTORY_ENTRY.size)
+            if offset + size > len(buffer):
+                raise SnapshotFormatError('The snapshot file is truncated.')
+            columns[name] = buffer[offset:offset + size].cast(code)
+        self._columns = columns
+
+        self.question_ids = columns['question_id']
+        self.topic_question_ids = _TopicQuestionIds(columns)
+        self.questions = _Questions(self)
+        self.topics = _Topics(self)
+        self.categories = _Categories(self)
+
+    def string(self, reference: int) -> str | None:
+        """
+        Decode a string reference.
+
+        Args:
+            reference (int): The packed reference.
+
+        Returns:
+            str | None: The string, or None for a null reference.
+        """
+        length = reference & NULL_LENGTH
+        if length == NULL_LENGTH:
+            return None
+        offset = reference >> 32
+        return str(self._columns['strings'][offset:offset + length], 'utf-8')
+
+    def row(self, column: str, obj_id: int) -> int:
+        """
+        Find the row of an ID in a column sorted by ID.
+
+        Args:
+            column (str): The ID column.
+            obj_id (int): The ID to look up.
+
+        Returns:
+            int: The row index.
+
+        Raises:
+            KeyError: If the ID is not in the snapshot.
+        """
+        ids = self._columns[column]
+        index = bisect_left(ids, obj_id)
+        if index == len(ids) or ids[index] != obj_id:
+            raise KeyError(obj_id)
+        return index
+
+    def column(self, name: str) -> memoryview:
+        """
+        Return a mapped column.
+
+        Args:
+            name (str): The column name (see ``COLUMNS``).
+
+        Returns:
+            memoryview: The column values.
+        """
+        return self._columns[name]
+
+
+class _TopicQuestionIds(Mapping):
+    """
+    Question IDs grouped by topic; every group is a slice of the mapping.
+    """
+
+    def __init__(self, columns: dict[str, memoryview]):
+        self._topic_ids = columns['group_topic_id']
+        self._starts = columns['group_start']
+        self._question_ids = columns['group_question_id']
+
+    def __getitem__(self, topic_id: int) -> memoryview:
+        index = bisect_left(self._topic_ids, topic_id)
+        if (index == len(self._topic_ids)
+                or self._topic_ids[index] != topic_id):
+            raise KeyError(topic_id)
+        return self._question_ids[
+            self._starts[index]:self._starts[index + 1]]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._topic_ids)
+
+    def __len__(self) -> int:
+        return len(self._topic_ids)
+
+
+class _SnapshotTable(Mapping):
+    """
+    Base class of the views building response models from snapshot rows.
+    """
+
+    id_column: str
+
+    def __init__(self, snapshot: MappedSnapshot):
+        self._snapshot = snapshot
+
+    def __getitem__(self, obj_id: int):
+        return self.build(self._snapshot.row(self.id_column, obj_id))
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._snapshot.column(self.id_column))
+
+    def __len__(self) -> int:
+        return len(self._snapshot.column(self.id_column))
+
+    @abstractmethod
+    def build(self, row: int):
+        """
+        Build the response model of a row.
+        """
+
+
+class _Categories(_SnapshotTable):
+    id_column = 'category_id'
+
+    def build(self, row: int) -> CategoryResponse:
+        snapshot = self._snapshot
+        return CategoryResponse(
+            id=snapshot.column('category_id')[row],
+            name=snapshot.string(snapshot.column('category_name')[row]),
+        )
+
+
+class _Topics(_SnapshotTable):
+    id_column = 'topic_id'
+
+    def build(self, row: int) -> TopicResponse:
+        snapshot = self._snapshot
+        return TopicResponse(
+            id=snapshot.column('topic_id')[row],
+            name=snapshot.string(snapshot.column('topic_name')[row]),
+            category_id=snapshot.column('topic_category_id')[row],
+        )
+
+
+class _Questions(_SnapshotTable):
+    id_column = 'question_id'
+
+    def build(self, row: int) -> QuestionResponseWithTopicAndAnswers:
+        snapshot = self._snapshot
+        column = snapshot.column
+        string = snapshot.string
+        question_id = column('question_id')[row]
+        start, end = column('question_answer_start')[row:row + 2]
+        return QuestionResponseWithTopicAndAnswers(
+            id=question_id,
+            text=string(column('question_text')[row]),
+            image_url=string(column('question_image_url')[row]),
+            update_date=date.fromordinal(
+                column('question_update_date')[row]),
+            topic=snapshot.topics[column('question_topic_id')[row]],
+            answers=[
+                AnswerResponse(
+                    id=column('answer_id')[answer_row],
+                    text=string(column('answer_text')[answer_row]),
+                    image_url=string(column('answer_image_url')[answer_row]),
+                    is_correct=bool(column('answer_is_correct')[answer_row]),
+                    question_id=question_id,
+                )
+                for answer_row in range(start, end)
+            ],
+        )
+
+
+async def _run_job(path: str) -> None:
+    """
+    Rebuild the snapshot from the configured database.
+    """
+    from app.core.db_config import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as session:
+        await build_snapshot(session, path)
+    snapshot = MappedSnapshot(path)
+    print(
+        f'Snapshot version {snapshot.version}: '
+        f'{len(snapshot.question_ids)} questions, '
+        f'{len(snapshot.topic_question_ids)} topics, '
+        f'{os.path.getsize(path)} bytes.'
+    )
+
+
+if __name__ == '__main__':
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(
+        description='Build the shared question bank snapshot.')
+    parser.add_argument(
+        'path', nargs='?', default=settings.question_bank_snapshot_path)
+    arguments = parser.parse_args()
+    if arguments.path is None:
+        parser.error('pass a path or set QUESTION_BANK_SNAPSHOT_PATH')
+    asyncio.run(_run_job(arguments.path))
@@ -0,0 +1,103 @@
+"""
+This module provides a bounded in-process cache whose entries expire
+after a fixed time-to-live.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+
+V = TypeVar('V')
+
+
+class TTLCache(Generic[V]):
+    """
+    A least-recently-used cache with a per-entry time-to-live.
+
+    Expired entries are dropped when they are read; when the cache is full
+    the least recently used entry is evicted. A TTL of zero (or a size of
+    zero) disables caching.
+
+    Attributes:
+        evictions (int): The number of entries evicted to make room.
+
+    Methods:
+        get: Return a fresh cached value.
+        set: Store a value.
+        invalidate: Drop the value of a key.
+        clear: Drop all values.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Args:
+            max_size (int): The maximum number of entries.
+            ttl (float): How long an entry stays fresh, in seconds.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether values are cached at all.
+        """
+        return self.max_size > 0 and self.ttl > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> V | None:
+        """
+        Return the value cached for a key if it has not expired.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            V | None: The cached value, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entry if the cache
+        is full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (V): The value to cache.
+        """
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop the value cached for a key, if any.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop all cached values.
+        """
+        self._entries.clear()
@@ -3,6 +3,8 @@ This module defines application-wide settings using Pydantic's BaseSettings.
 It automatically loads environment variables from a .env file.
 """
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 from pydantic import EmailStr
 from pathlib import Path
@@ -16,16 +18,67 @@ class Settings(BaseSettings):
         app_title (str): The title of the application.
         description (str): A short description for the application.
         database_url (str): The database URL for SQLAlchemy connections.
+        read_database_url (str | None): An optional read replica URL used
+            by read-only routes.
         secret (str): A secret key used for cryptographic operations.
         first_superuser_email (EmailStr | None): An optional superuser email.
         first_superuser_password (str | None): An optional superuser password.
+        ticket_cache_size (int): The maximum number of seeded tickets kept
+            in memory.
+        question_bank_snapshot_path (str | None): A snapshot file through
+            which worker processes share one memory-mapped question bank;
+            None keeps a private copy in every process.
+        db_pool_size (int): Connections kept open in the pool.
+        db_max_overflow (int): Extra connections allowed above the pool size.
+        db_pool_timeout (float): Seconds to wait for a free connection.
+        db_pool_recycle (int): Seconds after which a connection is replaced.
+        db_pool_pre_ping (bool): Check connections before handing them out.
+        db_statement_cache_size (int): Size of asyncpg's prepared statement
+            cache per connection (0 disables it, e.g. behind PgBouncer).
+        query_budget (int | None): The maximum number of SQL statements
+            a request may execute; None disables the check.
+        query_budget_raise (bool): Fail over-budget requests instead of
+            logging a warning.
+        auth_cache_size (int): The maximum number of users kept in the
+            authentication cache.
+        auth_cache_ttl (float): Seconds a cached user stays valid
+            (0 disables the cache).
+        password_hash_workers (int): Threads hashing and verifying
+            passwords.
+        lazy_admin (bool): Build the admin interface on its first request
+            instead of at startup.
+        response_cache_backend (str): Where responses of the cached read
+            routes are stored: 'memory', 'redis' or 'none'.
+        response_cache_size (int): The maximum number of responses in the
+            in-process cache.
+        response_cache_ttl (float): Seconds a cached response stays valid.
+        redis_url (str): The Redis URL of the 'redis' cache backend.
     """
     app_title: str
     description: str
     database_url: str
+    read_database_url: str | None = None
     secret: str
     first_superuser_email: EmailStr | None = None
     first_superuser_password: str | None = None
+    ticket_cache_size: int = 1024
+    question_bank_snapshot_path: str | None = None
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100
+    query_budget: int | None = None
+    query_budget_raise: bool = False
+    auth_cache_size: int = 1024
+    auth_cache_ttl: float = 30
+    password_hash_workers: int = 2
+    lazy_admin: bool = False
+    response_cache_backend: Literal['memory', 'redis', 'none'] = 'memory'
+    response_cache_size: int = 1024
+    response_cache_ttl: float = 60
+    redis_url: str = 'redis://localhost:6379/0'
 
     class Config:
         """
@@ -1,19 +1,108 @@
 """
 This module defines the SQLAlchemy database engine configuration and
-provides a factory for creating asynchronous sessions.
+provides factories for creating asynchronous sessions: one for the primary
+database and one for read-only traffic, which goes to a read replica
+if one is configured.
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core.db_pool import InstrumentedAsyncQueuePool
+from db_models.changes import change_bus
+
+
+def get_engine_options(database_url: str) -> dict:
+    """
+    Build connection pool options for an engine from the settings.
+
+    SQLite engines keep SQLAlchemy's defaults, since they do not use
+    a queue pool.
+
+    Args:
+        database_url (str): The database URL of the engine.
+
+    Returns:
+        dict: Keyword arguments for ``create_async_engine``.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == 'sqlite':
+        return {}
+
+    options = {
+        'poolclass': InstrumentedAsyncQueuePool,
+        'pool_size': settings.db_pool_size,
+        'max_overflow': settings.db_max_overflow,
+        'pool_timeout': settings.db_pool_timeout,
+        'pool_recycle': settings.db_pool_recycle,
+        'pool_pre_ping': settings.db_pool_pre_ping,
+    }
+    if url.get_driver_name() == 'asyncpg':
+        options['connect_args'] = {
+            'prepared_statement_cache_size': settings.db_statement_cache_size,
+        }
+    return options
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+
+def enforce_foreign_keys(engine: AsyncEngine) -> None:
+    """
+    Make SQLite enforce foreign keys (it does not by default), since
+    writes rely on them to detect missing referenced objects.
+    Other databases always enforce them.
+
+    Args:
+        engine (AsyncEngine): The engine to configure.
+    """
+    if engine.dialect.name == 'sqlite':
+        event.listen(engine.sync_engine, 'connect', _enable_sqlite_foreign_keys)
 
 
 #: An asynchronous SQLAlchemy engine for the app's database.
-engine = create_async_engine(settings.database_url)
+engine = create_async_engine(
+    settings.database_url,
+    **get_engine_options(settings.database_url)
+)
+
+enforce_foreign_keys(engine)
+
+# Announce committed changes of the question bank to caches in all workers
+change_bus.install(engine)
 
 #: A session factory using AsyncSession for database interactions.
-AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession)
+#: Objects stay usable after commit, so responses can be built from them
+#: without lazy loads.
+AsyncSessionLocal = sessionmaker(
+    engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
+#: An engine for read-only traffic: the read replica if configured,
+#: otherwise the primary engine.
+read_engine = (
+    create_async_engine(
+        settings.read_database_url,
+        **get_engine_options(settings.read_database_url)
+    )
+    if settings.read_database_url
+    else engine
+)
+
+#: A session factory for read-only routes.
+ReadSessionLocal = sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
 
 
 async def get_async_session():
@@ -25,3 +114,17 @@ async def get_async_session():
     """
     async with AsyncSessionLocal() as async_session:
         yield async_session
+
+
+async def get_async_read_session():
+    """
+    Provide a read-only async database session for each request.
+
+    The session is bound to the read replica if one is configured, so it
+    must only be used by routes that do not write.
+
+    Yields:
+        AsyncSession: An async session to be used within a request scope.
+    """
+    async with ReadSessionLocal() as async_session:
+        yield async_session
@@ -0,0 +1,110 @@
+"""
+This module provides an instrumented connection pool that records how long
+requests wait for a database connection, and a helper that reports the
+current state of an engine's pool.
+"""
+
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+@dataclass
+class PoolWaitStats:
+    """
+    Accumulated statistics of connection checkouts.
+
+    Attributes:
+        checkouts (int): The number of connection requests served.
+        timeouts (int): The number of requests that timed out waiting.
+        wait_time_total (float): Total time spent waiting, in seconds.
+        wait_time_max (float): The longest single wait, in seconds.
+    """
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    def record(self, wait_time: float, timed_out: bool = False) -> None:
+        """
+        Record one connection request.
+
+        Args:
+            wait_time (float): How long the request waited, in seconds.
+            timed_out (bool): Whether the request timed out.
+        """
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    An asyncio queue pool that measures the time spent acquiring
+    each connection.
+
+    Attributes:
+        wait_stats (PoolWaitStats): Checkout statistics of this pool,
+            carried over when the pool is re-created
+            (e.g. by ``engine.dispose()``).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self) -> 'InstrumentedAsyncQueuePool':
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.record(time.perf_counter() - started, True)
+            raise
+        self.wait_stats.record(time.perf_counter() - started)
+        return connection
+
+
+def get_pool_status(pool: Pool) -> dict:
+    """
+    Describe the current state of a connection pool.
+
+    Args:
+        pool (Pool): The pool of an engine.
+
+    Returns:
+        dict: Pool occupancy (for queue pools) and checkout wait statistics
+        (zero for pools that are not instrumented).
+    """
+    wait_stats = getattr(pool, 'wait_stats', None) or PoolWaitStats()
+    status = {
+        'pool_class': type(pool).__name__,
+        'size': None,
+        'checked_out': None,
+        'idle': None,
+        'overflow': None,
+        'max_overflow': None,
+        'checkouts': wait_stats.checkouts,
+        'timeouts': wait_stats.timeouts,
+        'wait_time_total_ms': wait_stats.wait_time_total * 1000,
+        'wait_time_max_ms': wait_stats.wait_time_max * 1000,
+    }
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    return status
@@ -1,6 +1,6 @@
 """
 This module handles database initialization tasks, such as creating
-a first superuser if none exists.
+a first superuser if none exists and loading the in-memory question bank.
 """
 
 import contextlib
@@ -9,6 +9,7 @@ from fastapi_users.exceptions import UserAlreadyExists
 
 from app.core.config import settings
 from app.core.db_config import get_async_session
+from app.core.question_bank import question_bank
 from app.core.user import get_user_db, get_user_manager
 from app.schemas.user import UserCreate
 
@@ -60,3 +61,12 @@ async def create_first_superuser():
             password=settings.first_superuser_password,
             is_superuser=True,
         )
+
+
+async def load_question_bank():
+    """
+    Load the in-memory question bank from the database, or map the shared
+    snapshot if another worker has already built it.
+    """
+    async with get_async_session_context() as session:
+        await question_bank.attach(session)
@@ -0,0 +1,193 @@
+"""
+This module provides the application's Prometheus metrics: an ASGI
+middleware that records request latency, status counts and in-flight
+requests per route template, and SQLAlchemy event listeners that count
+queries and database time of each request.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+#: Route label of requests that did not match any route. Raw paths are
+#: never used as labels, so unknown URLs cannot blow up the cardinality.
+UNMATCHED_ROUTE = '<unmatched>'
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency in seconds.',
+    ['method', 'route'],
+)
+REQUESTS_TOTAL = Counter(
+    'http_requests_total',
+    'HTTP requests by response status.',
+    ['method', 'route', 'status'],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight',
+    'HTTP requests currently being served.',
+    ['method', 'route'],
+)
+DB_QUERIES_TOTAL = Counter(
+    'db_queries_total',
+    'SQL statements executed while serving requests.',
+    ['method', 'route'],
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    'db_queries_per_request',
+    'SQL statements executed per HTTP request.',
+    ['method', 'route'],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    'db_time_per_request_seconds',
+    'Time spent executing SQL statements per HTTP request, in seconds.',
+    ['method', 'route'],
+)
+
+
+@dataclass
+class RequestDBStats:
+    """
+    Database activity of a single request.
+
+    Attributes:
+        queries (int): The number of statements executed.
+        duration (float): Total execution time, in seconds.
+    """
+
+    queries: int = 0
+    duration: float = 0.0
+
+
+#: Database statistics of the request being served in the current context.
+_request_db_stats: ContextVar[RequestDBStats | None] = ContextVar(
+    'request_db_stats', default=None)
+
+
+# The start time is kept on the statement's execution context rather than
+# on the connection, so a statement that raises (and never reaches
+# ``after_cursor_execute``) leaves nothing behind on the pooled connection.
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    started = context._query_start_time
+    stats = _request_db_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.duration += time.perf_counter() - started
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Attach the query counting listeners to an engine.
+
+    Calling it again for the same engine has no effect.
+
+    Args:
+        engine (AsyncEngine): The engine to instrument.
+    """
+    sync_engine = engine.sync_engine
+    if event.contains(
+        sync_engine, 'before_cursor_execute', _before_cursor_execute
+    ):
+        return
+    event.listen(sync_engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(sync_engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def get_route_template(scope: Scope) -> str:
+    """
+    Resolve the path template of the route handling a request
+    (e.g. ``/question/{question_id}``).
+
+    Args:
+        scope (Scope): The ASGI scope of the request.
+
+    Returns:
+        str: The route template, or ``UNMATCHED_ROUTE`` if no route matches.
+    """
+    partial = None
+    for route in scope['app'].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            partial = route.path
+    return partial or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request metrics per route template.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        route = get_route_template(scope)
+        status_code = 500
+        stats = RequestDBStats()
+        token = _request_db_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(method, route)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUEST_LATENCY.labels(method, route).observe(
+                time.perf_counter() - started)
+            REQUESTS_TOTAL.labels(method, route, str(status_code)).inc()
+            in_flight.dec()
+            DB_QUERIES_TOTAL.labels(method, route).inc(stats.queries)
+            DB_QUERIES_PER_REQUEST.labels(method, route).observe(
+                stats.queries)
+            DB_TIME_PER_REQUEST.labels(method, route).observe(stats.duration)
+            _request_db_stats.reset(token)
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """
+    Expose all collected metrics in the Prometheus text format.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        Response: The metrics exposition.
+    """
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,205 @@
+"""
+This module runs password hashing and verification in a dedicated,
+size-limited thread pool, so bursts of logins and registrations do not
+block the event loop. The hashers release the GIL, so the pool's threads
+hash in parallel while the loop keeps serving other requests.
+
+FastAPI Users' user manager calls its password helper synchronously, so
+the user manager computes results in the pool first and hands them to the
+manager through a PreparedPasswordHelper.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from fastapi_users.password import PasswordHelper, PasswordHelperProtocol
+from prometheus_client import Gauge, Histogram
+
+from app.core.config import settings
+
+
+R = TypeVar('R')
+
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    'password_hash_queue_depth',
+    'Password hashing jobs waiting for a free worker.',
+)
+PASSWORD_HASH_DURATION = Histogram(
+    'password_hash_duration_seconds',
+    'Time to hash or verify a password, including the wait for a worker.',
+    ['operation'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+class PasswordHasher:
+    """
+    Asynchronous front end of a PasswordHelper that runs its work in
+    a bounded thread pool.
+
+    Methods:
+        hash: Hash a password.
+        verify_and_update: Verify a password against a hash.
+        queue_depth: The number of jobs waiting for a worker.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        password_helper: PasswordHelper | None = None
+    ):
+        """
+        Args:
+            max_workers (int): The number of hashing threads.
+            password_helper (PasswordHelper | None): The helper doing
+                the actual hashing (FastAPI Users' default if None).
+        """
+        self.password_helper = password_helper or PasswordHelper()
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='password-hash'
+        )
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    def queue_depth(self) -> int:
+        """
+        The number of jobs waiting for a free worker.
+        """
+        return max(0, self._pending - self._max_workers)
+
+    def _job_done(self, future) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+
+    async def _run(self, operation: str, func: Callable[..., R], *args) -> R:
+        started = time.perf_counter()
+        with self._pending_lock:
+            self._pending += 1
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(self._job_done)
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            PASSWORD_HASH_DURATION.labels(operation).observe(
+                time.perf_counter() - started)
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password.
+
+        Args:
+            password (str): The plain password.
+
+        Returns:
+            str: The password hash.
+        """
+        return await self._run('hash', self.password_helper.hash, password)
+
+    async def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        Verify a password against a hash.
+
+        Args:
+            plain_password (str): The plain password.
+            hashed_password (str): The stored hash.
+
+        Returns:
+            tuple[bool, str | None]: Whether the password matches, and
+            a new hash if the stored one uses an outdated scheme.
+        """
+        return await self._run(
+            'verify',
+            self.password_helper.verify_and_update,
+            plain_password,
+            hashed_password
+        )
+
+
+class PreparedPasswordHelper(PasswordHelperProtocol):
+    """
+    A password helper for synchronous callers (FastAPI Users' user
+    manager) that returns results computed beforehand in the thread pool.
+
+    Calls that were not prepared fall back to the wrapped helper and run
+    on the calling thread.
+
+    Methods:
+        prepare_hash: Hash a password in the pool for a later ``hash``.
+        prepare_verify: Verify a password in the pool for a later
+            ``verify_and_update``.
+        hash: Return the prepared hash of a password.
+        verify_and_update: Return the prepared verification result.
+        generate: Generate a random password.
+    """
+
+    def __init__(self, hasher: PasswordHasher):
+        """
+        Args:
+            hasher (PasswordHasher): The hasher computing prepared results.
+        """
+        self._hasher = hasher
+        self._hashes: dict[str, str] = {}
+        self._verifications: dict[tuple[str, str], tuple[bool, str | None]] = {}
+
+    async def prepare_hash(self, password: str) -> None:
+        """
+        Hash a password in the pool; the next ``hash`` call for it returns
+        the result.
+
+        Args:
+            password (str): The plain password.
+        """
+        self._hashes[password] = await self._hasher.hash(password)
+
+    async def prepare_verify(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> None:
+        """
+        Verify a password in the pool; the next ``verify_and_update`` call
+        for the same arguments returns the result.
+
+        Args:
+            plain_password (str): The plain password.
+            hashed_password (str): The stored hash.
+        """
+        self._verifications[plain_password, hashed_password] = (
+            await self._hasher.verify_and_update(
+                plain_password, hashed_password)
+        )
+
+    def hash(self, password: str) -> str:
+        hashed = self._hashes.pop(password, None)
+        if hashed is None:
+            hashed = self._hasher.password_helper.hash(password)
+        return hashed
+
+    def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> tuple[bool, str | None]:
+        result = self._verifications.pop(
+            (plain_password, hashed_password), None)
+        if result is None:
+            result = self._hasher.password_helper.verify_and_update(
+                plain_password, hashed_password)
+        return result
+
+    def generate(self) -> str:
+        return self._hasher.password_helper.generate()
+
+
+#: The process-wide password hasher.
+password_hasher = PasswordHasher(settings.password_hash_workers)
+PASSWORD_HASH_QUEUE_DEPTH.set_function(password_hasher.queue_depth)
@@ -0,0 +1,197 @@
+"""
+This module provides a per-request SQL query budget, used in development
+and testing to catch N+1 queries and other query count regressions.
+
+Every statement executed through an instrumented engine is recorded in the
+query logs active in the current context. ``QueryBudgetMiddleware`` opens
+such a log for each request and logs (or raises) when a route executes more
+statements than the configured budget; ``assert_num_queries`` checks the
+exact number of statements executed by a block of code.
+"""
+
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import get_route_template
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    Raised when a block of code executes more SQL statements than
+    its budget allows.
+    """
+
+
+@dataclass
+class QueryLog:
+    """
+    SQL statements executed within a tracked block.
+
+    Attributes:
+        budget (int | None): The maximum number of statements allowed,
+            or None for no limit.
+        raise_on_exceed (bool): Whether to raise ``QueryBudgetExceeded``
+            as soon as the budget is exceeded.
+        statements (list[str]): The executed statements, in order.
+    """
+
+    budget: int | None = None
+    raise_on_exceed: bool = False
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        """
+        The number of executed statements.
+        """
+        return len(self.statements)
+
+    @property
+    def exceeded(self) -> bool:
+        """
+        Whether more statements were executed than the budget allows.
+        """
+        return self.budget is not None and self.count > self.budget
+
+    def describe(self) -> str:
+        """
+        Summarize the executed statements, most repeated first, which
+        points straight at N+1 loops.
+
+        Returns:
+            str: One line per distinct statement with its repeat count.
+        """
+        return '\n'.join(
+            f'{repeats}x {statement}'
+            for statement, repeats in Counter(self.statements).most_common()
+        )
+
+
+#: Query logs open in the current context (innermost last).
+_query_logs: ContextVar[tuple[QueryLog, ...]] = ContextVar(
+    'query_logs', default=())
+
+
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    for query_log in _query_logs.get():
+        query_log.statements.append(statement)
+        if query_log.raise_on_exceed and query_log.exceeded:
+            raise QueryBudgetExceeded(
+                f'{query_log.count} SQL statements executed, the budget is '
+                f'{query_log.budget}:\n{query_log.describe()}'
+            )
+
+
+def enable_query_tracking(engine: AsyncEngine) -> None:
+    """
+    Record the statements executed through an engine in the active
+    query logs.
+
+    Calling it again for the same engine has no effect.
+
+    Args:
+        engine (AsyncEngine): The engine to track.
+    """
+    if not event.contains(
+        engine.sync_engine, 'before_cursor_execute', _record_query
+    ):
+        event.listen(
+            engine.sync_engine, 'before_cursor_execute', _record_query)
+
+
+@contextmanager
+def track_queries(
+    budget: int | None = None,
+    raise_on_exceed: bool = False
+) -> Iterator[QueryLog]:
+    """
+    Record the SQL statements executed within the block.
+
+    Args:
+        budget (int | None): The maximum number of statements allowed.
+        raise_on_exceed (bool): Raise ``QueryBudgetExceeded`` from the
+            statement that exceeds the budget.
+
+    Yields:
+        QueryLog: The log of the block's statements.
+    """
+    query_log = QueryLog(budget, raise_on_exceed)
+    token = _query_logs.set(_query_logs.get() + (query_log,))
+    try:
+        yield query_log
+    finally:
+        _query_logs.reset(token)
+
+
+@contextmanager
+def assert_num_queries(expected: int) -> Iterator[QueryLog]:
+    """
+    Assert that the block executes exactly ``expected`` SQL statements.
+
+    Meant for tests and checks, e.g. around a request made with an
+    in-process ASGI client.
+
+    Args:
+        expected (int): The expected number of statements.
+
+    Yields:
+        QueryLog: The log of the block's statements.
+
+    Raises:
+        AssertionError: If a different number of statements was executed.
+    """
+    with track_queries() as query_log:
+        yield query_log
+    if query_log.count != expected:
+        raise AssertionError(
+            f'Expected {expected} SQL statements, {query_log.count} were '
+            f'executed:\n{query_log.describe()}'
+        )
+
+
+class QueryBudgetMiddleware:
+    """
+    ASGI middleware enforcing a SQL statement budget on every request.
+
+    Over-budget requests are logged with their statements; with
+    ``raise_on_exceed`` the offending statement raises
+    ``QueryBudgetExceeded`` instead, failing the request.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        budget: int,
+        raise_on_exceed: bool = False
+    ):
+        self.app = app
+        self.budget = budget
+        self.raise_on_exceed = raise_on_exceed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(self.budget, self.raise_on_exceed) as query_log:
+            await self.app(scope, receive, send)
+        if query_log.exceeded:
+            logger.warning(
+                '%s %s executed %d SQL statements (budget %d):\n%s',
+                scope['method'],
+                get_route_template(scope),
+                query_log.count,
+                self.budget,
+                query_log.describe(),
+            )
@@ -0,0 +1,381 @@
+"""
+This module provides a resident, versioned in-memory index of the question
+bank. Questions are loaded once (on startup or on demand) together with their
+answers and topic, so random picks are served without any database round trip.
+
+With a snapshot path the bank is not loaded into every process: the workers
+share one memory-mapped snapshot file (see ``app.core.bank_snapshot``) and
+map the new file whenever another worker replaces it.
+
+The bank reloads itself shortly after changes of topics, questions or
+answers are announced on the change bus (see ``db_models.changes``).
+Snapshots carry the bank version they were loaded at.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload, sessionmaker
+
+from app.core.bank_snapshot import MappedSnapshot, build_snapshot
+from app.core.config import settings
+from app.core.db_config import AsyncSessionLocal
+from app.schemas.question import QuestionResponseWithTopicAndAnswers
+from db_models import Question
+from db_models.changes import ChangeEvent, change_bus
+
+
+logger = logging.getLogger(__name__)
+
+#: Seconds between checks whether the snapshot file has been replaced.
+SNAPSHOT_CHECK_INTERVAL = 1.0
+
+#: Seconds to wait after a change before reloading, so a burst of changes
+#: causes one reload.
+RELOAD_DELAY = 0.5
+
+#: Tables whose rows are part of the bank.
+BANK_TABLES = ('topics', 'questions', 'answers')
+
+
+@dataclass(frozen=True)
+class BankSnapshot:
+    """
+    An immutable snapshot of the question bank.
+
+    Attributes:
+        version (int): The bank version the snapshot was loaded at.
+        question_ids (tuple[int, ...]): IDs of all questions in the bank.
+        topic_question_ids (dict[int, tuple[int, ...]]): Question IDs
+            grouped by topic ID.
+        questions (dict[int, QuestionResponseWithTopicAndAnswers]): Fully
+            hydrated question records (with topic and answers) by ID.
+    """
+
+    version: int = 0
+    question_ids: tuple[int, ...] = ()
+    topic_question_ids: dict[int, tuple[int, ...]] = field(
+        default_factory=dict)
+    questions: dict[int, QuestionResponseWithTopicAndAnswers] = field(
+        default_factory=dict)
+
+
+class QuestionBank:
+    """
+    In-memory index of questions, answers and topics.
+
+    The current snapshot is replaced atomically on every refresh, so readers
+    never observe a partially loaded bank. With a snapshot path, snapshots
+    are memory-mapped files shared by all worker processes.
+
+    Methods:
+        load: (Re)load the bank from the database.
+        attach: Load the bank unless an up-to-date snapshot exists.
+        on_change: Schedule a reload after a change of the bank.
+        get_random_question: Pick a random question from the whole bank.
+        get_random_question_by_topic: Pick a random question for a topic.
+        sample_questions: Pick several distinct random questions.
+        get_seeded_ticket: Build a reproducible ticket for a seed.
+    """
+
+    def __init__(
+        self,
+        ticket_cache_size: int = 1024,
+        snapshot_path: str | None = None,
+        session_factory: sessionmaker | None = None
+    ):
+        self._snapshot: BankSnapshot | MappedSnapshot = BankSnapshot()
+        self._snapshot_path = snapshot_path
+        self._session_factory = session_factory
+        self._reload_version = 0
+        self._reload_task: asyncio.Task | None = None
+        self._next_snapshot_check = 0.0
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._ticket_cache_size = ticket_cache_size
+        self._ticket_cache: OrderedDict[
+            tuple[int, int], list[QuestionResponseWithTopicAndAnswers]
+        ] = OrderedDict()
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Whether the bank has been loaded at least once.
+        """
+        return self._loaded
+
+    @property
+    def version(self) -> int:
+        """
+        The version of the current snapshot.
+        """
+        return self.snapshot.version
+
+    @property
+    def snapshot(self) -> BankSnapshot | MappedSnapshot:
+        """
+        The current snapshot of the bank. A shared snapshot is remapped
+        (at most every SNAPSHOT_CHECK_INTERVAL seconds) once its file has
+        been replaced.
+        """
+        if (self._snapshot_path is not None and self._loaded
+                and time.monotonic() >= self._next_snapshot_check):
+            self._next_snapshot_check = (
+                time.monotonic() + SNAPSHOT_CHECK_INTERVAL)
+            try:
+                stat = os.stat(self._snapshot_path)
+            except FileNotFoundError:
+                return self._snapshot
+            if (stat.st_ino, stat.st_mtime_ns) != self._snapshot.file_id:
+                self._map_snapshot()
+        return self._snapshot
+
+    def _publish(self, snapshot: BankSnapshot | MappedSnapshot) -> None:
+        self._snapshot = snapshot
+        self._loaded = True
+        self._ticket_cache.clear()
+
+    async def load(
+        self,
+        session: AsyncSession,
+        if_older_than: int | None = None
+    ) -> BankSnapshot | MappedSnapshot:
+        """
+        Load all questions that belong to a topic, with their answers and
+        topic, into memory and publish them as a new snapshot. With a
+        snapshot path, the shared snapshot file is rebuilt and mapped
+        instead.
+
+        Args:
+            session (AsyncSession): The current database session.
+            if_older_than (int | None): Keep the current snapshot (or the
+                shared file) if its version is at least this one; None
+                always reloads.
+
+        Returns:
+            BankSnapshot | MappedSnapshot: The published snapshot.
+        """
+        async with self._lock:
+            if self._snapshot_path is not None:
+                await build_snapshot(
+                    session, self._snapshot_path, if_older_than)
+                self._map_snapshot()
+                return self._snapshot
+
+            if (if_older_than is not None and self._loaded
+                    and self._snapshot.version >= if_older_than):
+                return self._snapshot
+
+            # The version is read before the data, so the data includes
+            # every change the version covers.
+            version = await change_bus.current_version(session)
+            result = await session.execute(
+                select(Question)
+                .options(
+                    selectinload(Question.answers),
+                    joinedload(Question.topic)
+                )
+                .where(Question.topic_id.is_not(None))
+                .order_by(Question.id)
+            )
+            questions = {}
+            topic_question_ids = {}
+            for question in result.scalars().all():
+                questions[question.id] = (
+                    QuestionResponseWithTopicAndAnswers.model_validate(
+                        question)
+                )
+                topic_question_ids.setdefault(
+                    question.topic_id, []).append(question.id)
+
+            self._publish(BankSnapshot(
+                version=version,
+                question_ids=tuple(questions),
+                topic_question_ids={
+                    topic_id: tuple(ids)
+                    for topic_id, ids in topic_question_ids.items()
+                },
+                questions=questions,
+            ))
+            return self._snapshot
+
+    async def attach(
+        self,
+        session: AsyncSession
+    ) -> BankSnapshot | MappedSnapshot:
+        """
+        Make the bank available in this process: map the shared snapshot,
+        (re)building it first unless it is up to date with the current bank
+        version and matches the database, or (without a snapshot path) load
+        the bank from the database.
+
+        Bank versions only count changes of this process on databases other
+        than PostgreSQL, so there an existing snapshot file (e.g. left by an
+        earlier run) cannot be trusted and is always rebuilt.
+
+        Args:
+            session (AsyncSession): The current database session.
+
+        Returns:
+            BankSnapshot | MappedSnapshot: The published snapshot.
+        """
+        if_older_than = None
+        if change_bus.shares_versions(session):
+            if_older_than = await change_bus.current_version(session)
+        return await self.load(session, if_older_than=if_older_than)
+
+    def _map_snapshot(self) -> None:
+        snapshot = MappedSnapshot(self._snapshot_path)
+        if not self._loaded or snapshot.file_id != self._snapshot.file_id:
+            self._publish(snapshot)
+
+    def on_change(self, change_event: ChangeEvent) -> None:
+        """
+        Schedule a reload of a loaded bank after a change of its topics,
+        questions or answers. Changes arriving during the delay (or the
+        reload) are covered by the same (or one more) reload.
+
+        Args:
+            change_event (ChangeEvent): The change announced on the bus.
+        """
+        if (not self._loaded or self._session_factory is None
+                or not change_event.affects(*BANK_TABLES)):
+            return
+        self._reload_version = max(self._reload_version, change_event.version)
+        if self._reload_task is None:
+            self._reload_task = asyncio.get_running_loop().create_task(
+                self._reload())
+
+    async def _reload(self) -> None:
+        await asyncio.sleep(RELOAD_DELAY)
+        self._reload_task = None
+        try:
+            async with self._session_factory() as session:
+                await self.load(session, if_older_than=self._reload_version)
+        except Exception:
+            logger.exception('Failed to reload the question bank.')
+
+    def get_random_question(
+        self
+    ) -> QuestionResponseWithTopicAndAnswers | None:
+        """
+        Pick a random question from the whole bank.
+
+        Returns:
+            QuestionResponseWithTopicAndAnswers | None: A random question
+            if the bank is not empty, otherwise None.
+        """
+        snapshot = self.snapshot
+        if not snapshot.question_ids:
+            return None
+        return snapshot.questions[random.choice(snapshot.question_ids)]
+
+    def get_random_question_by_topic(
+        self,
+        topic_id: int
+    ) -> QuestionResponseWithTopicAndAnswers | None:
+        """
+        Pick a random question for the specified topic.
+
+        Args:
+            topic_id (int): The ID of the topic.
+
+        Returns:
+            QuestionResponseWithTopicAndAnswers | None: A random question
+            of the topic if any exist, otherwise None.
+        """
+        snapshot = self.snapshot
+        question_ids = snapshot.topic_question_ids.get(topic_id)
+        if not question_ids:
+            return None
+        return snapshot.questions[random.choice(question_ids)]
+
+    def sample_questions(
+        self,
+        count: int,
+        topic_id: int | None = None,
+        exclude: Iterable[int] = ()
+    ) -> list[QuestionResponseWithTopicAndAnswers]:
+        """
+        Pick up to ``count`` distinct random questions (sampling without
+        replacement), optionally limited to one topic and skipping
+        excluded question IDs.
+
+        Args:
+            count (int): The maximum number of questions to return.
+            topic_id (int | None): Restrict the sample to this topic.
+            exclude (Iterable[int]): Question IDs that must not be returned.
+
+        Returns:
+            list[QuestionResponseWithTopicAndAnswers]: The sampled questions;
+            fewer than ``count`` if the pool is too small.
+        """
+        snapshot = self.snapshot
+        if topic_id is None:
+            pool = snapshot.question_ids
+        else:
+            pool = snapshot.topic_question_ids.get(topic_id, ())
+        excluded = set(exclude)
+
+        # Drawing extra items for the excluded IDs keeps the sample uniform
+        # without filtering the whole pool.
+        sample = random.sample(pool, min(len(pool), count + len(excluded)))
+        return [
+            snapshot.questions[question_id]
+            for question_id in sample
+            if question_id not in excluded
+        ][:count]
+
+    def get_seeded_ticket(
+        self,
+        seed: int
+    ) -> list[QuestionResponseWithTopicAndAnswers]:
+        """
+        Build a ticket (one question per topic, ordered by topic) whose
+        questions and answer order depend only on the seed and the bank
+        contents. Tickets are kept in a bounded LRU cache keyed by
+        (seed, bank version).
+
+        Args:
+            seed (int): The seed of the ticket.
+
+        Returns:
+            list[QuestionResponseWithTopicAndAnswers]: The ticket.
+        """
+        snapshot = self.snapshot
+        key = (seed, snapshot.version)
+        ticket = self._ticket_cache.get(key)
+        if ticket is not None:
+            self._ticket_cache.move_to_end(key)
+            return ticket
+
+        rng = random.Random(seed)
+        ticket = []
+        for topic_id in sorted(snapshot.topic_question_ids):
+            question = snapshot.questions[
+                rng.choice(snapshot.topic_question_ids[topic_id])]
+            answers = list(question.answers)
+            rng.shuffle(answers)
+            ticket.append(question.model_copy(update={'answers': answers}))
+
+        self._ticket_cache[key] = ticket
+        if len(self._ticket_cache) > self._ticket_cache_size:
+            self._ticket_cache.popitem(last=False)
+        return ticket
+
+
+#: The process-wide question bank index.
+question_bank = QuestionBank(
+    settings.ticket_cache_size,
+    settings.question_bank_snapshot_path,
+    AsyncSessionLocal
+)
+change_bus.subscribe(question_bank.on_change)
@@ -0,0 +1,269 @@
+"""
+This module caches serialized responses of read routes that serve nearly
+static data (topics, categories, questions of a topic).
+
+Responses are stored as JSON bytes in a pluggable backend: an in-process
+LRU with a TTL, or Redis shared by all workers. Every key contains the
+bank version of the last change of the question bank announced on the
+change bus (see ``db_models.changes``), so such a change makes all older
+entries unreachable at once, while changes of other tables (users) keep
+them. Off PostgreSQL bank versions count the changes of one process only,
+so keys also contain the process's origin and entries are never shared.
+The TTL bounds staleness the bus cannot see (e.g. read replica lag).
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Awaitable, Callable
+
+from prometheus_client import Counter
+from pydantic import TypeAdapter
+from starlette.responses import Response
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from db_models.changes import (
+    QUESTION_BANK_TABLES, ChangeEvent, change_bus)
+
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_REQUESTS = Counter(
+    'response_cache_requests_total',
+    'Response cache lookups by result (hit or miss).',
+    ['namespace', 'result'],
+)
+RESPONSE_CACHE_EVICTIONS = Counter(
+    'response_cache_evictions_total',
+    'Responses evicted from the in-process cache to make room.',
+)
+
+
+class CacheBackend(ABC):
+    """
+    Storage of serialized responses.
+
+    Methods:
+        get: Return the value of a key.
+        set: Store a value.
+        close: Release the backend's resources.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """
+        Return the value stored for a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            bytes | None: The value, or None on a miss.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes) -> None:
+        """
+        Store a value for the backend's TTL.
+
+        Args:
+            key (str): The cache key.
+            value (bytes): The serialized response.
+        """
+
+    async def close(self) -> None:
+        """
+        Release the backend's resources.
+        """
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    A size-bounded in-process LRU cache with a TTL.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Args:
+            max_size (int): The maximum number of responses.
+            ttl (float): Seconds a response stays fresh.
+        """
+        self._cache: TTLCache[bytes] = TTLCache(max_size, ttl)
+
+    async def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        evictions = self._cache.evictions
+        self._cache.set(key, value)
+        RESPONSE_CACHE_EVICTIONS.inc(self._cache.evictions - evictions)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    A cache in Redis, shared by all workers. Entries expire after the TTL;
+    memory limits are left to the server's eviction policy, whose
+    evictions Redis reports itself (``evicted_keys``).
+
+    Redis errors are logged and treated as misses, so an unavailable
+    Redis slows requests down instead of failing them.
+    """
+
+    def __init__(self, client, ttl: float, prefix: str = 'response:'):
+        """
+        Args:
+            client: An asyncio Redis client (``redis.asyncio.Redis``).
+            ttl (float): Seconds a response stays fresh.
+            prefix (str): A prefix of all keys.
+        """
+        self._client = client
+        self._ttl_ms = max(1, int(ttl * 1000))
+        self._prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return await self._client.get(self._prefix + key)
+        except Exception:
+            logger.warning('Response cache read failed.', exc_info=True)
+            return None
+
+    async def set(self, key: str, value: bytes) -> None:
+        try:
+            await self._client.set(self._prefix + key, value, px=self._ttl_ms)
+        except Exception:
+            logger.warning('Response cache write failed.', exc_info=True)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+@lru_cache
+def _adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+class ResponseCache:
+    """
+    Caches the JSON responses of read routes in a backend, under keys that
+    include the current bank version.
+
+    Methods:
+        on_change: Follow the changes of the question bank.
+        get_or_set: Return a cached response or build and cache it.
+        close: Close the backend.
+    """
+
+    def __init__(self, backend: CacheBackend | None):
+        """
+        Args:
+            backend (CacheBackend | None): The storage; None disables
+                caching.
+        """
+        self.backend = backend
+        self.version: int | None = None
+
+    def on_change(self, change_event: ChangeEvent) -> None:
+        """
+        Move keys to the version of a committed change of the question
+        bank (in this or another worker); changes of other tables keep
+        the cached responses.
+
+        Args:
+            change_event (ChangeEvent): The announced change.
+        """
+        if change_event.affects(*QUESTION_BANK_TABLES):
+            self.version = max(self.version or 0, change_event.version)
+
+    def key(self, namespace: str, *parts) -> str:
+        """
+        Build the cache key of a response.
+
+        Args:
+            namespace (str): The cached route.
+            *parts: The route parameters the response depends on.
+
+        Returns:
+            str: The key, including the bank version (the bus version on
+            the first lookup until the bank changes) and, if versions are
+            per process, the process's origin.
+        """
+        if self.version is None:
+            self.version = change_bus.version
+        scope = (() if change_bus.shares_versions()
+                 else (change_bus.origin,))
+        return ':'.join(
+            (namespace, *scope, f'v{self.version}', *map(str, parts)))
+
+    async def get_or_set(
+            self,
+            namespace: str,
+            parts: tuple,
+            response_type: Any,
+            load: Callable[[], Awaitable[Any]],
+    ) -> Response | Any:
+        """
+        Return the cached response for a route and its parameters, or load
+        the data, serialize it with the response type and cache it.
+
+        The key is built before loading, so data loaded while a change is
+        being committed is stored under the outdated version and never
+        served after the change.
+
+        Args:
+            namespace (str): The cached route.
+            parts (tuple): The route parameters the response depends on.
+            response_type (Any): The type of the response (e.g. the route's
+                ``response_model``), used to serialize the loaded data.
+            load (Callable[[], Awaitable[Any]]): Loads the data on a miss;
+                exceptions (e.g. a 404) propagate and nothing is cached.
+
+        Returns:
+            Response: A JSON response (the loaded data itself if caching
+            is disabled).
+        """
+        if self.backend is None:
+            return await load()
+
+        adapter = _adapter(response_type)
+        key = self.key(namespace, *parts)
+        body = await self.backend.get(key)
+        if body is not None:
+            RESPONSE_CACHE_REQUESTS.labels(namespace, 'hit').inc()
+            return Response(body, media_type='application/json')
+
+        RESPONSE_CACHE_REQUESTS.labels(namespace, 'miss').inc()
+        data = adapter.validate_python(await load(), from_attributes=True)
+        body = adapter.dump_json(data)
+        await self.backend.set(key, body)
+        return Response(body, media_type='application/json')
+
+    async def close(self) -> None:
+        """
+        Close the backend.
+        """
+        if self.backend is not None:
+            await self.backend.close()
+
+
+def create_backend() -> CacheBackend | None:
+    """
+    Create the backend selected by the settings.
+
+    Returns:
+        CacheBackend | None: The backend, or None if caching is disabled.
+    """
+    if settings.response_cache_backend == 'memory':
+        return MemoryCacheBackend(
+            settings.response_cache_size, settings.response_cache_ttl)
+    if settings.response_cache_backend == 'redis':
+        from redis.asyncio import Redis
+
+        return RedisCacheBackend(
+            Redis.from_url(settings.redis_url), settings.response_cache_ttl)
+    return None
+
+
+#: The process-wide response cache.
+response_cache = ResponseCache(create_backend())
+change_bus.subscribe(response_cache.on_change)
@@ -1,18 +1,33 @@
 """
 This module integrates FastAPI Users with SQLAlchemy, providing user database
 and management functionalities (user creation, authentication, etc.).
+
+Users resolved from JWT subjects are kept in a short-lived cache, so
+authenticated requests skip the user lookup; the cache entry is dropped
+whenever the user is updated or deleted through the user manager, and in every
+worker once a change of the user is announced on the change bus. Passwords are
+hashed and verified in a bounded thread pool, off the event loop.
 """
 
+from typing import Any
+
 from fastapi import Depends, Request
+from fastapi.security import OAuth2PasswordRequestForm
 from fastapi_users import (
-    BaseUserManager, FastAPIUsers, IntegerIDMixin, InvalidPasswordException)
+    BaseUserManager, FastAPIUsers, IntegerIDMixin, InvalidPasswordException,
+    exceptions, schemas)
 from fastapi_users.authentication import (
     AuthenticationBackend, BearerTransport, JWTStrategy)
 from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.db_config import get_async_session
+from app.core.password_hashing import PreparedPasswordHelper, password_hasher
+from db_models.changes import USER_TABLE, ChangeEvent, change_bus
 from db_models.user import User
 from app.schemas.user import UserCreate
 
@@ -52,16 +67,154 @@ auth_backend = AuthenticationBackend(
 )
 
 
+#: Column values of recently resolved users by user ID (the JWT subject).
+user_cache: TTLCache[dict[str, Any]] = TTLCache(
+    settings.auth_cache_size, settings.auth_cache_ttl)
+
+
+def invalidate_changed_users(change_event: ChangeEvent) -> None:
+    """
+    Drop users changed by a committed change (in this or another worker)
+    from the user cache.
+
+    Args:
+        change_event (ChangeEvent): The announced change.
+    """
+    user_ids = change_event.ids(USER_TABLE)
+    if user_ids is None:
+        user_cache.clear()
+        return
+    for user_id in user_ids:
+        user_cache.invalidate(user_id)
+
+
+change_bus.subscribe(invalidate_changed_users)
+
+
 class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
     """
     A user manager extending FastAPI Users' BaseUserManager for integer-based IDs.
 
+    Password hashing and verification run in the bounded thread pool of
+    ``password_hasher`` instead of on the event loop: the overridden
+    methods compute them beforehand and the upstream implementations pick
+    the results up from a PreparedPasswordHelper.
+
     Methods:
+        get: Get a user by ID, from the user cache if possible.
+        create: Create a user, hashing the password off the event loop.
+        authenticate: Check credentials, verifying the password off
+            the event loop.
+        _update: Update a user, hashing a new password off the event loop.
         validate_password: Perform custom password checks
             (length, no email in password).
         on_after_register: Action to perform after user registration.
+        on_after_update: Drop the updated user from the user cache.
+        on_after_verify: Drop the verified user from the user cache.
+        on_after_reset_password: Drop the user from the user cache.
+        on_after_delete: Drop the deleted user from the user cache.
     """
 
+    def __init__(self, user_db: SQLAlchemyUserDatabase):
+        """
+        Args:
+            user_db (SQLAlchemyUserDatabase): The user database adapter.
+        """
+        super().__init__(user_db, PreparedPasswordHelper(password_hasher))
+
+    async def get(self, id: int) -> User:
+        """
+        Get a user by ID. This is how JWT subjects are resolved, so
+        cached users spare authenticated requests a query.
+
+        Cached users are merged into the current session without loading,
+        so the returned user can be updated like a freshly loaded one.
+
+        Args:
+            id (int): The ID of the user.
+
+        Returns:
+            User: The user.
+
+        Raises:
+            UserNotExists: If the user does not exist.
+        """
+        values = user_cache.get(id)
+        if values is None:
+            user = await super().get(id)
+            user_cache.set(id, {
+                attr.key: getattr(user, attr.key)
+                for attr in inspect(User).column_attrs
+            })
+            return user
+
+        user = User(**values)
+        make_transient_to_detached(user)
+        return await self.user_db.session.merge(user, load=False)
+
+    async def create(
+        self,
+        user_create: schemas.UC,
+        safe: bool = False,
+        request: Request | None = None,
+    ) -> User:
+        """
+        Create a user (see ``BaseUserManager.create``), hashing the password
+        in the pool beforehand. Taken e-mails are rejected before the
+        password is hashed.
+
+        Args:
+            user_create (UserCreate): The user to create.
+            safe (bool): Ignore sensitive values like is_superuser
+                or is_verified.
+            request (Request | None): Optional FastAPI request object.
+
+        Returns:
+            User: The new user.
+
+        Raises:
+            UserAlreadyExists: If a user with the e-mail already exists.
+        """
+        await self.validate_password(user_create.password, user_create)
+        if await self.user_db.get_by_email(user_create.email) is not None:
+            raise exceptions.UserAlreadyExists()
+        await self.password_helper.prepare_hash(user_create.password)
+        return await super().create(user_create, safe, request)
+
+    async def authenticate(
+        self,
+        credentials: OAuth2PasswordRequestForm
+    ) -> User | None:
+        """
+        Authenticate a user by e-mail and password
+        (see ``BaseUserManager.authenticate``), verifying the password
+        (or, for unknown e-mails, hashing it) in the pool beforehand.
+
+        Args:
+            credentials (OAuth2PasswordRequestForm): The user credentials.
+
+        Returns:
+            User | None: The user if the credentials are valid.
+        """
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            await self.password_helper.prepare_hash(credentials.password)
+        else:
+            await self.password_helper.prepare_verify(
+                credentials.password, user.hashed_password)
+        return await super().authenticate(credentials)
+
+    async def _update(self, user: User, update_dict: dict[str, Any]) -> User:
+        """
+        Apply a user update, hashing a new password in the pool beforehand.
+        """
+        password = update_dict.get('password')
+        if password is not None:
+            await self.validate_password(password, user)
+            await self.password_helper.prepare_hash(password)
+        return await super()._update(user, update_dict)
+
     async def validate_password(
         self,
         password: str,
@@ -99,6 +252,59 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
         """
         print(f'User {user.email} has been registered.')
 
+    async def on_after_update(
+            self,
+            user: User,
+            update_dict: dict[str, Any],
+            request: Request | None = None
+    ):
+        """
+        Hook method called after a user is updated (including activation
+        and superuser changes).
+
+        Args:
+            user (User): The updated user.
+            update_dict (dict[str, Any]): The changed fields.
+            request (Request | None): Optional FastAPI request object.
+        """
+        user_cache.invalidate(user.id)
+
+    async def on_after_verify(
+            self, user: User, request: Request | None = None
+    ):
+        """
+        Hook method called after a user is verified.
+
+        Args:
+            user (User): The verified user.
+            request (Request | None): Optional FastAPI request object.
+        """
+        user_cache.invalidate(user.id)
+
+    async def on_after_reset_password(
+            self, user: User, request: Request | None = None
+    ):
+        """
+        Hook method called after a user resets their password.
+
+        Args:
+            user (User): The user.
+            request (Request | None): Optional FastAPI request object.
+        """
+        user_cache.invalidate(user.id)
+
+    async def on_after_delete(
+            self, user: User, request: Request | None = None
+    ):
+        """
+        Hook method called after a user is deleted.
+
+        Args:
+            user (User): The deleted user.
+            request (Request | None): Optional FastAPI request object.
+        """
+        user_cache.invalidate(user.id)
+
 
 async def get_user_manager(user_db=Depends(get_user_db)):
     """
@@ -3,11 +3,20 @@ This module defines a generic CRUD base class (CRUDBase) for SQLAlchemy models.
 It provides common operations (Create, Read, Update, Delete).
 """
 
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy import select
+from typing import AsyncIterator
+
+from sqlalchemy import (
+    ARRAY, Integer, any_, delete, insert, inspect, literal, select, update)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.util import identity_key
 
 from db_models import User
+from db_models.changes import record_changes
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+STREAM_BATCH_SIZE = 500
 
 
 class CRUDBase:
@@ -23,45 +32,167 @@ class CRUDBase:
             model: The SQLAlchemy model class.
         """
         self.model = model
+        self._columns = frozenset(inspect(model).columns.keys())
 
     async def get(
             self,
             obj_id: int,
             session: AsyncSession,
+            options: tuple = ()
     ):
         """
         Retrieve a single object by its ID.
 
+        Objects already loaded in the session (which lives for one request)
+        are returned from its identity map without a query, unless loader
+        options are given: those may ask for relationships the cached
+        object lacks, so the object is then reloaded with them.
+
         Args:
             obj_id (int): The primary key of the object.
             session (AsyncSession): The current database session.
+            options (tuple): Loader options applied to the query.
 
         Returns:
             The model instance if found, otherwise None.
         """
-        db_obj = await session.execute(
-            select(self.model).where(
-                self.model.id == obj_id
-            )
+        return await session.get(
+            self.model,
+            obj_id,
+            options=options,
+            populate_existing=bool(options) and (
+                identity_key(self.model, obj_id) in session.identity_map)
         )
-        return db_obj.scalars().first()
+
+    def _ids_filter(
+            self,
+            obj_ids: list[int],
+            session: AsyncSession,
+            column=None
+    ):
+        """
+        Build a filter matching the given IDs (in ``column``, the primary
+        key by default). PostgreSQL gets a single array parameter
+        (``id = ANY(:ids)``), so the statement is the same for any number
+        of IDs and its prepared form can be reused.
+        """
+        column = self.model.id if column is None else column
+        if session.bind.dialect.name == 'postgresql':
+            return column == any_(literal(obj_ids, ARRAY(Integer)))
+        return column.in_(obj_ids)
+
+    async def get_by_ids(
+            self,
+            obj_ids,
+            session: AsyncSession,
+            options: tuple = ()
+    ) -> dict:
+        """
+        Retrieve many objects by their IDs with a single query
+        (joined eager loads of collections included).
+
+        Args:
+            obj_ids: The primary keys of the objects.
+            session (AsyncSession): The current database session.
+            options (tuple): Loader options applied to the query.
+
+        Returns:
+            dict: Found model instances keyed by ID.
+        """
+        obj_ids = sorted(set(obj_ids))
+        if not obj_ids:
+            return {}
+        db_objs = await session.execute(
+            select(self.model)
+            .options(*options)
+            .where(self._ids_filter(obj_ids, session))
+        )
+        return {
+            db_obj.id: db_obj for db_obj in db_objs.scalars().unique().all()}
+
+    async def get_existing_ids(
+            self,
+            obj_ids,
+            session: AsyncSession,
+    ) -> set[int]:
+        """
+        Find which of the given IDs exist, using a single query.
+
+        Args:
+            obj_ids: The primary keys to look up.
+            session (AsyncSession): The current database session.
+
+        Returns:
+            set[int]: The IDs that exist in the database.
+        """
+        obj_ids = set(obj_ids)
+        if not obj_ids:
+            return set()
+        db_ids = await session.execute(
+            select(self.model.id).where(self.model.id.in_(obj_ids))
+        )
+        return set(db_ids.scalars().all())
 
     async def get_multi(
             self,
-            session: AsyncSession
+            session: AsyncSession,
+            after_id: int | None = None,
+            limit: int = DEFAULT_PAGE_SIZE
     ):
         """
-        Retrieve all objects of this model.
+        Retrieve one page of objects of this model using keyset pagination.
+
+        Objects are ordered by ID; the next page starts after the ID of the
+        last object of the previous one.
 
         Args:
             session (AsyncSession): The current database session.
+            after_id (int | None): Return only objects with a greater ID.
+            limit (int): The page size, capped at MAX_PAGE_SIZE.
 
         Returns:
-            A list of all model instances.
+            A list of model instances.
         """
-        db_objs = await session.execute(select(self.model))
+        query = (
+            select(self.model)
+            .order_by(self.model.id)
+            .limit(min(limit, MAX_PAGE_SIZE))
+        )
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        db_objs = await session.execute(query)
         return db_objs.scalars().all()
 
+    async def stream(
+            self,
+            session: AsyncSession,
+            after_id: int | None = None,
+            options: tuple = ()
+    ) -> AsyncIterator:
+        """
+        Iterate over all objects of this model ordered by ID, fetching them
+        from a server-side cursor in batches of STREAM_BATCH_SIZE rows.
+
+        Args:
+            session (AsyncSession): The current database session.
+            after_id (int | None): Start after the object with this ID.
+            options (tuple): Loader options applied to the query.
+
+        Yields:
+            Model instances, one at a time.
+        """
+        query = (
+            select(self.model)
+            .options(*options)
+            .order_by(self.model.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        db_objs = await session.stream_scalars(query)
+        async for db_obj in db_objs:
+            yield db_obj
+
     async def create(
             self,
             obj_in,
@@ -71,6 +202,9 @@ class CRUDBase:
         """
         Create a new object in the database.
 
+        The row is inserted with ``INSERT ... RETURNING``, so generated
+        values come back without a separate SELECT.
+
         Args:
             obj_in: A Pydantic model or dictionary containing creation data.
             session (AsyncSession): The current database session.
@@ -83,10 +217,11 @@ class CRUDBase:
         obj_in_data = obj_in.dict()
         if user is not None:
             obj_in_data['user_id'] = user.id
-        db_obj = self.model(**obj_in_data)
-        session.add(db_obj)
+        db_obj = await session.scalar(
+            insert(self.model).values(**obj_in_data).returning(self.model)
+        )
+        record_changes(session, self.model, (db_obj.id,))
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
     async def update(
@@ -98,25 +233,75 @@ class CRUDBase:
         """
         Update an existing object in the database.
 
+        Only the model's columns that were set in ``obj_in`` are written,
+        with ``UPDATE ... RETURNING``; the returned row refreshes
+        ``db_obj`` in the session.
+
         Args:
             db_obj: The current database model instance.
             obj_in: A Pydantic model or dictionary with updated data (exclude_unset fields).
             session (AsyncSession): The current database session.
 
         Returns:
-            The updated model instance.
+            The updated model instance, or None if the row was deleted in
+            the meantime.
         """
-        obj_data = jsonable_encoder(db_obj)
-        update_data = obj_in.dict(exclude_unset=True)
+        update_data = {
+            field: value
+            for field, value in obj_in.dict(exclude_unset=True).items()
+            if field in self._columns
+        }
+        if not update_data:
+            return db_obj
 
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
-        session.add(db_obj)
+        db_obj = await session.scalar(
+            update(self.model)
+            .where(self.model.id == db_obj.id)
+            .values(**update_data)
+            .returning(self.model)
+        )
+        if db_obj is None:
+            return None
+        record_changes(session, self.model, (db_obj.id,))
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
+    async def bulk_update(
+            self,
+            obj_ids,
+            obj_in,
+            session: AsyncSession,
+    ) -> list[int]:
+        """
+        Apply the same change to many objects with a single
+        ``UPDATE ... RETURNING id`` statement.
+
+        Args:
+            obj_ids: The IDs of the objects to update.
+            obj_in: A Pydantic model with the fields to set (exclude_unset
+                fields; fields that are not model columns are ignored).
+            session (AsyncSession): The current database session.
+
+        Returns:
+            list[int]: The sorted IDs of the updated objects.
+        """
+        update_data = {
+            field: value
+            for field, value in obj_in.dict(exclude_unset=True).items()
+            if field in self._columns
+        }
+        updated_ids = await session.scalars(
+            update(self.model)
+            .where(self._ids_filter(sorted(set(obj_ids)), session))
+            .values(**update_data)
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated_ids = sorted(updated_ids)
+        record_changes(session, self.model, updated_ids)
+        await session.commit()
+        return updated_ids
+
     async def remove(
             self,
             db_obj,
@@ -135,3 +320,30 @@ class CRUDBase:
         await session.delete(db_obj)
         await session.commit()
         return db_obj
+
+    async def bulk_remove(
+            self,
+            obj_ids,
+            session: AsyncSession,
+    ) -> list[int]:
+        """
+        Delete many objects with a single ``DELETE ... RETURNING id``
+        statement.
+
+        Args:
+            obj_ids: The IDs of the objects to delete.
+            session (AsyncSession): The current database session.
+
+        Returns:
+            list[int]: The sorted IDs of the deleted objects.
+        """
+        deleted_ids = await session.scalars(
+            delete(self.model)
+            .where(self._ids_filter(sorted(set(obj_ids)), session))
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted_ids = sorted(deleted_ids)
+        record_changes(session, self.model, deleted_ids)
+        await session.commit()
+        return deleted_ids
@@ -5,16 +5,39 @@ methods for retrieving random questions and generating a random 'ticket.'
 
 from random import randrange
 
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import (
+    delete, exists, insert, literal_column, select, func)
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.crud.base import CRUDBase
-from db_models import Question, Topic
+from app.schemas.question import QuestionCreateWithAnswers
+from db_models import Answer, Question
+from db_models.changes import record_changes
 
 
 QUESTION_LIMIT = 1
 
+#: The text search configuration used by the full-text search indexes.
+#: PostgreSQL ships no Czech configuration, so diacritics are removed with
+#: unaccent and words are matched without stemming.
+TEXT_SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+#: Loader options that fetch a question's answers and topic
+#: (usable with streaming, unlike a joined collection load).
+QUESTION_DETAIL_OPTIONS = (
+    selectinload(Question.answers),
+    joinedload(Question.topic),
+)
+
+#: Loader options that fetch a question with its answers and topic
+#: in a single query.
+QUESTION_JOINED_OPTIONS = (
+    joinedload(Question.answers),
+    joinedload(Question.topic),
+)
+
 
 class QuestionCRUD(CRUDBase):
     """
@@ -26,8 +49,12 @@ class QuestionCRUD(CRUDBase):
             available questions.
         get_random_question_by_topic: Retrieve a random question
             for a specific topic.
+        get_random_questions: Retrieve several distinct random questions.
         get_all_questions_by_topic: Retrieve all questions for a given topic.
         get_random_ticket: Retrieve a list of random questions (one per topic).
+        bulk_create_with_answers: Insert many questions with their answers.
+        bulk_remove: Delete many questions with their answers.
+        search: Find questions by text of the question or its answers.
     """
 
     async def get_question_with_answers(
@@ -48,10 +75,7 @@ class QuestionCRUD(CRUDBase):
         """
         result = await session.execute(
             select(Question)
-            .options(
-                joinedload(Question.answers),
-                joinedload(Question.topic)
-            )
+            .options(*QUESTION_JOINED_OPTIONS)
             .filter(Question.id == question_id)
         )
         return result.scalars().first()
@@ -123,6 +147,43 @@ class QuestionCRUD(CRUDBase):
         return await self.get_question_with_answers(
             random_question_id, session)
 
+    async def get_random_questions(
+        self,
+        count: int,
+        session: AsyncSession,
+        topic_id: int | None = None,
+        exclude: list[int] | None = None
+    ) -> list[Question]:
+        """
+        Retrieve up to ``count`` distinct random Questions with their
+        Answers and Topic.
+
+        Args:
+            count (int): The maximum number of questions to return.
+            session (AsyncSession): The current database session.
+            topic_id (int | None): Restrict the selection to this topic.
+            exclude (list[int] | None): Question IDs that must not
+                be returned.
+
+        Returns:
+            list[Question]: The randomly selected questions.
+        """
+        query = (
+            select(Question)
+            .options(
+                selectinload(Question.answers),
+                joinedload(Question.topic)
+            )
+            .order_by(func.random())
+            .limit(count)
+        )
+        if topic_id is not None:
+            query = query.filter(Question.topic_id == topic_id)
+        if exclude:
+            query = query.filter(Question.id.not_in(exclude))
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
     async def get_all_questions_by_topic(
             self,
             topic_id: int,
@@ -156,24 +217,208 @@ class QuestionCRUD(CRUDBase):
         """
         Create a "ticket" by retrieving one random question for each Topic.
 
+        The ticket is built with a single statement: questions are ranked
+        in random order within each topic by a window function, and the
+        first question of every topic is loaded together with its answers
+        and topic.
+
         Args:
             session (AsyncSession): The current database session.
 
         Returns:
             list[Question]: A list of randomly selected Question objects,
-            one per topic (if available).
+            one per topic (if available), ordered by topic.
+        """
+        ranked = (
+            select(
+                Question.id,
+                func.row_number().over(
+                    partition_by=Question.topic_id,
+                    order_by=func.random()
+                ).label('position')
+            )
+            .where(Question.topic_id.is_not(None))
+            .subquery()
+        )
+        result = await session.execute(
+            select(Question)
+            .join(ranked, ranked.c.id == Question.id)
+            .options(
+                joinedload(Question.answers),
+                joinedload(Question.topic)
+            )
+            .filter(ranked.c.position == 1)
+            .order_by(Question.topic_id, Question.id)
+        )
+        return list(result.unique().scalars().all())
+
+    async def bulk_create_with_answers(
+        self,
+        questions_in: list[QuestionCreateWithAnswers],
+        session: AsyncSession
+    ) -> list[Question]:
         """
-        ticket = []
-        topics_result = await session.execute(select(Topic.id))
-        topic_ids = topics_result.scalars().all()
+        Insert many questions and their answers in a single transaction,
+        using one multi-row INSERT ... RETURNING per table.
 
-        for topic_id in topic_ids:
-            random_question = await self.get_random_question_by_topic(
-                topic_id, session)
-            if random_question:
-                ticket.append(random_question)
+        Args:
+            questions_in (list[QuestionCreateWithAnswers]): The questions
+                to create, each carrying its answers.
+            session (AsyncSession): The current database session.
 
-        return ticket
+        Returns:
+            list[Question]: The created questions (in input order)
+            with their answers loaded.
+        """
+        questions = list(await session.scalars(
+            insert(Question).returning(
+                Question, sort_by_parameter_order=True),
+            [
+                question_in.model_dump(exclude={'answers'})
+                for question_in in questions_in
+            ]
+        ))
+
+        answers_data = [
+            {**answer_in.model_dump(), 'question_id': question.id}
+            for question, question_in in zip(questions, questions_in)
+            for answer_in in question_in.answers
+        ]
+        answers = []
+        if answers_data:
+            answers = list(await session.scalars(
+                insert(Answer).returning(
+                    Answer, sort_by_parameter_order=True),
+                answers_data
+            ))
+
+        answers_by_question = {}
+        for answer in answers:
+            answers_by_question.setdefault(answer.question_id, []).append(
+                answer)
+        for question in questions:
+            set_committed_value(
+                question, 'answers', answers_by_question.get(question.id, []))
+
+        record_changes(
+            session, Question, [question.id for question in questions])
+        record_changes(session, Answer, [answer.id for answer in answers])
+        await session.commit()
+        return questions
+
+    async def bulk_remove(
+        self,
+        obj_ids,
+        session: AsyncSession
+    ) -> list[int]:
+        """
+        Delete many questions, together with their answers, in one
+        transaction of two set-based DELETE statements.
+
+        Args:
+            obj_ids: The IDs of the questions to delete.
+            session (AsyncSession): The current database session.
+
+        Returns:
+            list[int]: The sorted IDs of the deleted questions.
+        """
+        obj_ids = sorted(set(obj_ids))
+        answer_ids = await session.scalars(
+            delete(Answer)
+            .where(self._ids_filter(obj_ids, session, Answer.question_id))
+            .returning(Answer.id)
+            .execution_options(synchronize_session=False)
+        )
+        record_changes(session, Answer, answer_ids)
+        return await super().bulk_remove(obj_ids, session)
+
+    async def search(
+        self,
+        query_text: str,
+        session: AsyncSession,
+        limit: int
+    ) -> list[Question]:
+        """
+        Find questions whose text, or the text of one of their answers,
+        matches the query.
+
+        On PostgreSQL this uses the full-text search indexes (diacritics are
+        ignored, so "obcanstvi" matches "občanství") and falls back to
+        trigram word similarity when nothing matches, which tolerates typos.
+        Other backends use a case-insensitive substring match, in which
+        ``%`` and ``_`` match themselves.
+
+        Args:
+            query_text (str): The search query.
+            session (AsyncSession): The current database session.
+            limit (int): The maximum number of questions to return.
+
+        Returns:
+            list[Question]: Matching questions with answers and topic,
+            best matches first.
+        """
+        if session.bind.dialect.name != 'postgresql':
+            escaped = (
+                query_text.replace('\\', '\\\\')
+                .replace('%', '\\%')
+                .replace('_', '\\_')
+            )
+            pattern = f'%{escaped}%'
+            result = await session.execute(
+                select(Question)
+                .options(*QUESTION_DETAIL_OPTIONS)
+                .filter(
+                    Question.text.ilike(pattern, escape='\\')
+                    | exists().where(
+                        Answer.question_id == Question.id,
+                        Answer.text.ilike(pattern, escape='\\')
+                    )
+                )
+                .order_by(Question.id)
+                .limit(limit)
+            )
+            return list(result.scalars().all())
+
+        ts_query = func.websearch_to_tsquery(
+            TEXT_SEARCH_CONFIG, func.immutable_unaccent(query_text))
+        question_document = func.to_tsvector(
+            TEXT_SEARCH_CONFIG, func.immutable_unaccent(Question.text))
+        answer_document = func.to_tsvector(
+            TEXT_SEARCH_CONFIG, func.immutable_unaccent(Answer.text))
+        result = await session.execute(
+            select(Question)
+            .options(*QUESTION_DETAIL_OPTIONS)
+            .filter(
+                question_document.bool_op('@@')(ts_query)
+                | exists().where(
+                    Answer.question_id == Question.id,
+                    answer_document.bool_op('@@')(ts_query)
+                )
+            )
+            .order_by(
+                func.ts_rank(question_document, ts_query).desc(),
+                Question.id
+            )
+            .limit(limit)
+        )
+        questions = list(result.scalars().all())
+        if questions:
+            return questions
+
+        normalized_query = func.immutable_unaccent(func.lower(query_text))
+        normalized_text = func.immutable_unaccent(func.lower(Question.text))
+        result = await session.execute(
+            select(Question)
+            .options(*QUESTION_DETAIL_OPTIONS)
+            .filter(normalized_query.bool_op('<%')(normalized_text))
+            .order_by(
+                func.word_similarity(
+                    normalized_query, normalized_text).desc(),
+                Question.id
+            )
+            .limit(limit)
+        )
+        return list(result.scalars().all())
 
 
 question_crud = QuestionCRUD(Question)
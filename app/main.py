@@ -1,7 +1,7 @@
 """
 This module initializes the main FastAPI application, registers the main router
 and admin interface, and sets up any necessary resources (such as a superuser)
-on application startup.
+on application startup. It also exposes Prometheus metrics on ``/metrics``.
 """
 
 from fastapi import FastAPI
@@ -9,8 +9,20 @@ from fastapi.staticfiles import StaticFiles
 
 from app.api.routers import main_router
 from app.core.config import settings
-from app.core.init_db import create_first_superuser
-from app.admin import create_admin
+from app.core.db_config import engine, read_engine
+from app.core.metrics import (
+    MetricsMiddleware,
+    instrument_engine,
+    metrics_endpoint,
+)
+from app.core.query_budget import (
+    QueryBudgetMiddleware,
+    enable_query_tracking,
+)
+from app.core.init_db import create_first_superuser, load_question_bank
+from app.core.response_cache import response_cache
+from app.admin import mount_admin
+from db_models.changes import change_bus
 
 
 app = FastAPI(
@@ -23,8 +35,24 @@ app.mount("/admin/statics", StaticFiles(directory="static/admin"), name="admin_s
 # Include the main router with all defined endpoints
 app.include_router(main_router)
 
-# Create and configure the admin interface
-create_admin(app)
+# Create and configure the admin interface (on its first request if lazy)
+mount_admin(app, lazy=settings.lazy_admin)
+
+# Record per-route request and database metrics
+app.add_middleware(MetricsMiddleware)
+app.add_route('/metrics', metrics_endpoint, include_in_schema=False)
+instrument_engine(engine)
+instrument_engine(read_engine)
+
+# Track SQL statements per request and enforce the optional query budget
+enable_query_tracking(engine)
+enable_query_tracking(read_engine)
+if settings.query_budget is not None:
+    app.add_middleware(
+        QueryBudgetMiddleware,
+        budget=settings.query_budget,
+        raise_on_exceed=settings.query_budget_raise
+    )
 
 
 @app.on_event('startup')
@@ -32,7 +60,23 @@ async def startup():
     """
     Event handler that runs when the application starts.
 
-    Creates the first superuser in the database if none exists.
+    Creates the first superuser in the database if none exists, starts
+    listening for changes of the question bank made by other processes
+    and loads the in-memory question bank.
     """
     await create_first_superuser()
+    await change_bus.start()
+    await load_question_bank()
+
+
+@app.on_event('shutdown')
+async def shutdown():
+    """
+    Event handler that runs when the application stops.
+
+    Stops listening for changes of the question bank and closes the
+    response cache.
+    """
+    await change_bus.stop()
+    await response_cache.close()
 
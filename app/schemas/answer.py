@@ -4,6 +4,8 @@ This module contains Pydantic schemas for handling Answer data.
 
 from pydantic import BaseModel, Field
 
+from .bulk import BulkUpdate
+
 
 MIN_NAME_LENGTH = 1
 MAX_NAME_LENGTH = 200
@@ -38,6 +40,25 @@ class AnswerCreate(AnswerBase):
     pass
 
 
+class AnswerNestedCreate(BaseModel):
+    """
+    Schema for an Answer created together with its Question.
+
+    Attributes:
+        text (str): The text content of the answer.
+        image_url (str | None): An optional image URL.
+        is_correct (bool): Indicates whether the answer is correct.
+    """
+
+    text: str = Field(
+        ...,
+        min_length=MIN_NAME_LENGTH,
+        max_length=MAX_NAME_LENGTH
+    )
+    image_url: str | None = None
+    is_correct: bool = False
+
+
 class AnswerUpdate(AnswerBase):
     """
     Schema for updating an existing Answer.
@@ -57,6 +78,22 @@ class AnswerUpdate(AnswerBase):
     question_id: int | None
 
 
+class AnswerBulkUpdate(BulkUpdate):
+    """
+    Schema for updating many Answers at once.
+
+    Fields:
+        ids (list[int]): The IDs of the answers.
+        is_correct (bool | None): Mark the answers as correct or incorrect.
+        question_id (int | None): Move the answers to this question.
+    """
+
+    non_nullable_fields = ('is_correct', 'question_id')
+
+    is_correct: bool | None = None
+    question_id: int | None = None
+
+
 class AnswerResponse(BaseModel):
     """
     Response schema for an Answer entity.
@@ -0,0 +1,61 @@
+"""
+This module contains Pydantic schemas shared by the bulk update and
+bulk delete endpoints.
+"""
+
+from typing import ClassVar
+
+from pydantic import BaseModel, Field, model_validator
+
+
+MAX_BULK_IDS = 10000
+
+
+class BulkIds(BaseModel):
+    """
+    Request schema selecting many objects by ID.
+
+    Attributes:
+        ids (list[int]): The IDs of the objects.
+    """
+
+    ids: list[int] = Field(..., min_length=1, max_length=MAX_BULK_IDS)
+
+
+class BulkUpdate(BulkIds):
+    """
+    Base request schema for bulk updates: the selected IDs plus the fields
+    to set on all of them. At least one field must be given.
+
+    Attributes:
+        non_nullable_fields (tuple[str, ...]): Optional fields that must
+            not be set to null explicitly.
+    """
+
+    non_nullable_fields: ClassVar[tuple[str, ...]] = ()
+
+    @model_validator(mode='after')
+    def check_changes(self):
+        """
+        Ensure the request changes at least one field and does not clear
+        a non-nullable one.
+        """
+        if not self.model_fields_set - {'ids'}:
+            raise ValueError('At least one field to update is required.')
+        for field in self.non_nullable_fields:
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f'{field} cannot be null.')
+        return self
+
+
+class BulkResult(BaseModel):
+    """
+    Response schema of a bulk update or delete.
+
+    Attributes:
+        ids (list[int]): IDs of the updated or deleted objects.
+        missing_ids (list[int]): Requested IDs that do not exist.
+    """
+
+    ids: list[int]
+    missing_ids: list[int]
@@ -0,0 +1,53 @@
+"""
+This module contains Pydantic schemas for monitoring endpoints.
+"""
+
+from pydantic import BaseModel
+
+
+class PoolStatus(BaseModel):
+    """
+    Response schema describing the database connection pool.
+
+    Occupancy fields are None for pools that do not keep connections
+    (e.g. SQLite's NullPool).
+
+    Attributes:
+        pool_class (str): The class name of the pool.
+        size (int | None): The configured pool size.
+        checked_out (int | None): Connections currently in use.
+        idle (int | None): Open connections waiting in the pool.
+        overflow (int | None): Connections currently open above the size.
+        max_overflow (int | None): The configured overflow limit.
+        checkouts (int): Connection requests served since startup.
+        timeouts (int): Connection requests that timed out since startup.
+        wait_time_total_ms (float): Total time spent waiting for
+            connections, in milliseconds.
+        wait_time_max_ms (float): The longest wait for a connection,
+            in milliseconds.
+    """
+
+    pool_class: str
+    size: int | None
+    checked_out: int | None
+    idle: int | None
+    overflow: int | None
+    max_overflow: int | None
+    checkouts: int
+    timeouts: int
+    wait_time_total_ms: float
+    wait_time_max_ms: float
+
+
+class DatabasePoolsStatus(BaseModel):
+    """
+    Response schema describing the connection pools of both engines.
+
+    Attributes:
+        primary (PoolStatus): The pool of the primary database.
+        replica (PoolStatus | None): The pool of the read replica, or None
+            if read-only traffic uses the primary database.
+    """
+
+    primary: PoolStatus
+    replica: PoolStatus | None = None
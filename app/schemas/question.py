@@ -6,7 +6,8 @@ including validation and formatting for date fields.
 from datetime import datetime, date
 from pydantic import BaseModel, Field, field_validator, field_serializer
 
-from .answer import AnswerResponse
+from .answer import AnswerNestedCreate, AnswerResponse
+from .bulk import BulkUpdate
 from .topic import TopicResponse
 
 
@@ -73,6 +74,16 @@ class QuestionCreate(QuestionBase):
     topic_id: int
 
 
+class QuestionCreateWithAnswers(QuestionCreate):
+    """
+    Schema for creating a new Question together with its Answers.
+
+    Attributes:
+        answers (list[AnswerNestedCreate]): The answers of the question.
+    """
+    answers: list[AnswerNestedCreate] = []
+
+
 class QuestionUpdate(QuestionBase):
     """
     Schema for updating an existing Question.
@@ -87,6 +98,21 @@ class QuestionUpdate(QuestionBase):
     update_date: date = Field(None, example=TIME_EXAMPLE)
 
 
+class QuestionBulkUpdate(BulkUpdate):
+    """
+    Schema for updating many Questions at once.
+
+    Attributes:
+        ids (list[int]): The IDs of the questions.
+        topic_id (int | None): Move the questions to this topic.
+        image_url (str | None): Set (or clear) the image of the questions.
+    """
+    non_nullable_fields = ('topic_id',)
+
+    topic_id: int | None = None
+    image_url: str | None = None
+
+
 class QuestionResponse(QuestionBase):
     """
     Response schema for a Question entity.
@@ -109,6 +135,17 @@ class QuestionResponse(QuestionBase):
         from_attributes = True
 
 
+class QuestionResponseWithAnswers(QuestionResponse):
+    """
+    Response schema for a Question entity including its Answers.
+
+    Attributes:
+        answers (list[AnswerResponse]): A list of related answers.
+    """
+
+    answers: list[AnswerResponse]
+
+
 class QuestionResponseWithTopicAndAnswers(QuestionBase):
     """
     Extended response schema for a Question entity,
@@ -132,3 +169,48 @@ class QuestionResponseWithTopicAndAnswers(QuestionBase):
 
     class Config:
         from_attributes = True
+
+
+class QuestionBankStatus(BaseModel):
+    """
+    Response schema describing the in-memory question bank.
+
+    Attributes:
+        version (int): The version of the loaded snapshot.
+        questions (int): The number of questions in the bank.
+        topics (int): The number of topics with at least one question.
+    """
+
+    version: int
+    questions: int
+    topics: int
+
+
+class QuestionDuplicatePair(BaseModel):
+    """
+    Response schema for a pair of near-duplicate questions.
+
+    Attributes:
+        first (QuestionResponse): The question with the smaller ID.
+        second (QuestionResponse): The question with the greater ID.
+        similarity (float): Jaccard similarity of the question texts
+            (0 to 1).
+    """
+
+    first: QuestionResponse
+    second: QuestionResponse
+    similarity: float
+
+
+class QuestionBatch(BaseModel):
+    """
+    Response schema for a batch fetch of questions by ID.
+
+    Attributes:
+        questions (list[QuestionResponseWithTopicAndAnswers]): The found
+            questions, in the requested order.
+        missing_ids (list[int]): Requested IDs that do not exist.
+    """
+
+    questions: list[QuestionResponseWithTopicAndAnswers]
+    missing_ids: list[int]
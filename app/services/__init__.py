@@ -0,0 +1,4 @@
+"""
+This package contains application services that are not tied to a single
+CRUD model, such as background analysis jobs.
+"""
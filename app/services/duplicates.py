@@ -0,0 +1,217 @@
+"""
+This module detects near-duplicate questions across the whole bank.
+
+Every question text is normalized (lowercase, no diacritics or punctuation)
+and split into character shingles. Each shingle set is compressed into a
+MinHash signature, and signatures are split into LSH bands: only questions
+sharing at least one band bucket are compared, so the bank is never compared
+pair by pair. Candidate pairs are confirmed with the exact Jaccard similarity
+of their shingle sets.
+
+It can also be run as a job:
+    python -m app.services.duplicates --threshold 0.8
+"""
+
+import argparse
+import asyncio
+import hashlib
+import re
+import struct
+import unicodedata
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db_models import Question
+
+
+SHINGLE_SIZE = 5
+# 16 bands of 4 rows make a pair with a similarity of 0.8 a candidate with
+# a probability above 99.9% (98.8% at 0.7), so lower thresholds lose recall.
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+DEFAULT_THRESHOLD = 0.8
+MINHASH_SEED = 1
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+@dataclass(frozen=True)
+class DuplicatePair:
+    """
+    A pair of near-duplicate questions.
+
+    Attributes:
+        first_id (int): The smaller question ID.
+        second_id (int): The greater question ID.
+        similarity (float): Jaccard similarity of their shingle sets.
+    """
+
+    first_id: int
+    second_id: int
+    similarity: float
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercase the text, strip diacritics and collapse punctuation
+    and whitespace into single spaces.
+
+    Args:
+        text (str): The raw text.
+
+    Returns:
+        str: The normalized text.
+    """
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    without_marks = ''.join(
+        char for char in decomposed if not unicodedata.combining(char))
+    return _NON_WORD.sub(' ', without_marks).strip()
+
+
+def shingle(text: str, size: int = SHINGLE_SIZE) -> frozenset[str]:
+    """
+    Split normalized text into character shingles.
+
+    Args:
+        text (str): The raw text.
+        size (int): The shingle length in characters.
+
+    Returns:
+        frozenset[str]: The shingles of the text.
+    """
+    normalized = normalize_text(text)
+    if len(normalized) <= size:
+        return frozenset((normalized,))
+    return frozenset(
+        normalized[start:start + size]
+        for start in range(len(normalized) - size + 1)
+    )
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures.
+
+    Each shingle is hashed once with SHAKE-128, whose output is split into
+    ``num_permutations`` independent 32-bit hash values; the signature is the
+    element-wise minimum over all shingles. Per-shingle hashes are memoized,
+    since shingles repeat a lot across a question bank.
+    """
+
+    def __init__(
+            self,
+            num_permutations: int = NUM_PERMUTATIONS,
+            seed: int = MINHASH_SEED
+    ):
+        self._salt = seed.to_bytes(8, 'big')
+        self._format = struct.Struct(f'<{num_permutations}I')
+        self._cache = {}
+
+    def _hash(self, piece: str) -> tuple[int, ...]:
+        hashes = self._cache.get(piece)
+        if hashes is None:
+            digest = hashlib.shake_128(self._salt + piece.encode()).digest(
+                self._format.size)
+            hashes = self._cache[piece] = self._format.unpack(digest)
+        return hashes
+
+    def signature(self, shingles: frozenset[str]) -> tuple[int, ...]:
+        """
+        Compute the MinHash signature of a shingle set.
+
+        Args:
+            shingles (frozenset[str]): The shingles of a text.
+
+        Returns:
+            tuple[int, ...]: One minimum per hash function.
+        """
+        return tuple(map(min, zip(*map(self._hash, shingles))))
+
+
+def find_near_duplicates(
+        texts: Iterable[tuple[int, str]],
+        threshold: float = DEFAULT_THRESHOLD,
+) -> list[DuplicatePair]:
+    """
+    Find pairs of texts whose shingle sets have a Jaccard similarity
+    of at least ``threshold``.
+
+    Args:
+        texts (Iterable[tuple[int, str]]): (ID, text) pairs.
+        threshold (float): The minimum similarity of a reported pair.
+
+    Returns:
+        list[DuplicatePair]: Near-duplicate pairs, most similar first.
+    """
+    hasher = MinHasher()
+    shingles_by_id = {}
+    buckets = {}
+    for text_id, text in texts:
+        shingles = shingle(text)
+        shingles_by_id[text_id] = shingles
+        signature = hasher.signature(shingles)
+        for band in range(BANDS):
+            start = band * ROWS_PER_BAND
+            key = (band, signature[start:start + ROWS_PER_BAND])
+            buckets.setdefault(key, []).append(text_id)
+
+    candidates = set()
+    for bucket in buckets.values():
+        if len(bucket) > 1:
+            candidates.update(combinations(sorted(bucket), 2))
+
+    pairs = []
+    for first_id, second_id in candidates:
+        first, second = shingles_by_id[first_id], shingles_by_id[second_id]
+        similarity = len(first & second) / len(first | second)
+        if similarity >= threshold:
+            pairs.append(DuplicatePair(first_id, second_id, similarity))
+    pairs.sort(key=lambda pair: (-pair.similarity, pair.first_id))
+    return pairs
+
+
+async def find_duplicate_questions(
+        session: AsyncSession,
+        threshold: float = DEFAULT_THRESHOLD,
+) -> list[DuplicatePair]:
+    """
+    Find near-duplicate questions across all topics.
+
+    The texts are loaded with one query; the CPU-bound matching runs in
+    a worker thread so the event loop stays responsive.
+
+    Args:
+        session (AsyncSession): The current database session.
+        threshold (float): The minimum similarity of a reported pair.
+
+    Returns:
+        list[DuplicatePair]: Near-duplicate pairs, most similar first.
+    """
+    result = await session.execute(select(Question.id, Question.text))
+    texts = [tuple(row) for row in result.all()]
+    return await asyncio.to_thread(find_near_duplicates, texts, threshold)
+
+
+async def _run_job(threshold: float) -> None:
+    """
+    Print the duplicate report for the configured database.
+    """
+    from app.core.db_config import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as session:
+        pairs = await find_duplicate_questions(session, threshold)
+    for pair in pairs:
+        print(f'{pair.similarity:.3f}\t{pair.first_id}\t{pair.second_id}')
+    print(f'{len(pairs)} near-duplicate pairs found.')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Report near-duplicate questions.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    asyncio.run(_run_job(parser.parse_args().threshold))
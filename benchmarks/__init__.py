@@ -0,0 +1,6 @@
+"""
+This package contains reproducible benchmarks for the application's hot
+paths. Every benchmark seeds its own synthetic question bank into the
+database given by BENCHMARK_DATABASE_URL (a local SQLite file by default),
+so it never touches the application's real database.
+"""
@@ -0,0 +1,215 @@
+"""
+This module contains helpers shared by the benchmarks: environment setup,
+synthetic data seeding and latency statistics.
+
+It must be imported before any ``app`` module, because the application
+settings are read from the environment at import time.
+"""
+
+import os
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import date
+from typing import Awaitable, Callable, Iterator
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+
+DEFAULT_DATABASE_URL = 'sqlite+aiosqlite:///./benchmark.sqlite3'
+
+#: The database the benchmarks seed and query.
+BENCHMARK_DATABASE_URL = os.getenv(
+    'BENCHMARK_DATABASE_URL', DEFAULT_DATABASE_URL)
+
+os.environ['DATABASE_URL'] = BENCHMARK_DATABASE_URL
+os.environ.setdefault('APP_TITLE', 'Czech Realities benchmark')
+os.environ.setdefault('DESCRIPTION', 'Benchmark run')
+os.environ.setdefault('SECRET', 'benchmark-secret')
+
+from db_models import Answer, Category, Question, Topic  # noqa: E402
+from db_models.base import Base  # noqa: E402
+
+
+UPDATE_DATE = date(2025, 1, 1)
+
+
+def create_engine() -> AsyncEngine:
+    """
+    Create an async engine for the benchmark database.
+
+    Returns:
+        AsyncEngine: An engine bound to BENCHMARK_DATABASE_URL.
+    """
+    return create_async_engine(BENCHMARK_DATABASE_URL)
+
+
+def create_session_factory(engine: AsyncEngine) -> sessionmaker:
+    """
+    Create a session factory bound to the given engine.
+
+    Args:
+        engine (AsyncEngine): The benchmark engine.
+
+    Returns:
+        sessionmaker: A factory producing AsyncSession instances.
+    """
+    return sessionmaker(engine, class_=AsyncSession)
+
+
+async def seed_bank(
+        engine: AsyncEngine,
+        topics: int,
+        questions_per_topic: int,
+        answers_per_question: int,
+) -> None:
+    """
+    Recreate all tables and fill them with a synthetic question bank.
+
+    Args:
+        engine (AsyncEngine): The benchmark engine.
+        topics (int): The number of topics to create.
+        questions_per_topic (int): The number of questions per topic.
+        answers_per_question (int): The number of answers per question
+            (the first one is marked as correct).
+    """
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+        await connection.execute(
+            insert(Category), [{'id': 1, 'name': 'Benchmark category'}])
+        await connection.execute(
+            insert(Topic),
+            [
+                {'id': topic_id, 'name': f'Topic {topic_id}', 'category_id': 1}
+                for topic_id in range(1, topics + 1)
+            ]
+        )
+
+        questions = []
+        answers = []
+        question_id = 0
+        for topic_id in range(1, topics + 1):
+            for _ in range(questions_per_topic):
+                question_id += 1
+                questions.append({
+                    'id': question_id,
+                    'text': f'Question {question_id} of topic {topic_id}?',
+                    'image_url': None,
+                    'topic_id': topic_id,
+                    'update_date': UPDATE_DATE,
+                })
+                answers.extend(
+                    {
+                        'text': f'Answer {number} to question {question_id}',
+                        'image_url': None,
+                        'is_correct': number == 0,
+                        'question_id': question_id,
+                    }
+                    for number in range(answers_per_question)
+                )
+        if questions:
+            await connection.execute(insert(Question), questions)
+        if answers:
+            await connection.execute(insert(Answer), answers)
+
+
+@contextmanager
+def count_queries(
+        engine: AsyncEngine
+) -> Iterator[list[tuple[str, object]]]:
+    """
+    Record every SQL statement executed through the engine.
+
+    Args:
+        engine (AsyncEngine): The engine to observe.
+
+    Yields:
+        list[tuple[str, object]]: A list that is filled with the executed
+        statements and their parameters.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        statements.append((statement, parameters))
+
+    event.listen(
+        engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(
+            engine.sync_engine, 'before_cursor_execute',
+            before_cursor_execute)
+
+
+async def measure(
+        call: Callable[[], Awaitable[object]],
+        iterations: int,
+        warmup: int = 10,
+) -> list[float]:
+    """
+    Await ``call`` repeatedly and record the latency of every call.
+
+    Args:
+        call (Callable): A zero-argument coroutine function to benchmark.
+        iterations (int): The number of measured calls.
+        warmup (int): The number of unmeasured calls made first.
+
+    Returns:
+        list[float]: Per-call latencies in seconds.
+    """
+    for _ in range(warmup):
+        await call()
+
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """
+    Compute latency percentiles (in milliseconds) and throughput.
+
+    Args:
+        samples (list[float]): Per-call latencies in seconds.
+
+    Returns:
+        dict[str, float]: p50, p95, p99 and mean latency in ms,
+        plus sequential requests per second.
+    """
+    ordered = sorted(samples)
+
+    def percentile(share: float) -> float:
+        index = min(len(ordered) - 1, round(share * (len(ordered) - 1)))
+        return ordered[index] * 1000
+
+    total = sum(ordered)
+    return {
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'mean_ms': statistics.fmean(ordered) * 1000,
+        'rps': len(ordered) / total if total else 0.0,
+    }
+
+
+def print_summary(name: str, summary: dict[str, float]) -> None:
+    """
+    Print a one-line summary of a benchmark case.
+
+    Args:
+        name (str): The case name.
+        summary (dict[str, float]): The output of ``summarize``.
+    """
+    print(
+        f'{name:<40} p50={summary["p50_ms"]:8.3f}ms '
+        f'p95={summary["p95_ms"]:8.3f}ms p99={summary["p99_ms"]:8.3f}ms '
+        f'rps={summary["rps"]:10.1f}'
+    )
@@ -0,0 +1,182 @@
+"""
+Benchmark: latency and throughput of the hot read endpoints, served by the
+FastAPI application in-process through an ASGI client.
+
+Results can be saved as JSON and compared against a stored baseline; the
+run fails (exit code 1) if any endpoint got slower than the tolerance
+allows. Baselines are machine specific, so record them on the machine
+that runs the comparison.
+
+Usage:
+    python -m benchmarks.endpoints --output results.json
+    python -m benchmarks.endpoints --baseline benchmarks/baselines/endpoints.json
+    python -m benchmarks.endpoints --output benchmarks/baselines/endpoints.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from pathlib import Path
+
+import httpx
+
+from benchmarks.common import (
+    BENCHMARK_DATABASE_URL, create_engine, measure, print_summary,
+    seed_bank, summarize)
+from app.main import app
+
+
+#: Benchmarked endpoints: (case name, path).
+CASES = (
+    ('random-one', '/question/random-one'),
+    ('random-ticket', '/question/random-ticket'),
+    ('random-ticket-seeded', '/question/random-ticket?seed=1'),
+    ('by-topic', '/question/by-topic/1'),
+    ('topics', '/topic/'),
+    ('categories', '/category/'),
+)
+
+
+async def run_cases(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    """
+    Seed the benchmark database and measure every endpoint.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        dict[str, dict[str, float]]: Summaries by case name.
+    """
+    engine = create_engine()
+    await seed_bank(engine, args.topics, args.questions, args.answers)
+    await engine.dispose()
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url='http://benchmark'
+        ) as client:
+
+            for name, path in CASES:
+                async def call(path=path):
+                    response = await client.get(path)
+                    response.raise_for_status()
+
+                results[name] = summarize(
+                    await measure(call, args.iterations, args.warmup))
+                print_summary(name, results[name])
+    return results
+
+
+def compare(
+        results: dict[str, dict[str, float]],
+        baseline: dict[str, dict[str, float]],
+        tolerance: float,
+) -> list[str]:
+    """
+    Compare results with a baseline and list the regressed cases.
+
+    A case regresses when its p95 latency grows, or its throughput drops,
+    by more than ``tolerance`` (a fraction of the baseline value).
+
+    Args:
+        results (dict[str, dict[str, float]]): Summaries of this run.
+        baseline (dict[str, dict[str, float]]): Summaries of the baseline.
+        tolerance (float): The allowed relative change.
+
+    Returns:
+        list[str]: Names of the regressed cases.
+    """
+    regressions = []
+    print(f'\n{"case":<24} {"p95 base":>10} {"p95 now":>10} '
+          f'{"rps base":>10} {"rps now":>10}')
+    for name, summary in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f'{name:<24} (not in baseline)')
+            continue
+        regressed = (
+            summary['p95_ms'] > base['p95_ms'] * (1 + tolerance)
+            or summary['rps'] < base['rps'] * (1 - tolerance)
+        )
+        if regressed:
+            regressions.append(name)
+        print(
+            f'{name:<24} {base["p95_ms"]:10.3f} {summary["p95_ms"]:10.3f} '
+            f'{base["rps"]:10.1f} {summary["rps"]:10.1f}'
+            f'{"  REGRESSED" if regressed else ""}'
+        )
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> int:
+    """
+    Run the benchmark, save its results and compare them to the baseline.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: The process exit code (1 if any endpoint regressed).
+    """
+    print(
+        f'{args.topics} topics x {args.questions} questions x '
+        f'{args.answers} answers, {args.iterations} iterations'
+    )
+    results = await run_cases(args)
+    settings = {
+        'database': BENCHMARK_DATABASE_URL.split(':', 1)[0],
+        'python': platform.python_version(),
+        'topics': args.topics,
+        'questions': args.questions,
+        'answers': args.answers,
+        'iterations': args.iterations,
+    }
+
+    if args.output:
+        report = {'settings': settings, 'results': results}
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline['settings'] != settings:
+            print(
+                f'\nWarning: the baseline was recorded with different '
+                f'settings: {baseline["settings"]}'
+            )
+        regressions = compare(results, baseline['results'], args.tolerance)
+        if regressions:
+            print(f'\nRegressed: {", ".join(regressions)}')
+            return 1
+    return 0
+
+
+def main() -> None:
+    """
+    Parse command line arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--topics', type=int, default=30)
+    parser.add_argument('--questions', type=int, default=200,
+                        help='questions per topic')
+    parser.add_argument('--answers', type=int, default=4,
+                        help='answers per question')
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--output', type=Path,
+                        help='save the results as JSON to this file')
+    parser.add_argument('--baseline', type=Path,
+                        help='compare the results with this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed relative slowdown (default: 0.2)')
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
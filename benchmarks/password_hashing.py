@@ -0,0 +1,106 @@
+"""
+Benchmark: event-loop latency during a burst of concurrent logins, with
+password verification run inline on the event loop versus in the bounded
+password hashing thread pool.
+
+A probe coroutine wakes up every millisecond and records how late it was;
+with inline hashing the lag grows to the cost of a whole hash, with the
+thread pool it should stay flat.
+
+Usage:
+    python -m benchmarks.password_hashing --logins 50 --workers 2
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import summarize
+from app.core.password_hashing import PasswordHasher
+
+
+PROBE_INTERVAL = 0.001
+
+
+async def probe_loop_lag(stop: asyncio.Event) -> list[float]:
+    """
+    Measure how late the event loop wakes up a sleeping coroutine.
+
+    Args:
+        stop (asyncio.Event): Set to end the measurement.
+
+    Returns:
+        list[float]: Lags in seconds beyond the requested interval.
+    """
+    lags = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - started - PROBE_INTERVAL)
+    return lags
+
+
+async def run_burst(verify, logins: int) -> None:
+    """
+    Run a burst of concurrent logins while probing the event loop and
+    print the lag statistics.
+
+    Args:
+        verify: A zero-argument coroutine function verifying one password.
+        logins (int): The number of concurrent logins.
+    """
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(stop))
+    await asyncio.sleep(PROBE_INTERVAL * 10)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(verify() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    summary = summarize(await probe)
+    print(
+        f'  loop lag p50={summary["p50_ms"]:8.3f}ms '
+        f'p95={summary["p95_ms"]:8.3f}ms p99={summary["p99_ms"]:8.3f}ms, '
+        f'{logins / elapsed:7.1f} logins/s'
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    """
+    Compare inline and thread pool password verification.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    hasher = PasswordHasher(args.workers)
+    helper = hasher.password_helper
+    password = 'benchmark-password'
+    hashed_password = helper.hash(password)
+
+    async def verify_inline():
+        helper.verify_and_update(password, hashed_password)
+
+    async def verify_in_pool():
+        await hasher.verify_and_update(password, hashed_password)
+
+    print(f'{args.logins} concurrent logins')
+    print('inline on the event loop:')
+    await run_burst(verify_inline, args.logins)
+    print(f'thread pool ({args.workers} workers):')
+    await run_burst(verify_in_pool, args.logins)
+
+
+def main() -> None:
+    """
+    Parse command line arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--logins', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=2,
+                        help='password hashing threads')
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Query-count regression check for the public read endpoints.
+
+Seeds a synthetic bank, calls every endpoint through the application
+in-process and fails (exit code 1) if any of them executes a different
+number of SQL statements than expected. A higher count usually means an
+N+1 loop or a duplicated fetch crept in; a lower one means the expectation
+should be tightened.
+
+Usage:
+    python -m benchmarks.query_counts
+"""
+
+import argparse
+import asyncio
+import sys
+
+import httpx
+
+from benchmarks.common import create_engine, seed_bank
+from app.core.query_budget import assert_num_queries
+from app.main import app
+
+
+#: Endpoints and the exact number of SQL statements each one executes.
+#: Random questions and seeded tickets come from the in-memory question
+#: bank, so they must not touch the database at all.
+CASES = (
+    ('/question/random-one', 0),
+    ('/question/random-many?count=5', 0),
+    ('/question/random-ticket?seed=1', 0),
+    ('/question/random-ticket', 1),
+    ('/question/by-topic/1', 2),
+    ('/question/1', 1),
+    ('/question/batch?ids=3,1,2', 1),
+    ('/question/?limit=50', 1),
+    ('/answer/?limit=50', 1),
+    ('/topic/', 1),
+    ('/category/', 1),
+)
+
+
+async def run(args: argparse.Namespace) -> int:
+    """
+    Seed the benchmark database and check the query count of every case.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: The process exit code (1 if any count differs).
+    """
+    engine = create_engine()
+    await seed_bank(engine, args.topics, args.questions, args.answers)
+    await engine.dispose()
+
+    failures = 0
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url='http://benchmark'
+        ) as client:
+            for path, expected in CASES:
+                try:
+                    with assert_num_queries(expected) as query_log:
+                        response = await client.get(path)
+                        response.raise_for_status()
+                except AssertionError as error:
+                    failures += 1
+                    print(f'FAIL {path}: {error}')
+                else:
+                    print(f'ok   {path}: {query_log.count} statements')
+    return 1 if failures else 0
+
+
+def main() -> None:
+    """
+    Parse command line arguments and run the check.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--topics', type=int, default=10)
+    parser.add_argument('--questions', type=int, default=20,
+                        help='questions per topic')
+    parser.add_argument('--answers', type=int, default=3,
+                        help='answers per question')
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: random question selection through the database
+(COUNT + OFFSET + joined fetch) versus the in-memory question bank.
+
+Usage:
+    python -m benchmarks.question_bank --topics 30 --questions 200
+"""
+
+import argparse
+import asyncio
+
+from benchmarks.common import (
+    create_engine, create_session_factory, measure, print_summary,
+    seed_bank, summarize)
+from app.core.question_bank import QuestionBank
+from app.crud.question import question_crud
+
+
+def _as_coroutine(func, *args):
+    """
+    Wrap a synchronous call so it can be passed to ``measure``.
+    """
+    async def call():
+        return func(*args)
+    return call
+
+
+async def run(args: argparse.Namespace) -> None:
+    """
+    Seed the benchmark database and compare both random-pick paths.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    engine = create_engine()
+    session_factory = create_session_factory(engine)
+    await seed_bank(engine, args.topics, args.questions, args.answers)
+
+    bank = QuestionBank()
+    async with session_factory() as session:
+        await bank.load(session)
+
+        print(
+            f'{len(bank.snapshot.question_ids)} questions, '
+            f'{args.topics} topics, {args.iterations} iterations'
+        )
+        print_summary(
+            'random-one: database',
+            summarize(await measure(
+                lambda: question_crud.get_random_question(session),
+                args.iterations
+            ))
+        )
+        print_summary(
+            'random-one: question bank',
+            summarize(await measure(
+                _as_coroutine(bank.get_random_question), args.iterations
+            ))
+        )
+        print_summary(
+            'random-by-topic: database',
+            summarize(await measure(
+                lambda: question_crud.get_random_question_by_topic(
+                    1, session),
+                args.iterations
+            ))
+        )
+        print_summary(
+            'random-by-topic: question bank',
+            summarize(await measure(
+                _as_coroutine(bank.get_random_question_by_topic, 1),
+                args.iterations
+            ))
+        )
+    await engine.dispose()
+
+
+def main() -> None:
+    """
+    Parse command line arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--topics', type=int, default=30)
+    parser.add_argument('--questions', type=int, default=200,
+                        help='questions per topic')
+    parser.add_argument('--answers', type=int, default=4,
+                        help='answers per question')
+    parser.add_argument('--iterations', type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
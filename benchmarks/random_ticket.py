@@ -0,0 +1,92 @@
+"""
+Benchmark: random ticket generation with the former per-topic loop
+(1 + 3 x T queries) versus the single window-function statement.
+
+Usage:
+    python -m benchmarks.random_ticket --topics 30 --questions 200
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.common import (
+    count_queries, create_engine, create_session_factory, measure,
+    print_summary, seed_bank, summarize)
+from app.crud.question import question_crud
+from db_models import Topic
+
+
+async def per_topic_ticket(session: AsyncSession) -> list:
+    """
+    Build a ticket the way it was built before: one random-by-topic
+    lookup per topic.
+
+    Args:
+        session (AsyncSession): The current database session.
+
+    Returns:
+        list: One random question per topic.
+    """
+    ticket = []
+    topic_ids = (await session.execute(select(Topic.id))).scalars().all()
+    for topic_id in topic_ids:
+        question = await question_crud.get_random_question_by_topic(
+            topic_id, session)
+        if question:
+            ticket.append(question)
+    return ticket
+
+
+async def run(args: argparse.Namespace) -> None:
+    """
+    Seed the benchmark database and compare both ticket builders.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    engine = create_engine()
+    session_factory = create_session_factory(engine)
+    await seed_bank(engine, args.topics, args.questions, args.answers)
+
+    cases = (
+        ('random-ticket: per-topic loop', per_topic_ticket),
+        ('random-ticket: single statement', question_crud.get_random_ticket),
+    )
+    print(
+        f'{args.topics} topics, {args.questions} questions per topic, '
+        f'{args.iterations} iterations'
+    )
+    async with session_factory() as session:
+        for name, build_ticket in cases:
+            with count_queries(engine) as statements:
+                ticket = await build_ticket(session)
+            assert len(ticket) == args.topics
+            print(f'{name:<40} queries per ticket: {len(statements)}')
+            print_summary(
+                name,
+                summarize(await measure(
+                    lambda: build_ticket(session), args.iterations
+                ))
+            )
+    await engine.dispose()
+
+
+def main() -> None:
+    """
+    Parse command line arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--topics', type=int, default=30)
+    parser.add_argument('--questions', type=int, default=200,
+                        help='questions per topic')
+    parser.add_argument('--answers', type=int, default=4,
+                        help='answers per question')
+    parser.add_argument('--iterations', type=int, default=100)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
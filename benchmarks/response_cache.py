@@ -0,0 +1,284 @@
+"""
+Check and benchmark of the response cache of the read routes, with both
+backends: the in-process LRU and Redis (a local in-memory stand-in speaking
+the subset of the ``redis.asyncio`` API the backend uses, so no server is
+needed).
+
+For every backend the check verifies that the first call of a cached
+endpoint is a miss that queries the database, that the second one is a hit
+that does not, that a committed change of the bank (a new bank version)
+invalidates cached responses while a change of a user keeps them, and that
+the LRU counts its evictions. It
+then reports the latency of every endpoint with and without the cache.
+The run fails (exit code 1) if any check fails.
+
+Usage:
+    python -m benchmarks.response_cache --iterations 200
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+import httpx
+from prometheus_client import REGISTRY
+from sqlalchemy import update
+
+from benchmarks.common import (
+    create_engine, create_session_factory, measure, seed_bank, summarize)
+from app.core.query_budget import track_queries
+from app.core.response_cache import (
+    MemoryCacheBackend, RedisCacheBackend, response_cache)
+from app.main import app
+from db_models import Topic
+from db_models.changes import USER_TABLE, change_bus, record_changes
+
+
+#: Cached endpoints: (cache namespace, path).
+CASES = (
+    ('topics', '/topic/'),
+    ('categories', '/category/'),
+    ('questions-by-topic', '/question/by-topic/1'),
+)
+
+
+class FakeRedis:
+    """
+    A minimal in-memory stand-in for ``redis.asyncio.Redis``: ``get``,
+    ``set`` with a ``px`` expiry and ``aclose``.
+    """
+
+    def __init__(self):
+        self._values: dict[str, tuple[bytes, float | None]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        value, expires_at = self._values.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, px: int | None = None):
+        expires_at = None if px is None else time.monotonic() + px / 1000
+        self._values[key] = (value, expires_at)
+        return True
+
+    async def aclose(self) -> None:
+        self._values.clear()
+
+
+def lookups(namespace: str, result: str) -> float:
+    """
+    Read a response cache lookup counter.
+
+    Args:
+        namespace (str): The cache namespace.
+        result (str): 'hit' or 'miss'.
+
+    Returns:
+        float: The counter value.
+    """
+    return REGISTRY.get_sample_value(
+        'response_cache_requests_total',
+        {'namespace': namespace, 'result': result}) or 0.0
+
+
+def evictions() -> float:
+    """
+    Read the eviction counter of the in-process cache.
+
+    Returns:
+        float: The counter value.
+    """
+    return REGISTRY.get_sample_value('response_cache_evictions_total') or 0.0
+
+
+class Checker:
+    """
+    Collects the results of the checks.
+    """
+
+    def __init__(self):
+        self.failures = 0
+
+    def check(self, name: str, passed: bool, detail: str = '') -> None:
+        """
+        Print the result of a check and count failures.
+
+        Args:
+            name (str): What was checked.
+            passed (bool): Whether the check passed.
+            detail (str): Shown for failed checks.
+        """
+        if passed:
+            print(f'ok   {name}')
+        else:
+            self.failures += 1
+            print(f'FAIL {name}: {detail}')
+
+
+async def get(client: httpx.AsyncClient, path: str) -> tuple[bytes, int]:
+    """
+    Request a path and count the SQL statements it executes.
+
+    Args:
+        client (httpx.AsyncClient): The in-process client.
+        path (str): The request path.
+
+    Returns:
+        tuple[bytes, int]: The response body and the statement count.
+    """
+    with track_queries() as query_log:
+        response = await client.get(path)
+        response.raise_for_status()
+    return response.content, query_log.count
+
+
+async def check_backend(
+        name: str,
+        client: httpx.AsyncClient,
+        checker: Checker,
+) -> None:
+    """
+    Check hits, misses and invalidation of the current backend.
+
+    Args:
+        name (str): The backend name.
+        client (httpx.AsyncClient): The in-process client.
+        checker (Checker): Collects the results.
+    """
+    for namespace, path in CASES:
+        misses = lookups(namespace, 'miss')
+        hits = lookups(namespace, 'hit')
+        body, first_queries = await get(client, path)
+        cached_body, cached_queries = await get(client, path)
+        checker.check(
+            f'{name} {path}: miss, then hit without queries',
+            first_queries > 0 and cached_queries == 0
+            and cached_body == body
+            and lookups(namespace, 'miss') == misses + 1
+            and lookups(namespace, 'hit') == hits + 1,
+            f'{first_queries} then {cached_queries} statements',
+        )
+
+    body, _ = await get(client, '/topic/')
+    await change_bus.publish({USER_TABLE: [1]})
+    cached_body, queries = await get(client, '/topic/')
+    checker.check(
+        f'{name} /topic/: a user change keeps the cache',
+        queries == 0 and cached_body == body,
+        f'{queries} statements',
+    )
+
+    engine = create_engine()
+    async with create_session_factory(engine)() as session:
+        await session.execute(
+            update(Topic).where(Topic.id == 1)
+            .values(name=Topic.name + ' (renamed)'))
+        record_changes(session, Topic, (1,))
+        await session.commit()
+    await engine.dispose()
+    changed_body, queries = await get(client, '/topic/')
+    checker.check(
+        f'{name} /topic/: a committed change invalidates the cache',
+        queries > 0 and b'(renamed)' in changed_body and changed_body != body,
+        f'{queries} statements',
+    )
+
+
+async def check_evictions(
+        client: httpx.AsyncClient,
+        checker: Checker,
+) -> None:
+    """
+    Check that the in-process LRU is bounded and counts its evictions.
+
+    Args:
+        client (httpx.AsyncClient): The in-process client.
+        checker (Checker): Collects the results.
+    """
+    response_cache.backend = MemoryCacheBackend(max_size=2, ttl=60)
+    before = evictions()
+    for topic_id in (1, 2, 3):
+        await get(client, f'/question/by-topic/{topic_id}')
+    _, queries = await get(client, '/question/by-topic/1')
+    checker.check(
+        'memory: the least recently used response is evicted and counted',
+        evictions() - before == 2 and queries > 0,
+        f'{evictions() - before:.0f} evictions, {queries} statements',
+    )
+
+
+async def run(args: argparse.Namespace) -> int:
+    """
+    Seed the benchmark database, run the checks and measure the endpoints.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: The process exit code (1 if any check failed).
+    """
+    engine = create_engine()
+    await seed_bank(engine, args.topics, args.questions, args.answers)
+    await engine.dispose()
+
+    backends = {
+        'memory': lambda: MemoryCacheBackend(max_size=1024, ttl=60),
+        'redis': lambda: RedisCacheBackend(FakeRedis(), ttl=60),
+    }
+    checker = Checker()
+    latencies = {}
+    original_backend = response_cache.backend
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url='http://benchmark'
+        ) as client:
+            for name, create_backend in backends.items():
+                response_cache.backend = create_backend()
+                await check_backend(name, client, checker)
+            await check_evictions(client, checker)
+
+            for name, create_backend in {'none': lambda: None,
+                                         **backends}.items():
+                response_cache.backend = create_backend()
+                for _, path in CASES:
+                    async def call(path=path):
+                        response = await client.get(path)
+                        response.raise_for_status()
+
+                    latencies[name, path] = summarize(
+                        await measure(call, args.iterations, args.warmup))
+    response_cache.backend = original_backend
+
+    print(f'\n{"endpoint":<24} {"uncached p50 ms":>16} '
+          f'{"memory p50 ms":>14} {"redis p50 ms":>13}')
+    for _, path in CASES:
+        print(f'{path:<24} '
+              f'{latencies["none", path]["p50_ms"]:16.3f} '
+              f'{latencies["memory", path]["p50_ms"]:14.3f} '
+              f'{latencies["redis", path]["p50_ms"]:13.3f}')
+    return 1 if checker.failures else 0
+
+
+def main() -> None:
+    """
+    Parse command line arguments and run the check.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--topics', type=int, default=10)
+    parser.add_argument('--questions', type=int, default=100,
+                        help='questions per topic')
+    parser.add_argument('--answers', type=int, default=4,
+                        help='answers per question')
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=10)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark: memory of N worker processes that each load a private in-memory
+question bank versus workers that share one memory-mapped snapshot file.
+
+Every worker loads (or maps) the bank, reads every question once and then
+serves random picks; once all workers are up, each reports its unique (USS)
+and proportional (PSS) memory from ``/proc/self/smaps_rollup`` (Linux only)
+and its random-pick latency.
+
+Usage:
+    python -m benchmarks.shared_bank --workers 4 --topics 30 --questions 1000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import create_engine, seed_bank
+
+
+#: Code run in each worker process; prints one JSON line of results once
+#: it reads a line from stdin.
+WORKER_SCRIPT = '''
+import asyncio, json, sys, time
+from benchmarks.common import create_engine, create_session_factory
+from app.core.question_bank import QuestionBank
+
+async def load(bank):
+    engine = create_engine()
+    async with create_session_factory(engine)() as session:
+        await bank.attach(session)
+    await engine.dispose()
+
+bank = QuestionBank(snapshot_path=sys.argv[1] or None)
+asyncio.run(load(bank))
+snapshot = bank.snapshot
+for question_id in snapshot.question_ids:
+    snapshot.questions[question_id]
+
+samples = []
+for _ in range(2000):
+    started = time.perf_counter()
+    bank.get_random_question()
+    samples.append(time.perf_counter() - started)
+samples.sort()
+
+print('ready', flush=True)
+sys.stdin.readline()
+memory = {}
+with open('/proc/self/smaps_rollup') as smaps:
+    for line in smaps:
+        name, _, value = line.partition(':')
+        if name in ('Pss', 'Private_Clean', 'Private_Dirty'):
+            memory[name] = int(value.split()[0])
+print(json.dumps({
+    'uss_kb': memory['Private_Clean'] + memory['Private_Dirty'],
+    'pss_kb': memory['Pss'],
+    'p50_us': samples[len(samples) // 2] * 1e6,
+}), flush=True)
+'''
+
+
+def run_workers(count: int, snapshot_path: str) -> list[dict[str, float]]:
+    """
+    Start the workers, wait until all of them hold the bank and collect
+    their measurements.
+
+    Args:
+        count (int): The number of worker processes.
+        snapshot_path (str): The shared snapshot file, or an empty string
+            for private in-memory banks.
+
+    Returns:
+        list[dict[str, float]]: The measurements of every worker.
+    """
+    workers = [
+        subprocess.Popen(
+            [sys.executable, '-c', WORKER_SCRIPT, snapshot_path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        for _ in range(count)
+    ]
+    for worker in workers:
+        if worker.stdout.readline().strip() != 'ready':
+            raise RuntimeError('A worker failed to load the bank.')
+    results = []
+    for worker in workers:
+        worker.stdin.write('\n')
+        worker.stdin.flush()
+        results.append(json.loads(worker.stdout.readline()))
+        worker.wait()
+    return results
+
+
+def print_results(name: str, results: list[dict[str, float]]) -> None:
+    """
+    Print the memory totals and the median latency of a set of workers.
+
+    Args:
+        name (str): The mode name.
+        results (list[dict[str, float]]): The worker measurements.
+    """
+    print(
+        f'{name:<10} '
+        f'{sum(r["uss_kb"] for r in results) / 1024:12.1f} '
+        f'{sum(r["pss_kb"] for r in results) / 1024:12.1f} '
+        f'{statistics.median(r["p50_us"] for r in results):14.1f}'
+    )
+
+
+def main() -> None:
+    """
+    Parse command line arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--topics', type=int, default=30)
+    parser.add_argument('--questions', type=int, default=1000,
+                        help='questions per topic')
+    parser.add_argument('--answers', type=int, default=4,
+                        help='answers per question')
+    args = parser.parse_args()
+
+    engine = create_engine()
+    asyncio.run(
+        seed_bank(engine, args.topics, args.questions, args.answers))
+    asyncio.run(engine.dispose())
+
+    print(
+        f'{args.workers} workers, {args.topics * args.questions} questions')
+    print(f'{"bank":<10} {"total USS MB":>12} {"total PSS MB":>12} '
+          f'{"pick p50 us":>14}')
+    print_results('private', run_workers(args.workers, ''))
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = os.path.join(directory, 'bank.snapshot')
+        results = run_workers(args.workers, snapshot_path)
+        print_results('shared', results)
+        print(f'snapshot file: '
+              f'{os.path.getsize(snapshot_path) / 2 ** 20:.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
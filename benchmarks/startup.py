@@ -0,0 +1,131 @@
+"""
+Benchmark: application startup cost with the admin interface built eagerly
+at import time versus lazily on its first request (``LAZY_ADMIN``).
+
+Every run starts a fresh interpreter that imports ``app.main`` and then
+serves one ``/admin/login`` request in-process, and reports the import
+time, the peak RSS after the import and the latency of that first admin
+request. ``--profile`` also prints the slowest modules from Python's
+``-X importtime`` output.
+
+Run it from the directory the application is served from (it needs
+``static/admin``).
+
+Usage:
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --runs 5 --profile
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+#: Code run in each child interpreter; prints one JSON line of results.
+CHILD_SCRIPT = '''
+import asyncio, json, resource, time
+import benchmarks.common
+started = time.perf_counter()
+import app.main
+import_s = time.perf_counter() - started
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+import httpx
+
+async def first_admin_request():
+    transport = httpx.ASGITransport(app=app.main.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://benchmark'
+    ) as client:
+        started = time.perf_counter()
+        response = await client.get('/admin/login')
+        response.raise_for_status()
+        return time.perf_counter() - started
+
+admin_s = asyncio.run(first_admin_request())
+print(json.dumps({'import_s': import_s, 'rss_kb': rss_kb, 'admin_s': admin_s}))
+'''
+
+
+def run_child(lazy: bool) -> dict[str, float]:
+    """
+    Import the application in a fresh interpreter and measure it.
+
+    Args:
+        lazy (bool): Whether to build the admin interface lazily.
+
+    Returns:
+        dict[str, float]: Import time, peak RSS and first admin request time.
+    """
+    env = dict(os.environ, LAZY_ADMIN=str(lazy).lower())
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT],
+        env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def profile_imports(lazy: bool, top: int) -> None:
+    """
+    Print the modules with the largest cumulative import time.
+
+    Args:
+        lazy (bool): Whether to build the admin interface lazily.
+        top (int): The number of modules to print.
+    """
+    env = dict(os.environ, LAZY_ADMIN=str(lazy).lower())
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         'import benchmarks.common; import app.main'],
+        env=env, check=True, capture_output=True, text=True
+    ).stderr
+
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        timings.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    print(f'\nslowest imports ({"lazy" if lazy else "eager"} admin):')
+    print(f'{"cumulative ms":>14} {"self ms":>9}  module')
+    for cumulative_us, self_us, name in sorted(timings, reverse=True)[:top]:
+        print(f'{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}')
+
+
+def main() -> None:
+    """
+    Parse command line arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5,
+                        help='fresh interpreters per mode')
+    parser.add_argument('--profile', action='store_true',
+                        help='print the slowest imports of each mode')
+    parser.add_argument('--top', type=int, default=15,
+                        help='modules to print with --profile')
+    args = parser.parse_args()
+
+    print(f'median of {args.runs} runs')
+    print(f'{"admin":<8} {"import ms":>10} {"peak RSS MB":>12} '
+          f'{"first /admin ms":>16}')
+    for lazy in (False, True):
+        runs = [run_child(lazy) for _ in range(args.runs)]
+        print(
+            f'{"lazy" if lazy else "eager":<8} '
+            f'{statistics.median(r["import_s"] for r in runs) * 1000:10.1f} '
+            f'{statistics.median(r["rss_kb"] for r in runs) / 1024:12.1f} '
+            f'{statistics.median(r["admin_s"] for r in runs) * 1000:16.1f}'
+        )
+
+    if args.profile:
+        for lazy in (False, True):
+            profile_imports(lazy, args.top)
+
+
+if __name__ == '__main__':
+    main()
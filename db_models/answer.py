@@ -4,7 +4,7 @@ for a given question. Each answer can optionally be linked to an image
 and flagged as correct or incorrect.
 """
 
-from sqlalchemy import Boolean, Column, String, Integer, ForeignKey
+from sqlalchemy import Boolean, Column, String, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from db_models.base import Base
@@ -23,6 +23,11 @@ class Answer(Base):
         is_correct (bool): Indicates if the answer is correct.
         question_id (int): A foreign key referencing the associated Question.
         question (Question): A SQLAlchemy relationship to the Question model.
+
+    Indexes:
+        ix_answers_question_id_text: Loading the answers of a question and
+            lookups by (question, text) in the parser.
+        ix_answers_correct_question_id: Partial index of correct answers.
     """
 
     text = Column(String(MAX_NAME_LENGTH), nullable=False)
@@ -31,6 +36,16 @@ class Answer(Base):
     question_id = Column(Integer, ForeignKey('questions.id'))
     question = relationship('Question', back_populates='answers')
 
+    __table_args__ = (
+        Index('ix_answers_question_id_text', 'question_id', 'text'),
+        Index(
+            'ix_answers_correct_question_id',
+            'question_id',
+            postgresql_where=is_correct,
+            sqlite_where=is_correct,
+        ),
+    )
+
     def __str__(self):
         """
         Return the answer's text representation.
@@ -0,0 +1,395 @@
+"""
+This module tracks which question bank rows (categories, topics, questions
+and answers) and user rows a session changes and announces them once the
+session commits, so every process holding a cache of the bank or of users
+can drop just what changed.
+
+Changes of objects flushed by the unit of work (the admin panel, the parser)
+are recorded by an ``after_flush`` hook; ORM-enabled INSERT/UPDATE/DELETE
+statements bypass the flush, so their callers record them with
+``record_changes``. After a commit, the changes are published:
+
+* on PostgreSQL, with a new value of the ``bank_version`` sequence through
+  ``NOTIFY``, which every listening process (all app workers) receives;
+* on other databases (SQLite in development and tests), in-process only,
+  with a per-process version counter.
+
+Subscribers of the bus receive a ChangeEvent for local and remote commits.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping
+
+from sqlalchemy import Sequence, event, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.orm import Session
+
+from db_models.base import Base
+
+
+logger = logging.getLogger(__name__)
+
+#: The Postgres NOTIFY channel of the bus.
+CHANGE_CHANNEL = 'bank_changes'
+
+#: Tables of the question bank.
+QUESTION_BANK_TABLES = frozenset(
+    {'categories', 'topics', 'questions', 'answers'})
+
+#: The table of users (see ``db_models.user``).
+USER_TABLE = 'user'
+
+#: Tables whose changes are published.
+TRACKED_TABLES = QUESTION_BANK_TABLES | {USER_TABLE}
+
+#: Postgres rejects NOTIFY payloads of 8000 bytes or more; larger change
+#: sets are published without IDs (the whole table counts as changed).
+MAX_PAYLOAD_SIZE = 7900
+
+#: Seconds to wait before reconnecting a lost LISTEN connection.
+RECONNECT_DELAY = 1.0
+
+_SESSION_CHANGES_KEY = 'bank_changes'
+
+#: The bank version, incremented once per published change set.
+bank_version_sequence = Sequence('bank_version', metadata=Base.metadata)
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    A committed change of the question bank or of users.
+
+    Attributes:
+        version (int): The bank version after the change.
+        changes (Mapping[str, frozenset[int] | None]): Changed IDs by
+            table name; None means any row of the table may have changed.
+        local (bool): Whether the change was committed by this process.
+    """
+
+    version: int
+    changes: Mapping[str, frozenset[int] | None]
+    local: bool
+
+    def affects(self, *tables: str) -> bool:
+        """
+        Whether any of the given tables changed.
+        """
+        return any(table in self.changes for table in tables)
+
+    def ids(self, table: str) -> frozenset[int] | None:
+        """
+        The changed IDs of a table: empty if the table did not change,
+        None if any of its rows may have changed.
+        """
+        return self.changes.get(table, frozenset())
+
+
+def _merge(target: dict, table: str, ids: Iterable[int] | None) -> None:
+    if ids is None or target.get(table, ()) is None:
+        target[table] = None
+    else:
+        target.setdefault(table, set()).update(ids)
+
+
+def record_changes(
+        session,
+        model,
+        ids: Iterable[int] | None = None
+) -> None:
+    """
+    Record changed rows of a model in a session, to be published when the
+    session commits. Needed for ORM-enabled INSERT/UPDATE/DELETE
+    statements, which do not go through the flush.
+
+    Args:
+        session: The Session or AsyncSession that changed the rows.
+        model: The model class (or its table name).
+        ids (Iterable[int] | None): The changed IDs; None if unknown.
+    """
+    table = model if isinstance(model, str) else model.__tablename__
+    if table in TRACKED_TABLES:
+        _merge(session.info.setdefault(_SESSION_CHANGES_KEY, {}), table, ids)
+
+
+class ChangeBus:
+    """
+    Collects committed changes of the tracked tables and delivers them to
+    subscribers in this process and, through Postgres NOTIFY, in others.
+
+    Methods:
+        install: Start tracking the sessions of this process.
+        subscribe: Register a callback for change events.
+        publish: Announce changes explicitly (e.g. made by raw SQL).
+        shares_versions: Whether bank versions are shared by processes.
+        current_version: Read the current bank version.
+        start: Load the bank version and listen for remote changes.
+        flush: Wait until the committed changes are published.
+        stop: Publish the pending changes and stop listening.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.origin = uuid.uuid4().hex
+        self._engine: AsyncEngine | None = None
+        self._subscribers: list[Callable[[ChangeEvent], None]] = []
+        self._listener: AsyncConnection | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._publishing: set[asyncio.Task] = set()
+        self._listening = False
+
+    @property
+    def uses_notify(self) -> bool:
+        """
+        Whether changes are published through Postgres NOTIFY.
+        """
+        return (self._engine is not None
+                and self._engine.dialect.name == 'postgresql')
+
+    def install(self, engine: AsyncEngine) -> None:
+        """
+        Record the changes of every session of this process and publish
+        them through the given (primary) engine. Idempotent.
+
+        Args:
+            engine (AsyncEngine): The engine the sessions write to.
+        """
+        self._engine = engine
+        if not event.contains(Session, 'after_flush', self._after_flush):
+            event.listen(Session, 'after_flush', self._after_flush)
+            event.listen(Session, 'after_commit', self._after_commit)
+            event.listen(Session, 'after_rollback', self._after_rollback)
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> None:
+        """
+        Register a callback receiving every ChangeEvent. Callbacks run on
+        the event loop and must not block.
+
+        Args:
+            callback (Callable[[ChangeEvent], None]): The subscriber.
+        """
+        self._subscribers.append(callback)
+
+    def _after_flush(self, session: Session, flush_context) -> None:
+        for objects in (session.new, session.dirty, session.deleted):
+            for obj in objects:
+                table = getattr(obj, '__tablename__', None)
+                if table in TRACKED_TABLES:
+                    record_changes(session, table, (obj.id,))
+
+    def _after_commit(self, session: Session) -> None:
+        changes = session.info.pop(_SESSION_CHANGES_KEY, None)
+        if not changes:
+            return
+        if not self.uses_notify:
+            self._deliver(changes)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning('Changes committed outside an event loop were '
+                           'not published: %s', changes)
+            return
+        task = loop.create_task(self.publish(changes))
+        self._publishing.add(task)
+        task.add_done_callback(self._publishing.discard)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_SESSION_CHANGES_KEY, None)
+
+    async def publish(
+            self,
+            changes: Mapping[str, Iterable[int] | None]
+    ) -> int:
+        """
+        Take a new bank version and announce the changes to this process
+        and (on PostgreSQL) to every listening process.
+
+        Args:
+            changes (Mapping[str, Iterable[int] | None]): Changed IDs by
+                table name; None for "any row".
+
+        Returns:
+            int: The new bank version.
+        """
+        if not self.uses_notify:
+            return self._deliver(changes)
+
+        ids = {
+            table: None if table_ids is None else sorted(table_ids)
+            for table, table_ids in changes.items()
+        }
+        try:
+            async with self._engine.connect() as connection:
+                version = await connection.scalar(
+                    select(bank_version_sequence.next_value()))
+                payload = self._payload(version, ids)
+                await connection.execute(
+                    select(func.pg_notify(CHANGE_CHANNEL, payload)))
+                await connection.commit()
+        except Exception:
+            logger.exception('Failed to publish bank changes %s', ids)
+            raise
+        return self._deliver(changes, version)
+
+    def _payload(self, version: int, ids: dict) -> str:
+        payload = json.dumps({
+            'origin': self.origin, 'version': version, 'changes': ids})
+        if len(payload.encode()) > MAX_PAYLOAD_SIZE:
+            payload = json.dumps({
+                'origin': self.origin,
+                'version': version,
+                'changes': dict.fromkeys(ids),
+            })
+        return payload
+
+    def _deliver(
+            self,
+            changes: Mapping[str, Iterable[int] | None],
+            version: int | None = None,
+            local: bool = True
+    ) -> int:
+        self.version = max(
+            self.version + 1 if version is None else version, self.version)
+        change_event = ChangeEvent(
+            version=self.version,
+            changes={
+                table: None if ids is None else frozenset(ids)
+                for table, ids in changes.items()
+            },
+            local=local,
+        )
+        for subscriber in self._subscribers:
+            try:
+                subscriber(change_event)
+            except Exception:
+                logger.exception('Bank change subscriber %r failed',
+                                 subscriber)
+        return self.version
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        message = json.loads(payload)
+        if message['origin'] == self.origin:
+            return
+        self._deliver(message['changes'], message['version'], local=False)
+
+    def shares_versions(self, session=None) -> bool:
+        """
+        Whether bank versions come from the database (PostgreSQL), so that
+        versions of different processes and runs can be compared. Otherwise
+        they count changes of this process only, starting at 0.
+
+        Args:
+            session: An optional session whose database is checked instead
+                of the installed engine's.
+
+        Returns:
+            bool: True on PostgreSQL.
+        """
+        bind = self._engine if session is None else session.bind
+        return bind is not None and bind.dialect.name == 'postgresql'
+
+    async def current_version(self, session=None) -> int:
+        """
+        Read the current bank version: the last value of the sequence on
+        PostgreSQL, the in-process counter otherwise.
+
+        Args:
+            session: An optional session to read the sequence with.
+
+        Returns:
+            int: The bank version.
+        """
+        if not self.shares_versions(session):
+            return self.version
+        bind = self._engine if session is None else session.bind
+        query = text(
+            'SELECT CASE WHEN is_called THEN last_value ELSE 0 END '
+            'FROM bank_version'
+        )
+        if session is not None:
+            return await session.scalar(query)
+        async with bind.connect() as connection:
+            return await connection.scalar(query)
+
+    async def start(self) -> None:
+        """
+        Load the current bank version and, on PostgreSQL, start listening
+        for changes committed by other processes.
+        """
+        if not self.uses_notify:
+            return
+        self._listening = True
+        await self._listen()
+
+    async def _listen(self) -> None:
+        self._listener = await self._engine.connect()
+        raw_connection = await self._listener.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        await driver_connection.add_listener(
+            CHANGE_CHANNEL, self._on_notification)
+        driver_connection.add_termination_listener(self._on_termination)
+        self.version = max(self.version, await self.current_version())
+
+    def _on_termination(self, connection) -> None:
+        if not self._listening:
+            return
+        logger.warning('Lost the bank change listener connection.')
+        task = asyncio.get_running_loop().create_task(self._reconnect())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _drop_listener(self) -> None:
+        # The connection carries the listener, so it must not go back to
+        # the pool.
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        try:
+            await listener.invalidate()
+            await listener.close()
+        except Exception:
+            logger.debug('Failed to close the listener connection.',
+                         exc_info=True)
+
+    async def _reconnect(self) -> None:
+        # Notifications sent while disconnected are lost, so once listening
+        # again every cached row has to be considered changed.
+        await self._drop_listener()
+        while self._listening:
+            await asyncio.sleep(RECONNECT_DELAY)
+            try:
+                await self._listen()
+            except Exception:
+                logger.exception('Failed to reconnect the bank change '
+                                 'listener.')
+                continue
+            self._deliver(
+                dict.fromkeys(TRACKED_TABLES), self.version, local=False)
+            return
+
+    async def flush(self) -> None:
+        """
+        Wait until the changes committed so far in this process are
+        published. Changes committed on PostgreSQL are published in the
+        background, so a process has to flush them before its event loop
+        closes, or they are lost. Failed publishes are already logged.
+        """
+        while self._publishing:
+            await asyncio.gather(*self._publishing, return_exceptions=True)
+
+    async def stop(self) -> None:
+        """
+        Publish the pending changes and stop listening for remote changes.
+        """
+        await self.flush()
+        self._listening = False
+        await self._drop_listener()
+
+
+#: The process-wide change bus.
+change_bus = ChangeBus()
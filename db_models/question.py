@@ -4,7 +4,7 @@ belonging to a specific topic. A question can have multiple answers
 and may include an image URL.
 """
 
-from sqlalchemy import Column,  String, Integer, ForeignKey, Date
+from sqlalchemy import Column, String, Integer, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 
 from db_models.base import Base
@@ -25,8 +25,18 @@ class Question(Base):
         update_date (date): The date the question was last updated.
         topic (Topic): A SQLAlchemy relationship to the Topic model.
         answers (list[Answer]): A list of answers for this question.
+
+    Indexes:
+        ix_questions_topic_id_text: Lookups by topic (random and by-topic
+            queries) and by (topic, text) in the parser.
+        ix_questions_text: Lookups by text alone in the parser.
     """
 
+    __table_args__ = (
+        Index('ix_questions_topic_id_text', 'topic_id', 'text'),
+        Index('ix_questions_text', 'text'),
+    )
+
     text = Column(String(MAX_NAME_LENGTH), nullable=False)
     image_url = Column(String, nullable=True)
     topic_id = Column(Integer, ForeignKey('topics.id'))
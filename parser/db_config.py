@@ -9,13 +9,36 @@ from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 import os
 
+from db_models.changes import change_bus
+
 
 load_dotenv()
 
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+#: Connection pool options, read from the same variables as the app.
+POOL_OPTIONS = {
+    'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+    'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+    'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', 30)),
+    'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+    'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true',
+}
+if DATABASE_URL.startswith('postgresql+asyncpg'):
+    POOL_OPTIONS['connect_args'] = {
+        'prepared_statement_cache_size': int(
+            os.getenv('DB_STATEMENT_CACHE_SIZE', 100)),
+    }
+
 #: An asynchronous SQLAlchemy engine configured for the parser.
-engine = create_async_engine(DATABASE_URL, echo=False)
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    **({} if DATABASE_URL.startswith('sqlite') else POOL_OPTIONS)
+)
+
+# Announce the scraped changes of the question bank to the app's workers
+change_bus.install(engine)
 
 #: A session factory for creating AsyncSession instances in the parser.
 AsyncSessionLocal = sessionmaker(
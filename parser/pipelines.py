@@ -6,12 +6,14 @@ in a strictly sequential order via an asyncio.Lock.
 
 import asyncio
 
+from scrapy.utils.defer import deferred_from_coro
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import SQLAlchemyError
 
 from .db_config import get_async_session
 from db_models import Category, Topic, Question, Answer
+from db_models.changes import change_bus
 from parser.items import AnswerItem, CategoryItem, QuestionItem, TopicItem
 
 
@@ -41,6 +43,21 @@ class DatabasePipeline:
         """
         return cls()
 
+    def close_spider(self, spider):
+        """
+        Called by Scrapy when the spider closes. Waits until the saved
+        changes are announced to the app's workers, which happens in the
+        background on PostgreSQL and would be lost once the event loop
+        stops.
+
+        Args:
+            spider (scrapy.Spider): The spider being closed.
+
+        Returns:
+            Deferred: Fires once the changes are published.
+        """
+        return deferred_from_coro(change_bus.flush())
+
     async def process_item(self, item, spider):
         """
         Main entry point for processing each item. Ensures